@@ -1,3 +1,12 @@
+from typing import List
+
+from django.conf import settings
+from django.contrib.admin.utils import quote, unquote
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied
+from django.http import Http404, JsonResponse
+from django.urls import path, reverse
+from django.utils import translation
+
 from . import widgets
 from .fields import (
     LocalizedBooleanField,
@@ -27,6 +36,11 @@ class LocalizedFieldsAdminMixin:
             "localized_fields/localized-fields-admin.js",
         )
 
+    # whether to only render the panes of the preferred languages in
+    # change forms and load the others when they're opened, see
+    # `get_localized_fields_languages`, not supported by inlines
+    localized_fields_deferred = False
+
     def __init__(self, *args, **kwargs):
         """Initializes a new instance of :see:LocalizedFieldsAdminMixin."""
 
@@ -34,3 +48,98 @@ class LocalizedFieldsAdminMixin:
         overrides = FORMFIELD_FOR_LOCALIZED_FIELDS_DEFAULTS.copy()
         overrides.update(self.formfield_overrides)
         self.formfield_overrides = overrides
+
+    def get_localized_fields_languages(self, request) -> List[str]:
+        """Gets the languages of which the panes are rendered right away when
+        `localized_fields_deferred` is enabled, the panes of the other
+        languages are loaded when they're opened.
+
+        The active language and the default language
+        by default.
+        """
+
+        return [translation.get_language(), settings.LANGUAGE_CODE]
+
+    def get_form(self, request, obj=None, *args, **kwargs):
+        form = super().get_form(request, obj, *args, **kwargs)
+
+        # new objects have no values to load
+        if self.localized_fields_deferred and obj:
+            self._defer_localized_fields(request, form, obj)
+
+        return form
+
+    def get_urls(self):
+        info = self.model._meta.app_label, self.model._meta.model_name
+
+        return [
+            path(
+                "<path:object_id>/localized-fields/<str:field_name>/",
+                self.admin_site.admin_view(self.localized_fields_view),
+                name="%s_%s_localized_fields" % info,
+            )
+        ] + super().get_urls()
+
+    def localized_fields_view(self, request, object_id: str, field_name: str):
+        """Gets the value of a :see:LocalizedField in the language specified
+        by the `language` query parameter, as JSON, for the panes that are
+        loaded on demand."""
+
+        obj = self.get_object(request, unquote(object_id))
+        if obj is None:
+            raise Http404
+
+        if not self.has_change_permission(request, obj):
+            raise PermissionDenied
+
+        # only fields that are on the form can be loaded
+        form = self.get_form(request, obj, change=True)
+        field = form.base_fields.get(field_name)
+        language = request.GET.get("language")
+
+        if not field or not getattr(field.widget, "can_defer", False):
+            raise Http404
+
+        if language not in dict(field.widget.language_table):
+            raise Http404
+
+        value = getattr(obj, field_name)
+        return JsonResponse(
+            dict(
+                language=language,
+                value=value.get(language) if value else None,
+            )
+        )
+
+    def _defer_localized_fields(self, request, form, obj) -> None:
+        """Configures the localized widgets of the specified form class to
+        load the panes of all but the preferred languages on demand."""
+
+        languages = self.get_localized_fields_languages(request)
+        opts = self.model._meta
+
+        for name, field in form.base_fields.items():
+            if not getattr(field.widget, "can_defer", False):
+                continue
+
+            try:
+                model_field = opts.get_field(name)
+            except FieldDoesNotExist:
+                continue
+
+            if not isinstance(model_field, LocalizedField):
+                continue
+
+            field.widget.defer(
+                [
+                    lang_code
+                    for lang_code, _ in field.widget.language_table
+                    if lang_code not in languages
+                ],
+                reverse(
+                    "%s:%s_%s_localized_fields"
+                    % (self.admin_site.name, opts.app_label, opts.model_name),
+                    args=(quote(obj.pk), name),
+                ),
+                model_field.value_from_object(obj),
+            )
@@ -0,0 +1,152 @@
+from typing import List, Optional
+
+from django.core.exceptions import FieldError
+from django.db.models import Aggregate
+
+from .fields import LocalizedField, LocalizedFieldStorage, LocalizedFloatField
+
+
+class LocalizedAggregate(Aggregate):
+    """Base class for aggregates over a :see:LocalizedIntegerField or
+    :see:LocalizedFloatField that aggregate every language separately, in a
+    single query.
+
+    The result is a localized value of the same type as
+    the field, with the aggregate of every language.
+    """
+
+    # the SQL that aggregates the value in a single language
+    value_template = "%(function)s(%(value)s)"
+
+    # the types that the languages of the fields that can be
+    # aggregated are cast to, see :see:LocalizedKeyTransform
+    db_types = ("integer", "double precision")
+
+    def __init__(self, expression, languages: Optional[List[str]] = None):
+        """Initializes a new instance of :see:LocalizedAggregate.
+
+        Arguments:
+            expression:
+                The name of the field to aggregate.
+
+            languages:
+                Optional list of languages to aggregate. All
+                languages of the field are aggregated when not
+                specified.
+        """
+
+        super().__init__(expression)
+        self.languages = languages
+
+    def resolve_expression(self, *args, **kwargs):
+        aggregate = super().resolve_expression(*args, **kwargs)
+
+        field = aggregate.get_source_expressions()[0].output_field
+        if (
+            not isinstance(field, LocalizedField)
+            or field.key_transform_class.db_type not in self.db_types
+        ):
+            raise FieldError(
+                "%s can only aggregate numeric localized fields, not %s"
+                % (self.__class__.__name__, field.__class__.__name__)
+            )
+
+        return aggregate
+
+    def as_sql(self, compiler, connection, **extra_context):
+        expression = self.get_source_expressions()[0]
+        field = expression.output_field
+
+        languages = [
+            language
+            for language in self.languages or field.language_codes
+            if language in field.language_codes
+        ]
+
+        # every language is aggregated separately, the materialized
+        # column is aggregated for languages that are materialized
+        values = []
+        for language in languages:
+            value_sql, value_params = compiler.compile(
+                field.get_key_transform(language, expression)
+            )
+            value_sql = self.value_template % dict(
+                function=self.function, value=value_sql
+            )
+            values.append((language, value_sql, list(value_params)))
+
+        if field.storage_type == LocalizedFieldStorage.JSONB:
+            sql = "jsonb_build_object(%s)" % ", ".join(
+                "%%s::text, %s" % value_sql for _, value_sql, _ in values
+            )
+            params = [
+                param
+                for language, _, value_params in values
+                for param in [language] + value_params
+            ]
+        else:
+            sql = "hstore(ARRAY[%s]::text[], ARRAY[%s]::text[])" % (
+                ", ".join(["%s"] * len(values)),
+                ", ".join(value_sql for _, value_sql, _ in values),
+            )
+            params = [language for language, _, _ in values] + [
+                param for _, _, value_params in values for param in value_params
+            ]
+
+        return sql, params
+
+    @property
+    def convert_value(self):
+        # the output field converts the value, expressions would
+        # otherwise convert a :see:LocalizedIntegerField into an int
+        return self._convert_value_noop
+
+    def _resolve_output_field(self):
+        return self.get_source_expressions()[0].output_field
+
+
+class LocalizedSum(LocalizedAggregate):
+    """Sums every language of a numeric localized field separately."""
+
+    function = "SUM"
+    name = "LocalizedSum"
+
+
+class LocalizedAvg(LocalizedAggregate):
+    """Averages every language of a numeric localized field separately.
+
+    The averages are always floats, also for
+    :see:LocalizedIntegerField's.
+    """
+
+    function = "AVG"
+    name = "LocalizedAvg"
+    value_template = "%(function)s(%(value)s)::double precision"
+
+    def _resolve_output_field(self):
+        field = super()._resolve_output_field()
+        if isinstance(field, LocalizedFloatField):
+            return field
+
+        return LocalizedFloatField(
+            languages=field.languages,
+            storage_type=field.storage_type,
+            required=False,
+            null=True,
+        )
+
+
+class LocalizedMin(LocalizedAggregate):
+    """Gets the minimum of every language of a numeric localized field
+    separately."""
+
+    function = "MIN"
+    name = "LocalizedMin"
+
+
+class LocalizedMax(LocalizedAggregate):
+    """Gets the maximum of every language of a numeric localized field
+    separately."""
+
+    function = "MAX"
+    name = "LocalizedMax"
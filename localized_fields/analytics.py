@@ -0,0 +1,180 @@
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from django.conf import settings
+from django.db import connections
+
+from .fields import LocalizedField, LocalizedFieldStorage
+
+
+class TranslationCoverage(NamedTuple):
+    """How many rows are missing a translation of a field in a language."""
+
+    model: type
+    field: LocalizedField
+    language: str
+
+    # the amount of rows that were scanned
+    rows: int
+
+    # the amount of rows without a value in the language
+    missing: int
+
+    # the amount of rows without a value in the language and all
+    # of its fallback languages, the rest falls back to another language
+    misses: int
+
+    @property
+    def fallbacks(self) -> int:
+        """Gets the amount of rows that fall back to another language."""
+
+        return self.missing - self.misses
+
+
+def get_translation_coverage(
+    queryset,
+    fields: Optional[Iterable[str]] = None,
+    languages: Optional[Iterable[str]] = None,
+) -> Iterator[TranslationCoverage]:
+    """Computes how many rows in the specified query set are missing a
+    translation and would fall back to another language, or would have no
+    value at all.
+
+    All fields and languages are counted in a single
+    aggregate query, so the table is scanned only once,
+    instead of loading every row.
+
+    A language is missing when the key is not defined, or
+    when its value is NULL or an empty string, which is
+    exactly when :see:LocalizedValue.translate would fall
+    back. The fallback languages are taken from the
+    LOCALIZED_FIELDS_FALLBACKS setting the same way.
+
+    Arguments:
+        queryset:
+            The query set to count the rows of, or
+            a model to count all rows of.
+
+        fields:
+            Optional names of the :see:LocalizedField's to
+            count. All localized fields of the model are
+            counted when not specified.
+
+        languages:
+            Optional list of languages to count. All
+            languages of the fields are counted when not
+            specified.
+
+    Returns:
+        A :see:TranslationCoverage for every field and
+        language, in the order of the fields and languages.
+    """
+
+    if not hasattr(queryset, "query"):
+        queryset = queryset._base_manager.all()
+
+    model = queryset.model
+    connection = connections[queryset.db]
+    quote_name = connection.ops.quote_name
+
+    if fields is None:
+        fields = [
+            field
+            for field in model._meta.local_concrete_fields
+            if isinstance(field, LocalizedField)
+        ]
+    else:
+        fields = [model._meta.get_field(name) for name in fields]
+
+    fallback_config = getattr(settings, "LOCALIZED_FIELDS_FALLBACKS", {})
+
+    counts = []
+    aggregates = ["count(*)"]
+    params = []
+
+    for field in fields:
+        column = quote_name(field.column)
+
+        for language in _get_languages(field, languages):
+            fallback_languages = [
+                lang_code
+                for lang_code in fallback_config.get(
+                    language, [settings.LANGUAGE_CODE]
+                )
+                if lang_code != language
+            ]
+
+            missing_sql, missing_params = _get_missing_sql(
+                field, column, [language]
+            )
+            misses_sql, misses_params = _get_missing_sql(
+                field, column, [language] + fallback_languages
+            )
+
+            aggregates.append("count(*) FILTER (WHERE %s)" % missing_sql)
+            aggregates.append("count(*) FILTER (WHERE %s)" % misses_sql)
+            params.extend(missing_params + misses_params)
+
+            counts.append((field, language))
+
+    if not counts:
+        return
+
+    # only select the columns that are counted, the rest
+    # of the query is kept as is, including filters and joins
+    inner_queryset = queryset.order_by().values_list(
+        *[field.name for field in fields]
+    )
+    inner_sql, inner_params = inner_queryset.query.get_compiler(
+        queryset.db
+    ).as_sql()
+
+    sql = "SELECT %s FROM (%s) AS localized_fields_coverage" % (
+        ", ".join(aggregates),
+        inner_sql,
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params + list(inner_params))
+        rows, *results = cursor.fetchone()
+
+    for index, (field, language) in enumerate(counts):
+        yield TranslationCoverage(
+            model=model,
+            field=field,
+            language=language,
+            rows=rows,
+            missing=results[index * 2],
+            misses=results[index * 2 + 1],
+        )
+
+
+def _get_languages(
+    field: LocalizedField, languages: Optional[Iterable[str]]
+) -> List[str]:
+    """Gets the languages of the specified field that should be counted."""
+
+    if languages is None:
+        return field.language_codes
+
+    return [
+        language for language in languages if language in field.language_codes
+    ]
+
+
+def _get_missing_sql(field: LocalizedField, column: str, languages: List[str]):
+    """Gets the SQL condition that is true when the specified column has no
+    value in any of the specified languages."""
+
+    if field.storage_type == LocalizedFieldStorage.JSONB:
+        present_sql = (
+            "coalesce(jsonb_exists(%s, %%s) AND %s->>%%s <> '', false)"
+        )
+    else:
+        present_sql = "coalesce(defined(%s, %%s) AND %s->%%s <> '', false)"
+
+    present_sql = present_sql % (column, column)
+
+    sql = " AND ".join("NOT %s" % present_sql for _ in languages)
+    params = [param for language in languages for param in (language, language)]
+
+    return sql, params
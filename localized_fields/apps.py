@@ -2,9 +2,12 @@ import inspect
 
 from django.apps import AppConfig
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.db.backends.signals import connection_created
 
-from . import lookups
+from . import forms, instrumentation, lookups, widgets
 from .fields import LocalizedField
+from .loaders import register_loaders
 from .lookups import LocalizedLookupMixin
 
 
@@ -12,6 +15,20 @@ class LocalizedFieldsConfig(AppConfig):
     name = "localized_fields"
 
     def ready(self):
+        connection_created.connect(
+            register_loaders, dispatch_uid="localized_fields_register_loaders"
+        )
+
+        instrumentation.configure_from_settings()
+        setting_changed.connect(
+            _reconfigure_instrumentation,
+            dispatch_uid="localized_fields_reconfigure_instrumentation",
+        )
+        setting_changed.connect(
+            _clear_prototypes,
+            dispatch_uid="localized_fields_clear_prototypes",
+        )
+
         if getattr(settings, "LOCALIZED_FIELDS_EXPERIMENTAL", True):
             for _, clazz in inspect.getmembers(lookups):
                 if not inspect.isclass(clazz) or clazz is LocalizedLookupMixin:
@@ -19,3 +36,14 @@ class LocalizedFieldsConfig(AppConfig):
 
                 if issubclass(clazz, LocalizedLookupMixin):
                     LocalizedField.register_lookup(clazz)
+
+
+def _reconfigure_instrumentation(setting, **kwargs):
+    if setting == "LOCALIZED_FIELDS_INSTRUMENTATION_SINK":
+        instrumentation.configure_from_settings()
+
+
+def _clear_prototypes(setting, **kwargs):
+    if setting == "LANGUAGES":
+        forms.clear_prototypes()
+        widgets.clear_prototypes()
@@ -0,0 +1,107 @@
+import logging
+
+from . import instrumentation
+
+logger = logging.getLogger(__name__)
+
+
+def get_activity(sink: instrumentation.CounterSink) -> dict:
+    """Summarizes the activity of localized fields that was collected in the
+    specified sink, see :see:instrumentation.collect.
+
+    Returns:
+        A dictionary with the totals and lists of
+        tuples ending with a count, sorted by the
+        count, the highest first.
+    """
+
+    return dict(
+        values_created=sink.get(instrumentation.VALUE_CREATED),
+        values_loaded=sink.get(instrumentation.VALUE_LOADED),
+        translations=sink.get(instrumentation.TRANSLATE_HIT)
+        + sink.get(instrumentation.TRANSLATE_FALLBACK)
+        + sink.get(instrumentation.TRANSLATE_MISS),
+        fallbacks=_group(
+            sink, instrumentation.TRANSLATE_FALLBACK, "language", "fallback"
+        ),
+        misses=_group(sink, instrumentation.TRANSLATE_MISS, "language"),
+        deferred_loads=_group(
+            sink, instrumentation.DESCRIPTOR_REFRESH, "field"
+        ),
+        slug_queries=_group(sink, instrumentation.SLUG_QUERY, "field"),
+        slug_retries=_group(sink, instrumentation.SLUG_RETRY, "model"),
+    )
+
+
+def format_activity(activity: dict) -> str:
+    """Formats the activity returned by :see:get_activity as a single line of
+    text."""
+
+    parts = [
+        "%d values loaded" % activity["values_loaded"],
+        "%d created" % activity["values_created"],
+        "%d fallbacks" % sum(count for *_, count in activity["fallbacks"]),
+        "%d misses" % sum(count for *_, count in activity["misses"]),
+        "%d deferred loads"
+        % sum(count for *_, count in activity["deferred_loads"]),
+        "%d slug queries"
+        % sum(count for *_, count in activity["slug_queries"]),
+    ]
+
+    # loading the same deferred field more than once during
+    # a single request usually means it's loaded in a loop
+    n_plus_one = [
+        "%s (%dx)" % (field, count)
+        for field, count in activity["deferred_loads"]
+        if count > 1
+    ]
+
+    if n_plus_one:
+        parts.append("possible N+1 on " + ", ".join(n_plus_one))
+
+    return ", ".join(parts)
+
+
+class LocalizedFieldsActivityMiddleware:
+    """Collects the activity of localized fields during every request and logs
+    a summary of it.
+
+    The summary, as returned by :see:get_activity, is
+    also stored as `request.localized_fields_activity`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with instrumentation.collect() as sink:
+            response = self.get_response(request)
+
+        activity = get_activity(sink)
+        request.localized_fields_activity = activity
+
+        logger.info(
+            "%s %s: %s", request.method, request.path, format_activity(activity)
+        )
+
+        return response
+
+
+def _group(sink: instrumentation.CounterSink, name: str, *tag_names):
+    """Groups the counts of the specified measurement by the values of the
+    specified tags."""
+
+    counts = {}
+    for (key_name, key_tags), count in sink.counters.items():
+        if key_name != name:
+            continue
+
+        tags = dict(key_tags)
+        key = tuple(tags.get(tag_name) for tag_name in tag_names)
+        counts[key] = counts.get(key, 0) + count
+
+    return sorted(
+        (key + (count,) for key, count in counts.items()),
+        key=lambda item: item[-1],
+        reverse=True,
+    )
@@ -1,6 +1,8 @@
 from django.conf import settings
 from django.utils import translation
 
+from . import instrumentation
+
 
 class LocalizedValueDescriptor:
     """The descriptor for the localized value attribute on the model instance.
@@ -41,6 +43,11 @@ class LocalizedValueDescriptor:
         if self.field.name in instance.__dict__:
             value = instance.__dict__[self.field.name]
         elif not instance._state.adding:
+            if instrumentation.enabled:
+                instrumentation.increment(
+                    instrumentation.DESCRIPTOR_REFRESH, field=str(self.field)
+                )
+
             instance.refresh_from_db(fields=[self.field.name])
             value = getattr(instance, self.field.name)
         else:
@@ -50,7 +57,9 @@ class LocalizedValueDescriptor:
             attr = self.field.attr_class()
             instance.__dict__[self.field.name] = attr
 
-        if isinstance(value, dict):
+        # values that are already of the right type are kept, instead of
+        # creating a new value on every access
+        if isinstance(value, dict) and type(value) is not self.field.attr_class:
             attr = self.field.attr_class(value)
             instance.__dict__[self.field.name] = attr
 
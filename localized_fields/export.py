@@ -0,0 +1,100 @@
+from itertools import islice
+from typing import Iterable, Optional
+
+from django.core.exceptions import FieldError
+
+
+def to_numpy(
+    queryset,
+    field_name: str,
+    languages: Optional[Iterable[str]] = None,
+    chunk_size: int = 2000,
+):
+    """Exports the values of a :see:LocalizedIntegerField or
+    :see:LocalizedFloatField into a NumPy array, with a row for every row in
+    the specified query set and a column for every language.
+
+    Every language is selected and cast in the database,
+    the same way as `field__lang`, so no localized values
+    are created. The rows are streamed using a server-side
+    cursor, in chunks, into a preallocated array.
+
+    Requires the `numpy` package.
+
+    Arguments:
+        queryset:
+            The query set to export the rows of, or
+            a model to export all rows of.
+
+        field_name:
+            The name of the field to export.
+
+        languages:
+            Optional list of languages to export, in the
+            order of the columns. All languages of the field
+            are exported when not specified.
+
+        chunk_size:
+            The amount of rows to fetch from the
+            cursor at once.
+
+    Returns:
+        A tuple of the array of values and an array of the
+        same shape that is True for the values that are
+        missing. Missing values are NaN for floats and 0
+        for integers.
+    """
+
+    import numpy
+
+    if not hasattr(queryset, "query"):
+        queryset = queryset._base_manager.all()
+
+    field = queryset.model._meta.get_field(field_name)
+
+    db_type = getattr(
+        getattr(field, "key_transform_class", None), "db_type", None
+    )
+    if db_type == "integer":
+        dtype, missing_value = numpy.int64, 0
+    elif db_type == "double precision":
+        dtype, missing_value = numpy.float64, numpy.nan
+    else:
+        raise FieldError(
+            "Only numeric localized fields can be exported, not %s"
+            % field.__class__.__name__
+        )
+
+    languages = list(languages or field.language_codes)
+
+    # the count is an estimate for preallocating the array, rows can
+    # be inserted or deleted before the rows are streamed
+    size = queryset.count()
+    values = numpy.empty((size, len(languages)), dtype=dtype)
+    missing = numpy.empty((size, len(languages)), dtype=bool)
+
+    rows = queryset.values_list(
+        *["%s__%s" % (field_name, language) for language in languages]
+    ).iterator(chunk_size=chunk_size)
+
+    index = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+
+        end = index + len(chunk)
+        if end > len(values):
+            size = max(end, size * 2)
+            values = numpy.resize(values, (size, len(languages)))
+            missing = numpy.resize(missing, (size, len(languages)))
+
+        chunk = numpy.array(chunk, dtype=object).reshape(-1, len(languages))
+        chunk_missing = numpy.equal(chunk, None)
+        chunk[chunk_missing] = missing_value
+
+        values[index:end] = chunk
+        missing[index:end] = chunk_missing
+        index = end
+
+    return values[:index], missing[:index]
@@ -1,7 +1,32 @@
 from django.conf import settings
+from django.db.models.expressions import Col, Func
 from django.utils import translation
 from psqlextra import expressions
 
+from .fields import LocalizedFieldStorage
+from .util import get_language_collation
+
+
+class LocalizedColumn(expressions.HStoreColumn):
+    """Expression that selects a single language from a localized field as
+    text, regardless of how the field is stored."""
+
+    def as_sql(self, compiler, connection):
+        """Compiles this expression into SQL."""
+
+        if (
+            getattr(self.target, "storage_type", None)
+            != LocalizedFieldStorage.JSONB
+        ):
+            return super().as_sql(compiler, connection)
+
+        qn = compiler.quote_name_unless_alias
+        return (
+            "%s.%s->>'%s'"
+            % (qn(self.alias), qn(self.target.column), self.hstore_key),
+            [],
+        )
+
 
 class LocalizedRef(expressions.HStoreRef):
     """Expression that selects the value in a field only in the currently
@@ -22,3 +47,56 @@ class LocalizedRef(expressions.HStoreRef):
 
         language = lang or translation.get_language() or settings.LANGUAGE_CODE
         super().__init__(name, language)
+
+    def resolve_expression(self, *args, **kwargs):
+        """Resolves the expression into a :see:LocalizedColumn expression, or
+        the materialized column of the language if there is one."""
+
+        expression = super().resolve_expression(*args, **kwargs)
+        if expression.hstore_key in getattr(
+            expression.target, "materialize", []
+        ):
+            return Col(
+                expression.alias,
+                expression.target.get_materialized_field(expression.hstore_key),
+            )
+
+        return LocalizedColumn(
+            expression.alias, expression.target, expression.hstore_key
+        )
+
+
+class LocalizedCollate(Func):
+    """Applies a collation to an expression."""
+
+    template = "(%(expressions)s) COLLATE %(collation)s"
+
+    def __init__(self, expression, collation: str):
+        super().__init__(expression)
+        self.collation = collation
+
+    def as_sql(self, compiler, connection, **extra_context):
+        extra_context["collation"] = connection.ops.quote_name(self.collation)
+        return super().as_sql(compiler, connection, **extra_context)
+
+
+class LocalizedOrderBy(LocalizedRef):
+    """Expression to order by the value in a field in the currently active
+    language, using the collation configured for that language in
+    settings.LOCALIZED_FIELDS_COLLATIONS.
+
+    See :see:LocalizedCollatedIndex for an index
+    that can be used for this ordering.
+    """
+
+    def resolve_expression(self, *args, **kwargs):
+        """Resolves the expression into a :see:LocalizedRef expression,
+        collated if there's a collation for the language."""
+
+        expression = super().resolve_expression(*args, **kwargs)
+
+        collation = get_language_collation(self.key)
+        if not collation:
+            return expression
+
+        return LocalizedCollate(expression, collation)
@@ -1,15 +1,17 @@
 from .autoslug_field import LocalizedAutoSlugField
 from .boolean_field import LocalizedBooleanField
 from .char_field import LocalizedCharField
-from .field import LocalizedField
+from .field import LocalizedField, LocalizedFieldStorage
 from .file_field import LocalizedFileField
 from .float_field import LocalizedFloatField
 from .integer_field import LocalizedIntegerField
+from .materialized_field import LocalizedMaterializedField
 from .text_field import LocalizedTextField
 from .uniqueslug_field import LocalizedUniqueSlugField
 
 __all__ = [
     "LocalizedField",
+    "LocalizedFieldStorage",
     "LocalizedAutoSlugField",
     "LocalizedUniqueSlugField",
     "LocalizedCharField",
@@ -18,6 +20,7 @@ __all__ = [
     "LocalizedIntegerField",
     "LocalizedFloatField",
     "LocalizedBooleanField",
+    "LocalizedMaterializedField",
 ]
 
 try:
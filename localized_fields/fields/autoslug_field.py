@@ -4,12 +4,11 @@ from datetime import datetime
 from typing import Callable, Tuple, Union
 
 from django import forms
-from django.conf import settings
 from django.utils import translation
 from django.utils.text import slugify
 
+from .. import instrumentation
 from ..util import resolve_object_property
-from ..value import LocalizedValue
 from .field import LocalizedField
 
 
@@ -68,7 +67,7 @@ class LocalizedAutoSlugField(LocalizedField):
                 to the database or an update.
         """
 
-        slugs = LocalizedValue()
+        slugs = self.attr_class()
 
         for lang_code, value in self._get_populate_values(instance):
             if not value:
@@ -82,6 +81,11 @@ class LocalizedAutoSlugField(LocalizedField):
 
                 unique_filter = {"%s__%s" % (self.name, language): slug}
 
+                if instrumentation.enabled:
+                    instrumentation.increment(
+                        instrumentation.SLUG_QUERY, field=str(self)
+                    )
+
                 return (
                     not type(instance).objects.filter(**unique_filter).exists()
                 )
@@ -142,7 +146,7 @@ class LocalizedAutoSlugField(LocalizedField):
                     instance, self.populate_from, lang_code
                 ),
             )
-            for lang_code, _ in settings.LANGUAGES
+            for lang_code in self.language_codes
         ]
 
     @staticmethod
@@ -1,7 +1,7 @@
+import contextlib
 import html
 
-from django.conf import settings
-
+from .. import instrumentation
 from .field import LocalizedField
 
 
@@ -56,15 +56,21 @@ class LocalizedBleachField(LocalizedField):
         if not localized_value:
             return None
 
-        for lang_code, _ in settings.LANGUAGES:
+        for lang_code in self.language_codes:
             value = localized_value.get(lang_code)
             if not value:
                 continue
 
-            cleaned_value = bleach.clean(
-                value if self.escape else html.unescape(value),
-                **get_bleach_default_options()
+            value = value if self.escape else html.unescape(value)
+            timer = (
+                instrumentation.timer(instrumentation.BLEACH, field=str(self))
+                if instrumentation.enabled
+                else contextlib.nullcontext()
             )
+            with timer:
+                cleaned_value = bleach.clean(
+                    value, **get_bleach_default_options()
+                )
 
             localized_value.set(
                 lang_code,
@@ -1,21 +1,85 @@
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
-from django.conf import settings
 from django.db.utils import IntegrityError
 
 from ..forms import LocalizedBooleanFieldForm
 from ..value import LocalizedBooleanValue, LocalizedValue
-from .field import LocalizedField
+from .field import LocalizedField, LocalizedFieldStorage, LocalizedKeyTransform
+
+
+class LocalizedBooleanFieldKeyTransform(LocalizedKeyTransform):
+    """Transform that selects a single key from a hstore value and casts it to
+    a boolean."""
+
+    db_type = "boolean"
 
 
 class LocalizedBooleanField(LocalizedField):
     """Stores booleans as a localized value."""
 
     attr_class = LocalizedBooleanValue
+    key_transform_class = LocalizedBooleanFieldKeyTransform
+    jsonb_value_sql = (
+        "CASE WHEN lower(%(value)s) IN ('true', 'false') "
+        "THEN to_jsonb(lower(%(value)s)::boolean) END"
+    )
+    materialized_db_type = "boolean"
+    materialized_value_sql = (
+        "CASE WHEN lower(%(value)s) IN ('true', 'false') "
+        "THEN lower(%(value)s)::boolean END"
+    )
+
+    def __init__(
+        self, *args, partial_indexes: Optional[List[str]] = None, **kwargs
+    ):
+        """Initializes a new instance of :see:LocalizedBooleanField.
+
+        Arguments:
+            partial_indexes:
+                Languages to create a partial index for, on
+                the rows that are true in the language, see
+                :see:LocalizedBooleanIndex.
+        """
+
+        super().__init__(*args, **kwargs)
+
+        self.partial_indexes = list(partial_indexes or [])
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+
+        if self.partial_indexes:
+            kwargs["partial_indexes"] = list(self.partial_indexes)
+
+        return name, path, args, kwargs
+
+    def contribute_to_class(self, model, name, **kwargs):
+        super().contribute_to_class(model, name, **kwargs)
+
+        from ..indexes import LocalizedBooleanIndex
+
+        # the indexes are already there when the model is constructed
+        # from a migration state or inherits from an abstract model
+        indexed_languages = [
+            index.language
+            for index in model._meta.indexes
+            if isinstance(index, LocalizedBooleanIndex)
+            and list(index.fields) == [name]
+        ]
+
+        for lang_code in self.partial_indexes:
+            if lang_code in indexed_languages:
+                continue
+
+            model._meta.indexes.append(
+                LocalizedBooleanIndex(fields=[name], language=lang_code)
+            )
 
-    @classmethod
-    def from_db_value(cls, value, *_) -> Optional[LocalizedBooleanValue]:
-        db_value = super().from_db_value(value)
+            # migrations only pick up the indexes declared in Meta
+            model._meta.original_attrs["indexes"] = model._meta.indexes
+
+    def from_db_value(self, value, *args) -> Optional[LocalizedBooleanValue]:
+        db_value = super().from_db_value(value, *args)
 
         if db_value is None:
             return db_value
@@ -28,7 +92,11 @@ class LocalizedBooleanField(LocalizedField):
         if not isinstance(db_value, LocalizedValue):
             return db_value
 
-        return cls._convert_localized_value(db_value)
+        # values stored as JSONB are already of the right type
+        if self.storage_type == LocalizedFieldStorage.JSONB:
+            return db_value
+
+        return self._convert_localized_value(db_value)
 
     def to_python(
         self, value: Union[Dict[str, str], str, None]
@@ -38,41 +106,36 @@ class LocalizedBooleanField(LocalizedField):
         db_value = super().to_python(value)
         return self._convert_localized_value(db_value)
 
-    def get_prep_value(self, value: LocalizedBooleanValue) -> dict:
+    def _get_prep_value(
+        self,
+        value: LocalizedBooleanValue,
+        default_values: LocalizedBooleanValue,
+    ) -> Optional[dict]:
         """Gets the value in a format to store into the database."""
 
-        # apply default values
-        default_values = LocalizedBooleanValue(self.default)
         if isinstance(value, LocalizedBooleanValue):
-            for lang_code, _ in settings.LANGUAGES:
-                local_value = value.get(lang_code)
-                if local_value is None:
-                    value.set(lang_code, default_values.get(lang_code, None))
+            self._apply_default_values(value, default_values)
 
-        prepped_value = super().get_prep_value(value)
-        if prepped_value is None:
-            return None
+        return super()._get_prep_value(value, default_values)
 
-        # make sure all values are proper values to be converted to bool
-        for lang_code, _ in settings.LANGUAGES:
-            local_value = prepped_value[lang_code]
-
-            if local_value is not None and local_value.lower() not in (
-                "false",
-                "true",
-            ):
-                raise IntegrityError(
-                    'non-boolean value in column "%s.%s" violates '
-                    "boolean constraint" % (self.name, lang_code)
-                )
+    def _prep_local_value(self, lang_code: str, value):
+        """Makes sure the value can be converted to a boolean."""
 
-            # convert to a string before saving because the underlying
-            # type is hstore, which only accept strings
-            prepped_value[lang_code] = (
-                str(local_value) if local_value is not None else None
+        if value is None:
+            return None
+
+        value = str(value)
+        if value.lower() not in ("false", "true"):
+            raise IntegrityError(
+                'non-boolean value in column "%s.%s" violates '
+                "boolean constraint" % (self.name, lang_code)
             )
 
-        return prepped_value
+        # hstore only accepts strings, JSONB can store the boolean as-is
+        if self.storage_type == LocalizedFieldStorage.JSONB:
+            return value.lower() == "true"
+
+        return value
 
     def formfield(self, **kwargs):
         """Gets the form field associated with this field."""
@@ -81,17 +144,19 @@ class LocalizedBooleanField(LocalizedField):
         defaults.update(kwargs)
         return super().formfield(**defaults)
 
-    @staticmethod
     def _convert_localized_value(
-        value: LocalizedValue,
+        self, value: LocalizedValue
     ) -> LocalizedBooleanValue:
         """Converts from :see:LocalizedValue to :see:LocalizedBooleanValue."""
 
         integer_values = {}
-        for lang_code, _ in settings.LANGUAGES:
+        for lang_code in self.language_codes:
             local_value = value.get(lang_code, None)
 
-            if isinstance(local_value, str):
+            # values can already be parsed, see :see:LocalizedBooleanValue
+            if isinstance(local_value, bool):
+                integer_values[lang_code] = local_value
+            elif isinstance(local_value, str):
                 if local_value.lower() == "false":
                     local_value = False
                 elif local_value.lower() == "true":
@@ -107,4 +172,5 @@ class LocalizedBooleanField(LocalizedField):
                     f"Expected value of type str instead of {type(local_value)}."
                 )
 
-        return LocalizedBooleanValue(integer_values)
+        # the value was already created, it's not counted again
+        return self.attr_class.from_db(integer_values)
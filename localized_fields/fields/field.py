@@ -1,21 +1,61 @@
 import json
 
-from typing import List, Optional, Union
+from enum import Enum
+from typing import List, Optional, Tuple, Union
 
 from django.conf import settings
+from django.contrib.postgres.fields.hstore import (
+    KeyTransform,
+    KeyTransformFactory,
+)
+from django.contrib.postgres.indexes import GinIndex
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.expressions import Col, Expression
 from django.db.utils import IntegrityError
+from psqlextra.expressions import HStoreColumn
 from psqlextra.fields import HStoreField
 
+from .. import instrumentation
 from ..descriptor import LocalizedValueDescriptor
 from ..forms import LocalizedFieldForm
+from ..util import get_language_codes, get_language_table, get_primary_language
 from ..value import LocalizedValue
+from .materialized_field import LocalizedMaterializedField
+
+
+class LocalizedFieldStorage(str, Enum):
+    """The PostgreSQL data types a :see:LocalizedField can be stored as."""
+
+    HSTORE = "hstore"
+    JSONB = "jsonb"
+
+
+class LocalizedKeyTransform(KeyTransform):
+    """Transform that selects a single language from a localized field,
+    regardless of how the field is stored, and casts it to :see:db_type."""
+
+    # the PostgreSQL data type of the selected value
+    db_type = "text"
+
+    def as_sql(self, compiler, connection):
+        field = self.lhs.output_field
+        if getattr(field, "storage_type", None) != LocalizedFieldStorage.JSONB:
+            sql, params = super().as_sql(compiler, connection)
+        else:
+            lhs, params = compiler.compile(self.lhs)
+            sql, params = "(%s ->> %%s)" % lhs, tuple(params) + (self.key_name,)
+
+        if self.db_type != "text":
+            sql = "%s::%s" % (sql, self.db_type)
+
+        return sql, params
 
 
 class LocalizedField(HStoreField):
     """A field that has the same value in multiple languages.
 
     Internally this is stored as a :see:HStoreField where there is a key
-    for every language.
+    for every language. Optionally, it can be stored as JSONB instead.
     """
 
     Meta = None
@@ -27,21 +67,105 @@ class LocalizedField(HStoreField):
     # The descriptor to use for accessing the attribute off of the class.
     descriptor_class = LocalizedValueDescriptor
 
+    # SQL expression that converts a single hstore value into
+    # a JSONB value, used when changing the storage of a field.
+    jsonb_value_sql = "to_jsonb(%(value)s)"
+
+    # The data type and SQL expression of the columns that are
+    # generated for the languages listed in `materialize`, the
+    # expression converts a single language from text.
+    materialized_db_type = "text"
+    materialized_value_sql = "%(value)s"
+
+    # The transform that selects a single language.
+    key_transform_class = LocalizedKeyTransform
+
     def __init__(
         self,
         *args,
         required: Optional[Union[bool, List[str]]] = None,
         blank: bool = False,
+        sparse: bool = False,
+        languages: Optional[List[str]] = None,
+        storage_type: Union[
+            LocalizedFieldStorage, str
+        ] = LocalizedFieldStorage.HSTORE,
+        materialize: Optional[List[str]] = None,
+        gin_index: bool = False,
         **kwargs
     ):
-        """Initializes a new instance of :see:LocalizedField."""
+        """Initializes a new instance of :see:LocalizedField.
+
+        Arguments:
+            required:
+                The languages that must have a value. True
+                for all languages, False or an empty list
+                for none.
+
+            sparse:
+                Omit languages that have no value (None or
+                an empty string) when storing. Missing
+                languages are read back as the default value.
+                Required languages are always stored.
+
+            languages:
+                Restricts this field to a subset of the languages
+                in settings.LANGUAGES. Only these languages are
+                stored, validated and edited.
+
+            storage_type:
+                The PostgreSQL data type to store the field
+                as. Either "hstore" (the default) or "jsonb".
+                JSONB keeps numbers and booleans as native
+                values instead of strings.
+
+            materialize:
+                Languages to store in a separate column that
+                PostgreSQL generates from this field. Lookups
+                and ordering on these languages use the plain
+                column instead of the hstore/JSONB value.
+
+            gin_index:
+                Adds a GIN index on this field to the model,
+                which is used by the `has_language`,
+                `has_all_languages`, `has_any_language` and
+                `contains_translations` lookups.
+        """
+
+        try:
+            self.storage_type = LocalizedFieldStorage(storage_type)
+        except ValueError:
+            raise ImproperlyConfigured(
+                "'%s' is not a valid storage type for a localized field, use one of: %s"
+                % (
+                    storage_type,
+                    ", ".join(item.value for item in LocalizedFieldStorage),
+                )
+            )
+
+        self.sparse = sparse
+        self.languages = tuple(languages) if languages is not None else None
+
+        if self.languages is not None:
+            self._language_table = get_language_table(self.languages)
+            self.attr_class = self.attr_class.with_languages(self.languages)
+
+        self.gin_index = gin_index
+
+        self.materialize = list(materialize or [])
+        for lang_code in self.materialize:
+            if lang_code not in self.language_codes:
+                raise ImproperlyConfigured(
+                    "Cannot materialize '%s', it is not one of the languages of this field"
+                    % lang_code
+                )
 
         if (required is None and blank) or required is False:
             self.required = []
         elif required is None and not blank:
-            self.required = [settings.LANGUAGE_CODE]
+            self.required = [get_primary_language(self.languages)]
         elif required is True:
-            self.required = [lang_code for lang_code, _ in settings.LANGUAGES]
+            self.required = self.language_codes
         else:
             self.required = required
 
@@ -49,6 +173,147 @@ class LocalizedField(HStoreField):
             *args, required=self.required, blank=blank, **kwargs
         )
 
+    def deconstruct(self):
+        """Deconstructs the field into something the database can store."""
+
+        name, path, args, kwargs = super(LocalizedField, self).deconstruct()
+
+        if self.sparse:
+            kwargs["sparse"] = self.sparse
+
+        if self.languages is not None:
+            kwargs["languages"] = list(self.languages)
+
+        if self.storage_type != LocalizedFieldStorage.HSTORE:
+            kwargs["storage_type"] = self.storage_type.value
+
+        if self.materialize:
+            kwargs["materialize"] = self.materialize
+
+        if self.gin_index:
+            kwargs["gin_index"] = self.gin_index
+
+        return name, path, args, kwargs
+
+    def db_type(self, connection):
+        """Gets the PostgreSQL data type this field is stored as."""
+
+        if self.storage_type == LocalizedFieldStorage.JSONB:
+            return "jsonb"
+
+        return super().db_type(connection)
+
+    def get_transform(self, name):
+        """Gets the transformation to apply for the specified name.
+
+        Selecting a single language is done using a
+        :see:LocalizedKeyTransform so that it works for
+        all types of storage.
+        """
+
+        transform = super().get_transform(name)
+        if not isinstance(transform, KeyTransformFactory):
+            return transform
+
+        def _transform(*args, **kwargs):
+            return self.get_key_transform(name, *args, **kwargs)
+
+        return _transform
+
+    def get_key_transform(self, language: str, lhs, *args, **kwargs):
+        """Gets an expression that selects the specified language from the
+        specified expression.
+
+        If the language is materialized and the expression
+        refers to this field, the materialized column is
+        selected instead.
+        """
+
+        if (
+            language in self.materialize
+            and isinstance(lhs, Col)
+            and lhs.target is self
+        ):
+            return Col(lhs.alias, self.get_materialized_field(language))
+
+        return self.key_transform_class(language, lhs, *args, **kwargs)
+
+    def get_materialized_field(self, language: str):
+        """Gets the field that materializes the specified language."""
+
+        return self.model._meta.get_field(self.get_materialized_name(language))
+
+    def get_materialized_name(self, language: str) -> str:
+        """Gets the name of the field that materializes the specified
+        language."""
+
+        return "%s_%s" % (self.name, language.lower().replace("-", "_"))
+
+    def get_materialized_value_sql(self, language: str, connection) -> str:
+        """Gets the SQL expression that generates the materialized column
+        for the specified language."""
+
+        operator = (
+            "->>" if self.storage_type == LocalizedFieldStorage.JSONB else "->"
+        )
+        value_sql = "(%s %s '%s')" % (
+            connection.ops.quote_name(self.column),
+            operator,
+            language.replace("'", "''"),
+        )
+
+        return self.materialized_value_sql % dict(value=value_sql)
+
+    def get_any_language_sql(self, column_sql: str) -> str:
+        """Gets the SQL expression that concatenates the values of all
+        languages of the specified column into a single text.
+
+        The expression is immutable, so that it can be
+        indexed, see :see:AnyLanguageTrigramIndex.
+        """
+
+        operator = (
+            "->>" if self.storage_type == LocalizedFieldStorage.JSONB else "->"
+        )
+
+        return "(%s)" % " || ' ' || ".join(
+            "coalesce(%s %s '%s', '')"
+            % (column_sql, operator, lang_code.replace("'", "''"))
+            for lang_code in self.language_codes
+        )
+
+    @property
+    def language_codes(self) -> List[str]:
+        """Gets the codes of all the languages this field stores."""
+
+        if self.languages is not None:
+            return list(self.languages)
+
+        return get_language_codes()
+
+    @property
+    def language_table(self) -> List[Tuple[str, str]]:
+        """Gets (lang_code, lang_name) tuples for all the languages this field
+        stores."""
+
+        if self.languages is not None:
+            return self._language_table
+
+        return get_language_table()
+
+    def resolve_language(self, language: Optional[str]) -> str:
+        """Gets the language to use for this field when the specified language
+        is requested.
+
+        Falls back to the primary language if the
+        language is not stored by this field.
+        """
+
+        if language and (self.languages is None or language in self.languages):
+            return language
+
+        return get_primary_language(self.languages)
+
     def contribute_to_class(self, model, name, **kwargs):
         """Adds this field to the specifed model.
 
@@ -62,8 +327,26 @@ class LocalizedField(HStoreField):
         super(LocalizedField, self).contribute_to_class(model, name, **kwargs)
         setattr(model, self.name, self.descriptor_class(self))
 
-    @classmethod
-    def from_db_value(cls, value, *_) -> Optional[LocalizedValue]:
+        for lang_code in self.materialize:
+            model.add_to_class(
+                self.get_materialized_name(lang_code),
+                LocalizedMaterializedField(source=name, language=lang_code),
+            )
+
+        # the index is already there when the model is constructed
+        # from a migration state or inherits from an abstract model
+        if self.gin_index and not any(
+            isinstance(index, GinIndex) and list(index.fields) == [name]
+            for index in model._meta.indexes
+        ):
+            model._meta.indexes.append(GinIndex(fields=[name]))
+
+            # migrations only pick up the indexes declared in Meta
+            model._meta.original_attrs["indexes"] = model._meta.indexes
+
+    def from_db_value(
+        self, value, expression=None, *_
+    ) -> Optional[LocalizedValue]:
         """Turns the specified database value into its Python equivalent.
 
         Arguments:
@@ -71,16 +354,28 @@ class LocalizedField(HStoreField):
                 The value that is stored in the database and
                 needs to be converted to its Python equivalent.
 
+            expression:
+                The expression that selected the value.
+
         Returns:
             A :see:LocalizedValue instance containing the
             data extracted from the database.
         """
 
+        # JSONB documents are passed to us undecoded, unless
+        # a single key was selected, then it is already text
+        if (
+            self.storage_type == LocalizedFieldStorage.JSONB
+            and isinstance(value, str)
+            and not isinstance(expression, HStoreColumn)
+        ):
+            value = json.loads(value)
+
         if not value:
             if getattr(settings, "LOCALIZED_FIELDS_EXPERIMENTAL", True):
                 return None
             else:
-                return cls.attr_class()
+                return self.attr_class()
 
         # we can get a list if an aggregation expression was used..
         # if we the expression was flattened when only one key was selected
@@ -92,7 +387,7 @@ class LocalizedField(HStoreField):
                     if inner_val is None:
                         result.append(None)
                     else:
-                        result.append(cls.attr_class(inner_val))
+                        result.append(self._load_value(inner_val))
                 else:
                     result.append(inner_val)
 
@@ -104,7 +399,18 @@ class LocalizedField(HStoreField):
         if not isinstance(value, dict):
             return value
 
-        return cls.attr_class(value)
+        return self._load_value(value)
+
+    def _load_value(self, value: dict) -> LocalizedValue:
+        """Creates the value of this field from a dictionary that was loaded
+        from the database, counted as a single loaded value."""
+
+        if instrumentation.enabled:
+            instrumentation.increment(
+                instrumentation.VALUE_LOADED, field=str(self)
+            )
+
+        return self.attr_class.from_db(value)
 
     def to_python(self, value: Union[dict, str, None]) -> LocalizedValue:
         """Turns the specified database value into its Python equivalent.
@@ -150,8 +456,16 @@ class LocalizedField(HStoreField):
             extracted from the specified value.
         """
 
+        return self._get_prep_value(value, self._get_default_values())
+
+    def _get_prep_value(
+        self, value: LocalizedValue, default_values: LocalizedValue
+    ) -> Optional[dict]:
+        """Turns the specified value into something the database can store,
+        using the specified resolved default values."""
+
         if isinstance(value, dict):
-            value = LocalizedValue(value)
+            value = LocalizedValue.with_languages(self.languages)(value)
 
         # default to None if this is an unknown type
         if not isinstance(value, LocalizedValue) and value:
@@ -163,9 +477,105 @@ class LocalizedField(HStoreField):
         else:
             cleaned_value = value
 
-        return super(LocalizedField, self).get_prep_value(
-            cleaned_value.__dict__ if cleaned_value else None
-        )
+        if not cleaned_value:
+            return None
+
+        # a single pass that validates and converts every language
+        prep_local_value = self._prep_local_value
+        return {
+            str(lang_code): prep_local_value(lang_code, lang_value)
+            for lang_code, lang_value in cleaned_value.__dict__.items()
+        }
+
+    def _prep_local_value(self, lang_code: str, value):
+        """Turns the value in a single language into something the database
+        can store.
+
+        Raises:
+            IntegrityError:
+                When the value is not valid for this field.
+        """
+
+        if value is None or isinstance(value, Expression):
+            return value
+
+        return str(value)
+
+    def _get_default_values(self) -> LocalizedValue:
+        """Gets the default value of every language.
+
+        The default values are resolved once and
+        re-used, unless the default is callable.
+        """
+
+        default = self.default if self.has_default() else None
+        if callable(default):
+            return self.attr_class(default)
+
+        cached = self.__dict__.get("_default_values")
+        if cached is not None and cached[0] is default:
+            return cached[1]
+
+        default_values = self.attr_class(default)
+        self._default_values = (default, default_values)
+
+        return default_values
+
+    def _apply_default_values(
+        self, value: LocalizedValue, default_values: LocalizedValue
+    ) -> None:
+        """Sets the default value on all languages that have no value."""
+
+        for lang_code in self.language_codes:
+            if value.get(lang_code) is None:
+                value.set(lang_code, default_values.get(lang_code, None))
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        """Gets the value in a format to send to the database.
+
+        For sparse fields, languages without a value are dropped
+        after all the other preparation has been done, so that
+        sub classes can keep relying on every language being
+        present in :see:get_prep_value.
+        """
+
+        value = super().get_db_prep_value(value, connection, prepared)
+        if not isinstance(value, dict):
+            return value
+
+        if self.sparse:
+            value = self._compact(value)
+
+        # JSON null is not the same as SQL NULL, drop the keys so
+        # that the NOT NULL constraints on required languages work
+        if self.storage_type == LocalizedFieldStorage.JSONB:
+            return json.dumps(
+                {
+                    lang_code: lang_value
+                    for lang_code, lang_value in value.items()
+                    if lang_value is not None
+                }
+            )
+
+        return value
+
+    def _compact(self, value: dict) -> dict:
+        """Drops all languages without a value that are not required.
+
+        Arguments:
+            value:
+                The prepared dictionary to compact.
+
+        Returns:
+            A new dictionary without the empty languages.
+        """
+
+        return {
+            lang_code: lang_value
+            for lang_code, lang_value in value.items()
+            if lang_code in self.required
+            or (lang_value is not None and lang_value != "")
+        }
 
     def clean(self, value, *_):
         """Cleans the specified value into something we can store in the
@@ -188,7 +598,7 @@ class LocalizedField(HStoreField):
 
         # are any of the language fiels None/empty?
         is_all_null = True
-        for lang_code, _ in settings.LANGUAGES:
+        for lang_code in self.language_codes:
             if value.get(lang_code) is not None:
                 is_all_null = False
                 break
@@ -215,8 +625,10 @@ class LocalizedField(HStoreField):
         if self.null:
             return
 
+        primary_language = get_primary_language(self.languages)
+
         for lang in self.required:
-            lang_val = getattr(value, settings.LANGUAGE_CODE)
+            lang_val = getattr(value, primary_language)
 
             if lang_val is None:
                 raise IntegrityError(
@@ -232,4 +644,11 @@ class LocalizedField(HStoreField):
             required=False if self.blank else self.required,
         )
         defaults.update(kwargs)
+
+        # only our own forms know how to deal with a subset of languages
+        if self.languages is not None and issubclass(
+            defaults["form_class"], LocalizedFieldForm
+        ):
+            defaults["languages"] = self.languages
+
         return super().formfield(**defaults)
@@ -1,3 +1,4 @@
+import contextlib
 import datetime
 import json
 import posixpath
@@ -11,6 +12,7 @@ from localized_fields.fields import LocalizedField
 from localized_fields.fields.field import LocalizedValueDescriptor
 from localized_fields.value import LocalizedValue
 
+from .. import instrumentation
 from ..forms import LocalizedFileFieldForm
 from ..value import LocalizedFileValue
 
@@ -54,7 +56,7 @@ class LocalizedFieldFile(FieldFile):
 class LocalizedFileValueDescriptor(LocalizedValueDescriptor):
     def __get__(self, instance, cls=None):
         value = super().__get__(instance, cls)
-        for lang, file in value.__dict__.items():
+        for lang, file in list(value.items()):
             if isinstance(file, str) or file is None:
                 file = self.field.value_class(instance, self.field, file, lang)
                 value.set(lang, file)
@@ -108,7 +110,7 @@ class LocalizedFileField(LocalizedField):
             kwargs["storage"] = self.storage
         return name, path, args, kwargs
 
-    def get_prep_value(self, value):
+    def _get_prep_value(self, value, default_values):
         """Returns field's value prepared for saving into a database."""
 
         if isinstance(value, LocalizedValue):
@@ -120,15 +122,25 @@ class LocalizedFileField(LocalizedField):
                     # Need to convert File objects provided via a form to
                     # unicode for database insertion
                     prep_value.set(k, str(v))
-            return super().get_prep_value(prep_value)
-        return super().get_prep_value(value)
+            return super()._get_prep_value(prep_value, default_values)
+        return super()._get_prep_value(value, default_values)
 
     def pre_save(self, model_instance, add):
         """Returns field's value just before saving."""
         value = super().pre_save(model_instance, add)
         if isinstance(value, LocalizedValue):
             for file in value.__dict__.values():
-                if file and not file._committed:
+                if not file or file._committed:
+                    continue
+
+                timer = (
+                    instrumentation.timer(
+                        instrumentation.FILE_UPLOAD, field=str(self)
+                    )
+                    if instrumentation.enabled
+                    else contextlib.nullcontext()
+                )
+                with timer:
                     file.save(file.name, file, save=False)
         return value
 
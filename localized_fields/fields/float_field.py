@@ -1,21 +1,37 @@
 from typing import Dict, Optional, Union
 
-from django.conf import settings
 from django.db.utils import IntegrityError
 
 from ..forms import LocalizedIntegerFieldForm
 from ..value import LocalizedFloatValue, LocalizedValue
-from .field import LocalizedField
+from .field import LocalizedField, LocalizedFieldStorage, LocalizedKeyTransform
+
+
+class LocalizedFloatFieldKeyTransform(LocalizedKeyTransform):
+    """Transform that selects a single key from a hstore value and casts it to
+    a double precision, so that values are ordered and compared as numbers
+    instead of as strings."""
+
+    db_type = "double precision"
 
 
 class LocalizedFloatField(LocalizedField):
     """Stores float as a localized value."""
 
     attr_class = LocalizedFloatValue
-
-    @classmethod
-    def from_db_value(cls, value, *_) -> Optional[LocalizedFloatValue]:
-        db_value = super().from_db_value(value)
+    key_transform_class = LocalizedFloatFieldKeyTransform
+    jsonb_value_sql = (
+        r"CASE WHEN %(value)s ~ '^ *[-+]?([0-9]+(\.[0-9]*)?|\.[0-9]+)([eE][-+]?[0-9]+)? *$' "
+        "THEN to_jsonb(%(value)s::double precision) END"
+    )
+    materialized_db_type = "double precision"
+    materialized_value_sql = (
+        r"CASE WHEN %(value)s ~ '^ *[-+]?([0-9]+(\.[0-9]*)?|\.[0-9]+)([eE][-+]?[0-9]+)? *$' "
+        "THEN %(value)s::double precision END"
+    )
+
+    def from_db_value(self, value, *args) -> Optional[LocalizedFloatValue]:
+        db_value = super().from_db_value(value, *args)
         if db_value is None:
             return db_value
 
@@ -25,7 +41,11 @@ class LocalizedFloatField(LocalizedField):
         if not isinstance(db_value, LocalizedValue):
             return db_value
 
-        return cls._convert_localized_value(db_value)
+        # values stored as JSONB are already of the right type
+        if self.storage_type == LocalizedFieldStorage.JSONB:
+            return db_value
+
+        return self._convert_localized_value(db_value)
 
     def to_python(
         self, value: Union[Dict[str, int], int, None]
@@ -35,40 +55,36 @@ class LocalizedFloatField(LocalizedField):
         db_value = super().to_python(value)
         return self._convert_localized_value(db_value)
 
-    def get_prep_value(self, value: LocalizedFloatValue) -> dict:
+    def _get_prep_value(
+        self, value: LocalizedFloatValue, default_values: LocalizedFloatValue
+    ) -> Optional[dict]:
         """Gets the value in a format to store into the database."""
 
-        # apply default values
-        default_values = LocalizedFloatValue(self.default)
         if isinstance(value, LocalizedFloatValue):
-            for lang_code, _ in settings.LANGUAGES:
-                local_value = value.get(lang_code)
-                if local_value is None:
-                    value.set(lang_code, default_values.get(lang_code, None))
+            self._apply_default_values(value, default_values)
+
+        return super()._get_prep_value(value, default_values)
+
+    def _prep_local_value(self, lang_code: str, value):
+        """Makes sure the value is a proper float."""
 
-        prepped_value = super().get_prep_value(value)
-        if prepped_value is None:
+        if value is None:
             return None
 
-        # make sure all values are proper floats
-        for lang_code, _ in settings.LANGUAGES:
-            local_value = prepped_value[lang_code]
-            try:
-                if local_value is not None:
-                    float(local_value)
-            except (TypeError, ValueError):
-                raise IntegrityError(
-                    'non-float value in column "%s.%s" violates '
-                    "float constraint" % (self.name, lang_code)
-                )
-
-            # convert to a string before saving because the underlying
-            # type is hstore, which only accept strings
-            prepped_value[lang_code] = (
-                str(local_value) if local_value is not None else None
+        value = str(value)
+        try:
+            float_value = float(value)
+        except (TypeError, ValueError):
+            raise IntegrityError(
+                'non-float value in column "%s.%s" violates '
+                "float constraint" % (self.name, lang_code)
             )
 
-        return prepped_value
+        # hstore only accepts strings, JSONB can store the float as-is
+        if self.storage_type == LocalizedFieldStorage.JSONB:
+            return float_value
+
+        return value
 
     def formfield(self, **kwargs):
         """Gets the form field associated with this field."""
@@ -77,14 +93,16 @@ class LocalizedFloatField(LocalizedField):
         defaults.update(kwargs)
         return super().formfield(**defaults)
 
-    @staticmethod
-    def _convert_localized_value(value: LocalizedValue) -> LocalizedFloatValue:
+    def _convert_localized_value(
+        self, value: LocalizedValue
+    ) -> LocalizedFloatValue:
         """Converts from :see:LocalizedValue to :see:LocalizedFloatValue."""
 
         float_values = {}
-        for lang_code, _ in settings.LANGUAGES:
+        for lang_code in self.language_codes:
             local_value = value.get(lang_code, None)
-            if local_value is None or local_value.strip() == "":
+            # values can already be parsed, see :see:LocalizedNumericValue
+            if isinstance(local_value, str) and local_value.strip() == "":
                 local_value = None
 
             try:
@@ -92,4 +110,5 @@ class LocalizedFloatField(LocalizedField):
             except (ValueError, TypeError):
                 float_values[lang_code] = None
 
-        return LocalizedFloatValue(float_values)
+        # the value was already created, it's not counted again
+        return self.attr_class.from_db(float_values)
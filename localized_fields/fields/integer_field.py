@@ -1,27 +1,33 @@
 from typing import Dict, Optional, Union
 
-from django.conf import settings
-from django.contrib.postgres.fields.hstore import KeyTransform
 from django.db.utils import IntegrityError
 
 from ..forms import LocalizedIntegerFieldForm
 from ..value import LocalizedIntegerValue, LocalizedValue
-from .field import LocalizedField
+from .field import LocalizedField, LocalizedFieldStorage, LocalizedKeyTransform
 
 
-class LocalizedIntegerFieldKeyTransform(KeyTransform):
+class LocalizedIntegerFieldKeyTransform(LocalizedKeyTransform):
     """Transform that selects a single key from a hstore value and casts it to
     an integer."""
 
-    def as_sql(self, compiler, connection):
-        sql, params = super().as_sql(compiler, connection)
-        return f"{sql}::integer", params
+    db_type = "integer"
 
 
 class LocalizedIntegerField(LocalizedField):
     """Stores integers as a localized value."""
 
     attr_class = LocalizedIntegerValue
+    key_transform_class = LocalizedIntegerFieldKeyTransform
+    jsonb_value_sql = (
+        "CASE WHEN %(value)s ~ '^ *[-+]?[0-9]+ *$' "
+        "THEN to_jsonb(%(value)s::bigint) END"
+    )
+    materialized_db_type = "integer"
+    materialized_value_sql = (
+        "CASE WHEN %(value)s ~ '^ *[-+]?[0-9]+ *$' "
+        "THEN %(value)s::integer END"
+    )
 
     def get_transform(self, name):
         """Gets the transformation to apply when selecting this value.
@@ -32,13 +38,12 @@ class LocalizedIntegerField(LocalizedField):
         """
 
         def _transform(*args, **kwargs):
-            return LocalizedIntegerFieldKeyTransform(name, *args, **kwargs)
+            return self.get_key_transform(name, *args, **kwargs)
 
         return _transform
 
-    @classmethod
-    def from_db_value(cls, value, *_) -> Optional[LocalizedIntegerValue]:
-        db_value = super().from_db_value(value)
+    def from_db_value(self, value, *args) -> Optional[LocalizedIntegerValue]:
+        db_value = super().from_db_value(value, *args)
         if db_value is None:
             return db_value
 
@@ -51,7 +56,11 @@ class LocalizedIntegerField(LocalizedField):
         if not isinstance(db_value, LocalizedValue):
             return db_value
 
-        return cls._convert_localized_value(db_value)
+        # values stored as JSONB are already of the right type
+        if self.storage_type == LocalizedFieldStorage.JSONB:
+            return db_value
+
+        return self._convert_localized_value(db_value)
 
     def to_python(
         self, value: Union[Dict[str, int], int, None]
@@ -61,40 +70,38 @@ class LocalizedIntegerField(LocalizedField):
         db_value = super().to_python(value)
         return self._convert_localized_value(db_value)
 
-    def get_prep_value(self, value: LocalizedIntegerValue) -> dict:
+    def _get_prep_value(
+        self,
+        value: LocalizedIntegerValue,
+        default_values: LocalizedIntegerValue,
+    ) -> Optional[dict]:
         """Gets the value in a format to store into the database."""
 
-        # apply default values
-        default_values = LocalizedIntegerValue(self.default)
         if isinstance(value, LocalizedIntegerValue):
-            for lang_code, _ in settings.LANGUAGES:
-                local_value = value.get(lang_code)
-                if local_value is None:
-                    value.set(lang_code, default_values.get(lang_code, None))
+            self._apply_default_values(value, default_values)
+
+        return super()._get_prep_value(value, default_values)
 
-        prepped_value = super().get_prep_value(value)
-        if prepped_value is None:
+    def _prep_local_value(self, lang_code: str, value):
+        """Makes sure the value is a proper integer."""
+
+        if value is None:
             return None
 
-        # make sure all values are proper integers
-        for lang_code, _ in settings.LANGUAGES:
-            local_value = prepped_value[lang_code]
-            try:
-                if local_value is not None:
-                    int(local_value)
-            except (TypeError, ValueError):
-                raise IntegrityError(
-                    'non-integer value in column "%s.%s" violates '
-                    "integer constraint" % (self.name, lang_code)
-                )
-
-            # convert to a string before saving because the underlying
-            # type is hstore, which only accept strings
-            prepped_value[lang_code] = (
-                str(local_value) if local_value is not None else None
+        value = str(value)
+        try:
+            integer_value = int(value)
+        except (TypeError, ValueError):
+            raise IntegrityError(
+                'non-integer value in column "%s.%s" violates '
+                "integer constraint" % (self.name, lang_code)
             )
 
-        return prepped_value
+        # hstore only accepts strings, JSONB can store the integer as-is
+        if self.storage_type == LocalizedFieldStorage.JSONB:
+            return integer_value
+
+        return value
 
     def formfield(self, **kwargs):
         """Gets the form field associated with this field."""
@@ -103,16 +110,16 @@ class LocalizedIntegerField(LocalizedField):
         defaults.update(kwargs)
         return super().formfield(**defaults)
 
-    @staticmethod
     def _convert_localized_value(
-        value: LocalizedValue,
+        self, value: LocalizedValue
     ) -> LocalizedIntegerValue:
         """Converts from :see:LocalizedValue to :see:LocalizedIntegerValue."""
 
         integer_values = {}
-        for lang_code, _ in settings.LANGUAGES:
+        for lang_code in self.language_codes:
             local_value = value.get(lang_code, None)
-            if local_value is None or local_value.strip() == "":
+            # values can already be parsed, see :see:LocalizedNumericValue
+            if isinstance(local_value, str) and local_value.strip() == "":
                 local_value = None
 
             try:
@@ -120,4 +127,5 @@ class LocalizedIntegerField(LocalizedField):
             except (ValueError, TypeError):
                 integer_values[lang_code] = None
 
-        return LocalizedIntegerValue(integer_values)
+        # the value was already created, it's not counted again
+        return self.attr_class.from_db(integer_values)
@@ -0,0 +1,114 @@
+from django.db import models
+
+
+class GeneratedValue:
+    """Placeholder that makes PostgreSQL compute the value of a generated
+    column when inserting or updating a row."""
+
+    def as_sql(self, compiler, connection):
+        return "DEFAULT", []
+
+
+class LocalizedMaterializedField(models.Field):
+    """A read-only column that PostgreSQL generates from a single language of
+    a :see:LocalizedField.
+
+    These are added automatically for every language
+    listed in the `materialize` option of a :see:LocalizedField
+    and should not be declared on a model manually.
+    """
+
+    # have PostgreSQL return the generated value after inserting
+    db_returning = True
+
+    def __init__(self, *args, source: str, language: str, **kwargs):
+        """Initializes a new instance of :see:LocalizedMaterializedField.
+
+        Arguments:
+            source:
+                The name of the :see:LocalizedField to
+                generate the value from.
+
+            language:
+                The language to generate the value from.
+        """
+
+        self.source = source
+        self.language = language
+
+        kwargs["null"] = True
+        kwargs["blank"] = True
+        kwargs["editable"] = False
+        kwargs["serialize"] = False
+
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        """Deconstructs the field into something the database can store."""
+
+        name, path, args, kwargs = super().deconstruct()
+
+        for option in ["null", "blank", "editable", "serialize"]:
+            kwargs.pop(option, None)
+
+        kwargs["source"] = self.source
+        kwargs["language"] = self.language
+
+        return name, path, args, kwargs
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        """Adds this field to the specified model.
+
+        The source field adds its materialized fields
+        itself, so skip adding this one when a model is
+        constructed from a migration state or inherits
+        from an abstract model that already has it.
+        """
+
+        for field in cls._meta.local_fields:
+            if field.name == name:
+                return
+
+        super().contribute_to_class(cls, name, *args, **kwargs)
+
+    @property
+    def source_field(self):
+        """Gets the :see:LocalizedField this field is generated from."""
+
+        return self.model._meta.get_field(self.source)
+
+    def db_type(self, connection):
+        """Gets the column definition, including the generation
+        expression."""
+
+        source_field = self.source_field
+        value_sql = source_field.get_materialized_value_sql(
+            self.language, connection
+        )
+
+        return "%s GENERATED ALWAYS AS (%s) STORED" % (
+            source_field.materialized_db_type,
+            value_sql,
+        )
+
+    def cast_db_type(self, connection):
+        return self.source_field.materialized_db_type
+
+    def rel_db_type(self, connection):
+        return self.source_field.materialized_db_type
+
+    def pre_save(self, model_instance, add):
+        """Gets the value of this field before saving.
+
+        PostgreSQL computes the value that is stored. It is
+        returned after inserting, after updating the value
+        is deferred so that it's loaded when it's accessed.
+        """
+
+        if not add:
+            model_instance.__dict__.pop(self.attname, None)
+
+        return None
+
+    def get_db_prep_save(self, value, connection):
+        return GeneratedValue()
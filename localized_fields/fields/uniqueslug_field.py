@@ -5,7 +5,6 @@ from django.utils.text import slugify
 
 from ..mixins import AtomicSlugRetryMixin
 from ..util import get_language_codes
-from ..value import LocalizedValue
 from .autoslug_field import LocalizedAutoSlugField
 
 
@@ -30,7 +29,9 @@ class LocalizedUniqueSlugField(LocalizedAutoSlugField):
     def __init__(self, *args, **kwargs):
         """Initializes a new instance of :see:LocalizedUniqueSlugField."""
 
-        kwargs["uniqueness"] = kwargs.pop("uniqueness", get_language_codes())
+        kwargs["uniqueness"] = kwargs.pop(
+            "uniqueness", kwargs.get("languages") or get_language_codes()
+        )
 
         self.enabled = kwargs.pop("enabled", True)
         self.immutable = kwargs.pop("immutable", False)
@@ -85,7 +86,7 @@ class LocalizedUniqueSlugField(LocalizedAutoSlugField):
                 % type(instance).__name__
             )
 
-        slugs = LocalizedValue()
+        slugs = self.attr_class()
 
         for lang_code, value in self._get_populate_values(instance):
             if not value:
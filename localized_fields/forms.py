@@ -1,10 +1,12 @@
-from typing import List, Union
+import copy
+
+from typing import List, Optional, Union
 
 from django import forms
-from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.forms.widgets import FILE_INPUT_CONTRADICTION
 
+from .util import get_language_table
 from .value import (
     LocalizedBooleanValue,
     LocalizedFileValue,
@@ -18,8 +20,46 @@ from .widgets import (
     LocalizedCharFieldWidget,
     LocalizedFieldWidget,
     LocalizedFileWidget,
+    clone_widget,
 )
 
+# The configured inner fields of every form class, set of required
+# languages and subset of languages, that new forms clone instead of
+# constructing their own. Cleared when settings.LANGUAGES changes,
+# see `clear_prototypes`.
+_prototype_fields = {}
+
+
+def clear_prototypes() -> None:
+    """Clears the cached inner fields, so that they are re-created for the
+    current settings."""
+
+    _prototype_fields.clear()
+
+
+def clone_field(field: forms.Field, memo: Optional[dict] = None):
+    """Creates a copy of the specified field, the same way deep copying it
+    does, but without the overhead of the copy module.
+
+    Fields that copy themselves differently
+    are deep copied as usual.
+    """
+
+    if type(field).__deepcopy__ is not forms.Field.__deepcopy__:
+        return copy.deepcopy(field, memo)
+
+    result = object.__new__(type(field))
+    result.__dict__.update(field.__dict__)
+
+    if memo is not None:
+        memo[id(field)] = result
+
+    result.widget = clone_widget(field.widget, memo)
+    result.error_messages = field.error_messages.copy()
+    result.validators = field.validators[:]
+
+    return result
+
 
 class LocalizedFieldForm(forms.MultiValueField):
     """Form for a localized field, allows editing the field in multiple
@@ -30,26 +70,47 @@ class LocalizedFieldForm(forms.MultiValueField):
     value_class = LocalizedValue
 
     def __init__(
-        self, *args, required: Union[bool, List[str]] = False, **kwargs
+        self,
+        *args,
+        required: Union[bool, List[str]] = False,
+        languages: Optional[List[str]] = None,
+        **kwargs
     ):
-        """Initializes a new instance of :see:LocalizedFieldForm."""
+        """Initializes a new instance of :see:LocalizedFieldForm.
+
+        Arguments:
+            required:
+                Whether all languages are required, or
+                a list of the required languages.
+
+            languages:
+                Optional subset of the languages in
+                settings.LANGUAGES to edit.
+        """
 
-        fields = []
+        self.language_table = get_language_table(languages)
+        self.value_class = self.value_class.with_languages(languages)
 
         # Do not print initial value in html in the form of a hidden input. This will result in loss of information
         kwargs["show_hidden_initial"] = False
 
-        for lang_code, _ in settings.LANGUAGES:
-            field_options = dict(
-                required=required
-                if type(required) is bool
-                else (lang_code in required),
-                label=lang_code,
-            )
-            fields.append(self.field_class(**field_options))
+        # the widget needs to know about the subset as well, unless
+        # an already constructed widget instance was specified
+        widget = kwargs.get("widget") or self.widget
+        if languages is not None and isinstance(widget, type):
+            kwargs["widget"] = widget(languages=languages)
+
+        key = (
+            type(self),
+            required if type(required) is bool else tuple(required),
+            tuple(languages) if languages is not None else None,
+        )
+        prototypes = _prototype_fields.get(key)
+        if prototypes is None:
+            prototypes = _prototype_fields[key] = self._create_fields(required)
 
         super(LocalizedFieldForm, self).__init__(
-            fields,
+            [clone_field(field) for field in prototypes],
             required=required if type(required) is bool else True,
             require_all_fields=False,
             *args,
@@ -60,6 +121,26 @@ class LocalizedFieldForm(forms.MultiValueField):
         for field, widget in zip(self.fields, self.widget.widgets):
             widget.is_required = field.required
 
+    def __deepcopy__(self, memo):
+        result = super(forms.MultiValueField, self).__deepcopy__(memo)
+        result.fields = tuple(clone_field(field, memo) for field in self.fields)
+        return result
+
+    def _create_fields(
+        self, required: Union[bool, List[str]]
+    ) -> List[forms.Field]:
+        """Creates the inner field of every language."""
+
+        return [
+            self.field_class(
+                required=required
+                if type(required) is bool
+                else (lang_code in required),
+                label=lang_code,
+            )
+            for lang_code, _ in self.language_table
+        ]
+
     def compress(self, value: List[str]) -> LocalizedValue:
         """Compresses the values from individual fields into a single
         :see:LocalizedValue instance.
@@ -75,7 +156,7 @@ class LocalizedFieldForm(forms.MultiValueField):
 
         localized_value = self.value_class()
 
-        for (lang_code, _), value in zip(settings.LANGUAGES, value):
+        for (lang_code, _), value in zip(self.language_table, value):
             localized_value.set(lang_code, value)
 
         return localized_value
@@ -0,0 +1,206 @@
+from typing import Optional
+
+from django.contrib.postgres.indexes import GinIndex
+from django.db.models import Index
+
+from .fields import LocalizedFieldStorage
+from .lookups import AnyLanguageSearchLookup
+from .util import get_language_collation
+
+
+class AnyLanguageIndex(GinIndex):
+    """Base class for GIN indexes on the values of all languages of a
+    :see:LocalizedField, as selected by the `any_language` lookup."""
+
+    # the indexed expression, %(value)s is the text of all languages
+    expression_sql = None
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        statement = super().create_sql(
+            model, schema_editor, using=using, **kwargs
+        )
+
+        field = model._meta.get_field(self.fields[0])
+        value_sql = field.get_any_language_sql(
+            schema_editor.quote_name(field.column)
+        )
+
+        statement.parts["columns"] = self.expression_sql % dict(value=value_sql)
+        return statement
+
+
+class AnyLanguageTrigramIndex(AnyLanguageIndex):
+    """Trigram index that is used by the `any_language__icontains` lookup.
+
+    Requires the `pg_trgm` extension, see
+    `django.contrib.postgres.operations.TrigramExtension`.
+    """
+
+    expression_sql = "UPPER(%(value)s) gin_trgm_ops"
+
+
+class AnyLanguageSearchIndex(AnyLanguageIndex):
+    """Full text search index that is used by the `any_language__search`
+    lookup."""
+
+    expression_sql = "to_tsvector('%s'::regconfig, %%(value)s)" % (
+        AnyLanguageSearchLookup.search_config
+    )
+
+
+class LocalizedLanguageIndex(Index):
+    """Index on a single language of a :see:LocalizedField, on the same
+    expression that selecting the language in a query produces.
+
+    For :see:LocalizedIntegerField and :see:LocalizedFloatField
+    the value is cast the same way as in queries, so that numeric
+    ordering and range lookups on the language use the index.
+    """
+
+    # whether to cast the value to the type that the key transform selects
+    cast = True
+
+    def __init__(self, *args, language: str, **kwargs):
+        """Initializes a new instance of :see:LocalizedLanguageIndex.
+
+        Arguments:
+            language:
+                The language to index.
+        """
+
+        super().__init__(*args, **kwargs)
+
+        self.language = language
+
+    def deconstruct(self):
+        path, args, kwargs = super().deconstruct()
+        kwargs["language"] = self.language
+
+        return path, args, kwargs
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        # the statement is created as usual, so that the other options,
+        # such as `condition` and `concurrently` are kept, and only the
+        # indexed column is replaced with the expression
+        statement = super().create_sql(
+            model, schema_editor, using=using, **kwargs
+        )
+
+        field = model._meta.get_field(self.fields[0])
+        statement.parts["columns"] = self.get_value_sql(field, schema_editor)
+
+        return statement
+
+    def get_value_sql(self, field, schema_editor) -> str:
+        """Gets the SQL expression that selects the indexed language."""
+
+        quote_name = schema_editor.quote_name
+
+        if self.language in field.materialize:
+            return quote_name(
+                field.get_materialized_field(self.language).column
+            )
+
+        language = self.language.replace("'", "''")
+
+        # expressions have to be parenthesized in an index, unlike columns
+        if field.storage_type == LocalizedFieldStorage.JSONB:
+            value_sql = "(%s->>'%s')" % (quote_name(field.column), language)
+        else:
+            value_sql = "(%s->'%s')" % (quote_name(field.column), language)
+
+        db_type = field.key_transform_class.db_type
+        if self.cast and db_type != "text":
+            value_sql = "((%s)::%s)" % (value_sql, db_type)
+
+        return value_sql
+
+
+class LocalizedBooleanIndex(LocalizedLanguageIndex):
+    """Partial index on the rows in which a single language of a
+    :see:LocalizedBooleanField is true.
+
+    Used when filtering on `field__lang=True`, such as
+    rows that are active in a single market. See the
+    `partial_indexes` option of :see:LocalizedBooleanField
+    for creating these.
+    """
+
+    def set_name_with_model(self, model):
+        super().set_name_with_model(model)
+
+        # indexes on other languages of the same field get the same name
+        suffix = "_%s" % self.language.replace("-", "_")
+        self.name = self.name[: self.max_name_length - len(suffix)] + suffix
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        statement = super().create_sql(
+            model, schema_editor, using=using, **kwargs
+        )
+
+        field = model._meta.get_field(self.fields[0])
+        condition_sql = self.get_value_sql(field, schema_editor)
+
+        # combined with the condition of the index, if there is one
+        condition = str(statement.parts.get("condition") or "").strip()
+        if condition:
+            condition_sql = "%s AND %s" % (
+                condition_sql,
+                condition.split("WHERE", 1)[1].strip(),
+            )
+
+        if "%(condition)s" not in statement.template:
+            statement.template += "%(condition)s"
+
+        statement.parts["columns"] = schema_editor.quote_name(
+            model._meta.pk.column
+        )
+        statement.parts["condition"] = " WHERE %s" % condition_sql
+
+        return statement
+
+
+class LocalizedCollatedIndex(LocalizedLanguageIndex):
+    """Index on a single language of a :see:LocalizedField, using the
+    collation configured for the language, that is used when ordering by
+    :see:LocalizedOrderBy."""
+
+    # this must be the same expression that LocalizedRef selects
+    cast = False
+
+    def __init__(self, *args, collation: Optional[str] = None, **kwargs):
+        """Initializes a new instance of :see:LocalizedCollatedIndex.
+
+        Arguments:
+            language:
+                The language to index.
+
+            collation:
+                The collation to use, taken from the
+                LOCALIZED_FIELDS_COLLATIONS setting when
+                not specified.
+        """
+
+        super().__init__(*args, **kwargs)
+
+        self.collation = collation
+
+    def deconstruct(self):
+        path, args, kwargs = super().deconstruct()
+
+        if self.collation:
+            kwargs["collation"] = self.collation
+
+        return path, args, kwargs
+
+    def get_value_sql(self, field, schema_editor) -> str:
+        value_sql = super().get_value_sql(field, schema_editor)
+
+        collation = self.collation or get_language_collation(self.language)
+        if collation:
+            value_sql = "(%s) COLLATE %s" % (
+                value_sql,
+                schema_editor.quote_name(collation),
+            )
+
+        return value_sql
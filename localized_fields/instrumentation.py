@@ -0,0 +1,225 @@
+import logging
+import threading
+import time
+
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Whether a sink is configured or measurements are being collected.
+# Instrumented code checks this before doing anything else, so that
+# instrumentation costs nothing when it's disabled, which is the default.
+enabled = False
+
+_sink = None
+
+# The sinks that measurements are being collected in, see `collect`.
+_collectors: ContextVar = ContextVar("localized_fields_collectors", default=())
+_collecting = 0
+_collecting_lock = threading.Lock()
+
+# The names of the measurements that are reported.
+VALUE_CREATED = "value.created"
+VALUE_LOADED = "value.loaded"
+TRANSLATE_HIT = "translate.hit"
+TRANSLATE_FALLBACK = "translate.fallback"
+TRANSLATE_MISS = "translate.miss"
+DESCRIPTOR_REFRESH = "descriptor.refresh"
+SLUG_RETRY = "slug.retry"
+SLUG_QUERY = "slug.query"
+BLEACH = "bleach"
+FILE_UPLOAD = "file.upload"
+
+
+class InstrumentationSink:
+    """Receives measurements from the instrumented code paths.
+
+    Does nothing by default, override the methods to
+    forward the measurements to statsd, Prometheus, etc.
+    """
+
+    def increment(self, name: str, value: int = 1, tags: Dict = None):
+        """Increments the counter with the specified name.
+
+        Arguments:
+            name:
+                The name of the counter, one of the
+                constants in this module.
+
+            value:
+                The amount to increment the counter by.
+
+            tags:
+                Details about what was counted, such
+                as the field or language.
+        """
+
+    def timing(self, name: str, seconds: float, tags: Dict = None):
+        """Records how long the operation with the specified name took.
+
+        Arguments:
+            name:
+                The name of the operation, one of the
+                constants in this module.
+
+            seconds:
+                The amount of seconds it took.
+
+            tags:
+                Details about the operation, such
+                as the field it was done for.
+        """
+
+
+class CounterSink(InstrumentationSink):
+    """Keeps all measurements in memory, per name and tags."""
+
+    def __init__(self):
+        self.counters = Counter()
+        self.timings = defaultdict(float)
+
+    def increment(self, name: str, value: int = 1, tags: Dict = None):
+        self.counters[self._key(name, tags)] += value
+
+    def timing(self, name: str, seconds: float, tags: Dict = None):
+        self.counters[self._key(name, tags)] += 1
+        self.timings[self._key(name, tags)] += seconds
+
+    def get(self, name: str, **tags) -> int:
+        """Gets the total count of the specified measurement, optionally only
+        for the measurements with the specified tags."""
+
+        return sum(
+            count
+            for (key_name, key_tags), count in self.counters.items()
+            if key_name == name and set(tags.items()) <= set(key_tags)
+        )
+
+    def reset(self):
+        """Clears all the measurements."""
+
+        self.counters.clear()
+        self.timings.clear()
+
+    @staticmethod
+    def _key(name: str, tags: Optional[Dict]):
+        return name, tuple(sorted(tags.items())) if tags else ()
+
+
+class LoggingSink(InstrumentationSink):
+    """Logs all measurements on the DEBUG level."""
+
+    def increment(self, name: str, value: int = 1, tags: Dict = None):
+        logger.debug("%s +%d %s", name, value, tags or {})
+
+    def timing(self, name: str, seconds: float, tags: Dict = None):
+        logger.debug("%s %.6fs %s", name, seconds, tags or {})
+
+
+def configure(sink: Optional[InstrumentationSink]) -> None:
+    """Sets the sink that receives all measurements.
+
+    Arguments:
+        sink:
+            The sink to use, or None to disable
+            instrumentation.
+    """
+
+    global _sink
+
+    _sink = sink
+    _update_enabled()
+
+
+def configure_from_settings(**kwargs) -> None:
+    """Configures the sink specified by the
+    LOCALIZED_FIELDS_INSTRUMENTATION_SINK setting, which is either a dotted
+    path to a sink class or a sink instance."""
+
+    sink = getattr(settings, "LOCALIZED_FIELDS_INSTRUMENTATION_SINK", None)
+    if isinstance(sink, str):
+        sink = import_string(sink)()
+
+    configure(sink)
+
+
+def get_sink() -> Optional[InstrumentationSink]:
+    """Gets the configured sink, if any."""
+
+    return _sink
+
+
+@contextmanager
+def collect():
+    """Collects the measurements made in the wrapped block, in the current
+    thread or task only, regardless of the configured sink.
+
+    Yields:
+        The :see:CounterSink the measurements
+        are collected in.
+    """
+
+    global _collecting
+
+    sink = CounterSink()
+    token = _collectors.set(_collectors.get() + (sink,))
+
+    with _collecting_lock:
+        _collecting += 1
+        _update_enabled()
+
+    try:
+        yield sink
+    finally:
+        _collectors.reset(token)
+
+        with _collecting_lock:
+            _collecting -= 1
+            _update_enabled()
+
+
+def increment(name: str, value: int = 1, **tags) -> None:
+    """Increments the counter with the specified name on the configured sink
+    and the sinks measurements are being collected in."""
+
+    for sink in _get_sinks():
+        sink.increment(name, value, tags)
+
+
+@contextmanager
+def timer(name: str, **tags):
+    """Reports how long the wrapped block took to the configured sink and the
+    sinks measurements are being collected in."""
+
+    sinks = _get_sinks()
+    if not sinks:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        for sink in sinks:
+            sink.timing(name, duration, tags)
+
+
+def _get_sinks():
+    sinks = _collectors.get()
+    if _sink is not None:
+        sinks = (_sink,) + sinks
+
+    return sinks
+
+
+def _update_enabled():
+    global enabled
+
+    enabled = _sink is not None or _collecting > 0
@@ -0,0 +1,99 @@
+import re
+
+from django.contrib.postgres.signals import get_hstore_oids
+from django.db.backends.base.base import NO_DB_ALIAS
+
+try:
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+except ImportError:
+    # for Django < 4.2
+    is_psycopg3 = False
+
+if is_psycopg3:
+    from psycopg.adapt import Loader
+    from psycopg.types import hstore
+
+    # only available since psycopg 3.2
+    HstoreBinaryLoader = getattr(hstore, "HstoreBinaryLoader", None)
+else:
+    Loader = object
+    HstoreBinaryLoader = None
+
+# PostgreSQL always outputs hstore values as "key"=>"value", "key"=>NULL
+# where quotes and backslashes are escaped with a backslash, so without
+# any backslashes, the pairs can be found without having to unescape
+_re_hstore_pair = re.compile(r'"([^"\\]*)"=>(?:(NULL)|"([^"\\]*)")')
+_re_hstore_escaped_pair = re.compile(
+    r'"((?:[^"\\]|\\.)*)"=>(?:(NULL)|"((?:[^"\\]|\\.)*)")'
+)
+_re_unescape = re.compile(r"\\(.)")
+
+
+def parse_hstore(text: str) -> dict:
+    """Parses the text representation of a hstore value in a single pass.
+
+    Arguments:
+        text:
+            The hstore value as returned by PostgreSQL.
+
+    Returns:
+        A dictionary with a key for every pair in the
+        hstore value. NULL values are returned as None.
+    """
+
+    if "\\" not in text:
+        return {
+            key: None if null else value
+            for key, null, value in _re_hstore_pair.findall(text)
+        }
+
+    return {
+        _re_unescape.sub(r"\1", key): (
+            None if null else _re_unescape.sub(r"\1", value)
+        )
+        for key, null, value in _re_hstore_escaped_pair.findall(text)
+    }
+
+
+class LocalizedHStoreLoader(Loader):
+    """Loads hstore values that are sent as text, which is what Django
+    requests, using :see:parse_hstore."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        encoding = self.connection.info.encoding if self.connection else None
+        self._encoding = (
+            encoding if encoding not in (None, "ascii") else "utf-8"
+        )
+
+    def load(self, data) -> dict:
+        return parse_hstore(bytes(data).decode(self._encoding))
+
+
+def register_loaders(connection, **kwargs):
+    """Registers the loaders for hstore values on a new psycopg 3 connection.
+
+    This replaces the loaders that Django registers, so
+    this must run after Django's own handler. Nothing is
+    done when psycopg2 is used.
+
+    Arguments:
+        connection:
+            The Django database connection that was created.
+    """
+
+    if not is_psycopg3:
+        return
+
+    if connection.vendor != "postgresql" or connection.alias == NO_DB_ALIAS:
+        return
+
+    oids, _ = get_hstore_oids(connection.alias)
+
+    adapters = connection.connection.adapters
+    for oid in oids:
+        adapters.register_loader(oid, LocalizedHStoreLoader)
+
+        if HstoreBinaryLoader:
+            adapters.register_loader(oid, HstoreBinaryLoader)
@@ -1,3 +1,5 @@
+import json
+
 from django.conf import settings
 from django.contrib.postgres.fields.hstore import KeyTransform
 from django.contrib.postgres.lookups import (
@@ -5,7 +7,7 @@ from django.contrib.postgres.lookups import (
     TrigramSimilar,
     Unaccent,
 )
-from django.db.models import TextField, Transform
+from django.db.models import Lookup, TextField, Transform
 from django.db.models.expressions import Col, Func, Value
 from django.db.models.functions import Coalesce
 from django.db.models.lookups import (
@@ -25,7 +27,8 @@ from django.db.models.lookups import (
 from django.utils import translation
 from psqlextra.expressions import HStoreColumn
 
-from .fields import LocalizedField
+from .fields import LocalizedField, LocalizedFieldStorage
+from .fields.field import LocalizedKeyTransform
 
 try:
     from django.db.models.functions import NullIf
@@ -36,6 +39,18 @@ except ImportError:
         arity = 2
 
 
+def _get_key_transform(language: str, lhs):
+    """Gets an expression that selects the specified language from the
+    specified expression, respecting the options of the localized field it
+    refers to."""
+
+    field = lhs.output_field
+    if not isinstance(field, LocalizedField):
+        return LocalizedKeyTransform(language, lhs)
+
+    return field.get_key_transform(field.resolve_language(language), lhs)
+
+
 class LocalizedLookupMixin:
     def process_lhs(self, qn, connection):
         # If the LHS is already a reference to a specific hstore key, there
@@ -46,8 +61,11 @@ class LocalizedLookupMixin:
             return super().process_lhs(qn, connection)
 
         # If this is something custom expression, we don't really know how to
-        # handle that, so we better do nothing.
-        if not isinstance(self.lhs, Col):
+        # handle that, so we better do nothing. The same goes for a reference
+        # to a materialized language, which is not a localized field anymore.
+        if not isinstance(self.lhs, Col) or not isinstance(
+            self.lhs.output_field, LocalizedField
+        ):
             return super().process_lhs(qn, connection)
 
         # Select the key for the current language. We do this so that
@@ -58,7 +76,7 @@ class LocalizedLookupMixin:
         #
         # myfield__<lookup>__<current language>=
         language = translation.get_language() or settings.LANGUAGE_CODE
-        self.lhs = KeyTransform(language, self.lhs)
+        self.lhs = _get_key_transform(language, self.lhs)
 
         return super().process_lhs(qn, connection)
 
@@ -90,8 +108,37 @@ class LocalizedIExact(LocalizedLookupMixin, IExact):
     pass
 
 
+@LocalizedKeyTransform.register_lookup
 class LocalizedIn(LocalizedLookupMixin, In):
-    pass
+    """Compiles to `= ANY(%s)` with a single array parameter, so that the
+    size of the query does not grow with the amount of values."""
+
+    def get_prep_lookup(self):
+        if hasattr(self.rhs, "resolve_expression"):
+            return super(LocalizedLookupMixin, self).get_prep_lookup()
+
+        return [str(value) for value in self.rhs if value is not None]
+
+    def as_sql(self, compiler, connection):
+        if not self.rhs_is_direct_value():
+            return super().as_sql(compiler, connection)
+
+        lhs, params = self.process_lhs(compiler, connection)
+
+        # typed languages are cast, materialized languages are
+        # selected as a plain column and anything else is text, such
+        # as a :see:LocalizedRef that selects a language
+        if isinstance(self.lhs, LocalizedKeyTransform):
+            db_type = self.lhs.db_type
+        elif isinstance(self.lhs.output_field, LocalizedField):
+            db_type = "text"
+        else:
+            db_type = self.lhs.output_field.cast_db_type(connection)
+
+        return (
+            "%s = ANY(%%s::%s[])" % (lhs, db_type),
+            list(params) + [self.rhs],
+        )
 
 
 class LocalizedContains(LocalizedLookupMixin, Contains):
@@ -138,7 +185,7 @@ class ActiveRefLookup(Transform):
 
     def as_sql(self, compiler, connection):
         language = translation.get_language() or settings.LANGUAGE_CODE
-        return KeyTransform(language, self.lhs).as_sql(compiler, connection)
+        return compiler.compile(_get_key_transform(language, self.lhs))
 
 
 @LocalizedField.register_lookup
@@ -150,21 +197,176 @@ class TranslatedRefLookup(Transform):
     def as_sql(self, compiler, connection):
         language = translation.get_language()
         fallback_config = getattr(settings, "LOCALIZED_FIELDS_FALLBACKS", {})
-        target_languages = fallback_config.get(language, [])
+        target_languages = list(fallback_config.get(language, []))
         if not target_languages and language != settings.LANGUAGE_CODE:
             target_languages.append(settings.LANGUAGE_CODE)
 
         if language:
             target_languages.insert(0, language)
 
+        # fields that only store a subset of the languages can
+        # only fall back to the languages they actually store
+        field = self.lhs.output_field
+        if isinstance(field, LocalizedField) and field.languages is not None:
+            target_languages = [
+                lang_code
+                for lang_code in target_languages
+                if lang_code in field.languages
+            ] or [field.resolve_language(None)]
+
         if len(target_languages) > 1:
             return Coalesce(
                 *[
-                    NullIf(KeyTransform(language, self.lhs), Value(""))
+                    NullIf(_get_key_transform(language, self.lhs), Value(""))
                     for language in target_languages
                 ]
             ).as_sql(compiler, connection)
 
-        return KeyTransform(target_languages[0], self.lhs).as_sql(
-            compiler, connection
+        return compiler.compile(
+            _get_key_transform(target_languages[0], self.lhs)
+        )
+
+
+class LocalizedLanguagesLookup(Lookup):
+    """Base class for lookups that filter on the languages that have a
+    value.
+
+    These compile to the hstore/JSONB key existence
+    operators, so that they can use a GIN index on the
+    field, see the `gin_index` option. Fields that are not
+    sparse store a key for every language, so the values
+    are checked as well.
+    """
+
+    prepare_rhs = False
+
+    # the operator that checks whether the keys exist
+    operator = None
+
+    # whether all languages need a value, or just any
+    require_all = True
+
+    def get_languages(self):
+        return list(self.rhs)
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        languages = self.get_languages()
+
+        if len(languages) == 1:
+            sql = "%s ? %%s" % lhs
+            params = list(lhs_params) + languages
+        else:
+            sql = "%s %s %%s" % (lhs, self.operator)
+            params = list(lhs_params) + [languages]
+
+        field = self.lhs.output_field
+        if field.sparse:
+            return sql, params
+
+        operator = (
+            "->>" if field.storage_type == LocalizedFieldStorage.JSONB else "->"
+        )
+
+        value_sqls = []
+        for language in languages:
+            # missing and NULL values are false instead of NULL, so
+            # that excluding the rows that have a value works
+            value_sqls.append(
+                "coalesce((%s %s %%s) <> '', false)" % (lhs, operator)
+            )
+            params.extend(list(lhs_params) + [language])
+
+        return (
+            "(%s AND (%s))"
+            % (sql, (" AND " if self.require_all else " OR ").join(value_sqls)),
+            params,
+        )
+
+
+@LocalizedField.register_lookup
+class HasLanguageLookup(LocalizedLanguagesLookup):
+    lookup_name = "has_language"
+
+    def get_languages(self):
+        return [self.rhs]
+
+
+@LocalizedField.register_lookup
+class HasAllLanguagesLookup(LocalizedLanguagesLookup):
+    lookup_name = "has_all_languages"
+    operator = "?&"
+
+
+@LocalizedField.register_lookup
+class HasAnyLanguageLookup(LocalizedLanguagesLookup):
+    lookup_name = "has_any_language"
+    operator = "?|"
+    require_all = False
+
+
+@LocalizedField.register_lookup
+class ContainsTranslationsLookup(Lookup):
+    """Filters on the values of multiple languages at once, using the
+    containment operator so that it can use a GIN index on the field."""
+
+    lookup_name = "contains_translations"
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        lhs, params = self.process_lhs(compiler, connection)
+
+        field = self.lhs.output_field
+        if field.storage_type == LocalizedFieldStorage.JSONB:
+            return (
+                "%s @> %%s::jsonb" % lhs,
+                list(params) + [json.dumps(self.rhs)],
+            )
+
+        return (
+            "%s @> hstore(%%s::text[], %%s::text[])" % lhs,
+            list(params)
+            + [
+                list(self.rhs.keys()),
+                [
+                    str(value) if value is not None else None
+                    for value in self.rhs.values()
+                ],
+            ],
+        )
+
+
+@LocalizedField.register_lookup
+class AnyLanguageTransform(Transform):
+    """Selects the values of all languages as a single text, so that
+    lookups such as `any_language__icontains` match any language."""
+
+    output_field = TextField()
+    lookup_name = "any_language"
+
+    def as_sql(self, compiler, connection):
+        lhs, params = compiler.compile(self.lhs)
+        return self.lhs.output_field.get_any_language_sql(lhs), params
+
+
+@AnyLanguageTransform.register_lookup
+class AnyLanguageSearchLookup(Lookup):
+    """Full text search in all languages at once.
+
+    Uses the `simple` configuration, which does not stem
+    words the way a configuration for a single language
+    does, see :see:AnyLanguageSearchIndex.
+    """
+
+    lookup_name = "search"
+    prepare_rhs = False
+    search_config = "simple"
+
+    def as_sql(self, compiler, connection):
+        lhs, params = self.process_lhs(compiler, connection)
+
+        return (
+            "to_tsvector('%s'::regconfig, %s) @@ plainto_tsquery('%s'::regconfig, %%s)"
+            % (self.search_config, lhs, self.search_config),
+            list(params) + [str(self.rhs)],
         )
@@ -0,0 +1,225 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from ...fields import LocalizedFieldStorage
+from ...util import get_localized_fields, update_in_batches
+
+
+class Command(BaseCommand):
+    """Adds a language to, or drops a language from, the stored values of all
+    :see:LocalizedField's."""
+
+    help = "Adds a language to, or drops a language from, the stored values of all localized fields, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "action",
+            choices=["add", "drop"],
+            help="Whether to add or drop the language.",
+        )
+
+        parser.add_argument("language", help="The language to add or drop.")
+
+        parser.add_argument(
+            "labels",
+            nargs="*",
+            help="Optional app labels (myapp) or model labels (myapp.MyModel) to alter.",
+        )
+
+        parser.add_argument(
+            "--copy-from",
+            help="Optional language to copy the value from when adding a language.",
+            default=None,
+        )
+
+        parser.add_argument(
+            "--batch-size",
+            "-b",
+            type=int,
+            help="Amount of rows to update in a single statement.",
+            default=1000,
+        )
+
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            help="Amount of seconds to wait between batches.",
+            default=0,
+        )
+
+        parser.add_argument(
+            "--start-after",
+            help="Primary key to resume after, requires a single model label.",
+            default=None,
+        )
+
+        parser.add_argument(
+            "--using",
+            "-u",
+            help="Optional name of the database connection to use.",
+            default="default",
+        )
+
+    def handle(
+        self,
+        action: str,
+        language: str,
+        labels,
+        copy_from: str,
+        batch_size: int,
+        sleep: float,
+        start_after,
+        using: str,
+        *args,
+        **kwargs
+    ):
+        self.verbosity = kwargs.get("verbosity", 1)
+
+        if copy_from and action != "add":
+            raise CommandError("--copy-from can only be used when adding.")
+
+        models = get_localized_fields(labels)
+        if start_after is not None and (
+            len(labels) != 1 or "." not in labels[0]
+        ):
+            raise CommandError("--start-after requires a single model label.")
+
+        for model, fields in models:
+            fields = [
+                field
+                for field in fields
+                if self._should_alter(model, field, action, language)
+            ]
+            if not fields:
+                continue
+
+            updated = self._alter(
+                model,
+                fields,
+                action,
+                language,
+                copy_from,
+                batch_size,
+                sleep,
+                start_after,
+                using,
+            )
+
+            self.stdout.write(
+                "%s: %s %s in %d row(s)"
+                % (
+                    model._meta.label,
+                    "added" if action == "add" else "dropped",
+                    language,
+                    updated,
+                )
+            )
+
+    def _should_alter(self, model, field, action: str, language: str) -> bool:
+        """Gets whether the stored values of the specified field should be
+        altered and reports why not if they shouldn't."""
+
+        label = "%s.%s" % (model._meta.label, field.name)
+
+        if action == "add":
+            if language not in field.language_codes:
+                self.stderr.write(
+                    "%s: skipped, %s is not one of its languages"
+                    % (label, language)
+                )
+                return False
+
+            # languages without a value are not stored in these
+            return (
+                not field.sparse
+                and field.storage_type == LocalizedFieldStorage.HSTORE
+            )
+
+        if language in field.language_codes:
+            self.stderr.write(
+                "%s: skipped, %s is still one of its languages"
+                % (label, language)
+            )
+            return False
+
+        return True
+
+    def _alter(
+        self,
+        model,
+        fields,
+        action: str,
+        language: str,
+        copy_from: str,
+        batch_size: int,
+        sleep: float,
+        start_after,
+        using: str,
+    ) -> int:
+        """Alters all rows of the specified model in primary key ordered
+        batches.
+
+        Every batch is committed separately and reported,
+        so that an interrupted run can be resumed after the
+        last reported primary key.
+
+        Returns:
+            The amount of rows that were changed.
+        """
+
+        quote_name = connections[using].ops.quote_name
+
+        assignments = []
+        conditions = []
+        assignment_params = []
+        condition_params = []
+
+        for field in fields:
+            column = quote_name(field.column)
+            jsonb = field.storage_type == LocalizedFieldStorage.JSONB
+
+            if action == "add":
+                # the existing value takes precedence, so languages
+                # that were already added are left alone
+                if copy_from:
+                    assignments.append(
+                        "%s = hstore(%%s, %s->%%s) || %s"
+                        % (column, column, column)
+                    )
+                    assignment_params.extend([language, copy_from])
+                else:
+                    assignments.append(
+                        "%s = hstore(%%s, NULL) || %s" % (column, column)
+                    )
+                    assignment_params.append(language)
+
+                conditions.append("NOT exist(%s, %%s)" % column)
+            elif jsonb:
+                assignments.append("%s = %s - %%s" % (column, column))
+                assignment_params.append(language)
+                conditions.append("jsonb_exists(%s, %%s)" % column)
+            else:
+                assignments.append("%s = delete(%s, %%s)" % (column, column))
+                assignment_params.append(language)
+                conditions.append("exist(%s, %%s)" % column)
+
+            condition_params.append(language)
+
+        def _progress(updated: int, last_pk) -> None:
+            if self.verbosity > 0:
+                self.stdout.write(
+                    "%s: %d row(s) updated, up to pk %s"
+                    % (model._meta.label, updated, last_pk)
+                )
+
+        return update_in_batches(
+            model,
+            assignments,
+            conditions,
+            assignment_params + condition_params,
+            batch_size,
+            using,
+            start_after=start_after,
+            sleep=sleep,
+            progress=_progress,
+        )
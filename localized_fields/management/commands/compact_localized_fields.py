@@ -0,0 +1,90 @@
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from ...fields import LocalizedFieldStorage
+from ...util import get_localized_fields, update_in_batches
+
+
+class Command(BaseCommand):
+    """Removes languages without a value from existing rows of sparse
+    :see:LocalizedField's."""
+
+    help = "Removes empty languages from the stored values of sparse localized fields, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "labels",
+            nargs="*",
+            help="Optional app labels (myapp) or model labels (myapp.MyModel) to compact.",
+        )
+
+        parser.add_argument(
+            "--batch-size",
+            "-b",
+            type=int,
+            help="Amount of rows to update in a single statement.",
+            default=1000,
+        )
+
+        parser.add_argument(
+            "--using",
+            "-u",
+            help="Optional name of the database connection to use.",
+            default="default",
+        )
+
+    def handle(self, labels, batch_size: int, using: str, *args, **kwargs):
+        for model, fields in get_localized_fields(labels):
+            # compacting relies on hstore functions, JSONB columns
+            # are compacted whenever a row is saved
+            fields = [
+                field
+                for field in fields
+                if field.sparse
+                and field.storage_type == LocalizedFieldStorage.HSTORE
+            ]
+            if not fields:
+                continue
+
+            updated = self._compact(model, fields, batch_size, using)
+            self.stdout.write(
+                "%s: compacted %d row(s)" % (model._meta.label, updated)
+            )
+
+    @staticmethod
+    def _compact(model, fields, batch_size: int, using: str) -> int:
+        """Compacts all rows of the specified model in primary key ordered
+        batches.
+
+        Returns:
+            The amount of rows that were changed.
+        """
+
+        quote_name = connections[using].ops.quote_name
+
+        assignments = []
+        conditions = []
+        params = []
+
+        for field in fields:
+            column = quote_name(field.column)
+            empty_keys = (
+                "SELECT key FROM each(%s) WHERE (value IS NULL OR value = '') "
+                "AND NOT key = ANY(%%s)"
+            ) % column
+
+            assignments.append(
+                "%s = delete(%s, ARRAY(%s))" % (column, column, empty_keys)
+            )
+            conditions.append("EXISTS(%s)" % empty_keys)
+            params.append(list(field.required))
+
+        return update_in_batches(
+            model,
+            assignments,
+            conditions,
+            # the assignments and conditions use the same parameters
+            params + params,
+            batch_size,
+            using,
+        )
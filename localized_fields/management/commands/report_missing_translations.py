@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+
+from ...analytics import get_translation_coverage
+from ...util import get_localized_fields
+
+
+class Command(BaseCommand):
+    """Reports how many rows of :see:LocalizedField's are missing a
+    translation."""
+
+    help = "Reports per model, field and language how many rows are missing a translation and fall back to another language."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "labels",
+            nargs="*",
+            help="Optional app labels (myapp) or model labels (myapp.MyModel) to report on.",
+        )
+
+        parser.add_argument(
+            "--language",
+            "-l",
+            action="append",
+            dest="languages",
+            help="Optional language to report on, can be specified multiple times.",
+        )
+
+        parser.add_argument(
+            "--using",
+            "-u",
+            help="Optional name of the database connection to use.",
+            default="default",
+        )
+
+    def handle(self, labels, languages, using: str, *args, **kwargs):
+        for model, fields in get_localized_fields(labels):
+            coverages = get_translation_coverage(
+                model._base_manager.using(using),
+                fields=[field.name for field in fields],
+                languages=languages,
+            )
+
+            # every model is reported as soon as its table
+            # was scanned, large tables can take a while
+            for coverage in coverages:
+                self.stdout.write(
+                    "%s.%s [%s]: %d of %d row(s) missing, %d fall back, %d without any value"
+                    % (
+                        model._meta.label,
+                        coverage.field.name,
+                        coverage.language,
+                        coverage.missing,
+                        coverage.rows,
+                        coverage.fallbacks,
+                        coverage.misses,
+                    )
+                )
+                self.stdout.flush()
@@ -2,6 +2,8 @@ from django.conf import settings
 from django.db import transaction
 from django.db.utils import IntegrityError
 
+from . import instrumentation
+
 
 class AtomicSlugRetryMixin:
     """Makes :see:LocalizedUniqueSlugField work by retrying upon violation of
@@ -31,4 +33,10 @@ class AtomicSlugRetryMixin:
                     raise ex
 
         self.retries += 1
+
+        if instrumentation.enabled:
+            instrumentation.increment(
+                instrumentation.SLUG_RETRY, model=self._meta.label
+            )
+
         return self.save()
@@ -0,0 +1,394 @@
+from typing import Dict
+
+from django.db import migrations
+from django.db.backends.utils import truncate_name
+
+from .fields import LocalizedFieldStorage
+
+
+class AlterLocalizedFieldStorage(migrations.AlterField):
+    """Changes the storage of a :see:LocalizedField from hstore to JSONB or
+    the other way around.
+
+    Use this instead of the `AlterField` operation that
+    `makemigrations` generates when changing the `storage_type`
+    option of a field. Besides changing the column type, it
+    converts all values in a single table rewrite:
+
+        - Values of typed fields, such as :see:LocalizedIntegerField,
+          become native JSON numbers and booleans. Values that cannot be
+          converted are dropped.
+
+        - Languages without a value are dropped from JSONB, because a
+          JSON null would not satisfy the constraints on required
+          languages.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        to_model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(
+            schema_editor.connection.alias, to_model
+        ):
+            return
+
+        from_model = from_state.apps.get_model(app_label, self.model_name)
+        from_field = from_model._meta.get_field(self.name)
+        to_field = to_model._meta.get_field(self.name)
+
+        if from_field.storage_type != to_field.storage_type:
+            self._convert(schema_editor, to_model, to_field)
+
+            # let the regular operation deal with everything
+            # else that changed, the column type is done
+            from_field = from_field.clone()
+            from_field.storage_type = to_field.storage_type
+            from_field.set_attributes_from_name(self.name)
+            from_field.model = from_model
+
+        schema_editor.alter_field(from_model, from_field, to_field)
+
+    def describe(self):
+        return "Alter storage of field %s on %s" % (self.name, self.model_name)
+
+    @staticmethod
+    def _convert(schema_editor, model, field):
+        """Converts the column of the specified field to the field's storage.
+
+        A temporary function is used to convert the values,
+        because PostgreSQL does not allow sub queries in
+        the USING clause of ALTER COLUMN.
+        """
+
+        quote_name = schema_editor.quote_name
+
+        if field.storage_type == LocalizedFieldStorage.JSONB:
+            function_sql = (
+                "CREATE FUNCTION pg_temp.localized_fields_convert(hstore) "
+                "RETURNS jsonb AS $$ "
+                "SELECT coalesce(jsonb_strip_nulls(jsonb_object_agg(key, %s)), '{}'::jsonb) "
+                "FROM each($1) "
+                "$$ LANGUAGE SQL IMMUTABLE STRICT"
+            ) % (field.jsonb_value_sql % dict(value="value"))
+        else:
+            function_sql = (
+                "CREATE FUNCTION pg_temp.localized_fields_convert(jsonb) "
+                "RETURNS hstore AS $$ "
+                "SELECT coalesce(hstore(array_agg(key), array_agg(value)), ''::hstore) "
+                "FROM jsonb_each_text($1) "
+                "$$ LANGUAGE SQL IMMUTABLE STRICT"
+            )
+
+        schema_editor.execute(function_sql)
+        schema_editor.execute(
+            "ALTER TABLE %s ALTER COLUMN %s TYPE %s USING pg_temp.localized_fields_convert(%s)"
+            % (
+                quote_name(model._meta.db_table),
+                quote_name(field.column),
+                field.db_type(schema_editor.connection),
+                quote_name(field.column),
+            )
+        )
+        schema_editor.execute("DROP FUNCTION pg_temp.localized_fields_convert")
+
+
+class PopulateLocalizedField(migrations.operations.base.Operation):
+    """Fills a :see:LocalizedField from existing columns, such as one column
+    per language (`title_en`, `title_nl`) or a plain `CharField`.
+
+    The values are copied in SQL, in primary key ordered
+    batches, instead of loading and saving every row. Only
+    rows in which the localized field is still NULL are
+    filled, so add the field with `null=True` first. Make
+    the migration non-atomic (`atomic = False`) to commit
+    every batch separately, an interrupted migration then
+    continues where it stopped when it's ran again.
+
+    With `dual_write`, a trigger keeps the localized field
+    in sync with the existing columns until it's removed with
+    :see:RemoveLocalizedFieldDualWrite, so that the existing
+    columns can still be written while the new code is
+    being deployed.
+    """
+
+    reduces_to_sql = False
+
+    def __init__(
+        self,
+        model_name: str,
+        name: str,
+        columns: Dict[str, str],
+        batch_size: int = 1000,
+        dual_write: bool = False,
+    ):
+        """Initializes a new instance of :see:PopulateLocalizedField.
+
+        Arguments:
+            model_name:
+                The name of the model to populate the field of.
+
+            name:
+                The name of the :see:LocalizedField to populate.
+
+            columns:
+                The names of the fields to copy the values from,
+                per language. For example: {"en": "title_en"}.
+
+            batch_size:
+                The amount of rows to update in a single statement.
+
+            dual_write:
+                Whether to keep the localized field in sync with
+                the fields it's populated from.
+        """
+
+        self.model_name = model_name
+        self.name = name
+        self.columns = columns
+        self.batch_size = batch_size
+        self.dual_write = dual_write
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+
+        if self.dual_write:
+            _create_dual_write(schema_editor, model, self.name, self.columns)
+
+        field = model._meta.get_field(self.name)
+        quote_name = schema_editor.quote_name
+        table = quote_name(model._meta.db_table)
+        pk = quote_name(model._meta.pk.column)
+
+        column = quote_name(field.column)
+
+        sql = (
+            "WITH batch AS (SELECT %s FROM %s WHERE %s IS NULL AND %s >= %%s ORDER BY %s LIMIT %%s) "
+            "UPDATE %s SET %s = %s FROM batch WHERE %s.%s = batch.%s RETURNING %s.%s"
+        ) % (
+            pk,
+            table,
+            column,
+            pk,
+            pk,
+            table,
+            column,
+            _get_value_sql(schema_editor, model, field, self.columns, table),
+            table,
+            pk,
+            pk,
+            table,
+            pk,
+        )
+
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT min(%s) FROM %s WHERE %s IS NULL" % (pk, table, column)
+            )
+            last_pk = cursor.fetchone()[0]
+
+        # every batch is committed on its own when the migration
+        # is not atomic, rows that were filled are skipped when
+        # the migration is ran again after being interrupted
+        while last_pk is not None:
+            with schema_editor.connection.cursor() as cursor:
+                cursor.execute(sql, [last_pk, self.batch_size])
+                last_pk = max(
+                    (row[0] for row in cursor.fetchall()), default=None
+                )
+
+    def database_backwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+
+        if self.dual_write:
+            _drop_dual_write(schema_editor, model, self.name)
+
+    def describe(self):
+        return "Populate localized field %s on %s from %s" % (
+            self.name,
+            self.model_name,
+            ", ".join(self.columns.values()),
+        )
+
+
+class RemoveLocalizedFieldDualWrite(migrations.operations.base.Operation):
+    """Stops keeping a :see:LocalizedField in sync with the columns it was
+    populated from by :see:PopulateLocalizedField."""
+
+    reduces_to_sql = False
+
+    def __init__(self, model_name: str, name: str, columns: Dict[str, str]):
+        """Initializes a new instance of
+        :see:RemoveLocalizedFieldDualWrite.
+
+        Arguments:
+            model_name:
+                The name of the model the field is on.
+
+            name:
+                The name of the :see:LocalizedField.
+
+            columns:
+                The names of the fields the localized field was
+                populated from, used to revert this operation.
+        """
+
+        self.model_name = model_name
+        self.name = name
+        self.columns = columns
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            _drop_dual_write(schema_editor, model, self.name)
+
+    def database_backwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            _create_dual_write(schema_editor, model, self.name, self.columns)
+
+    def describe(self):
+        return "Remove dual write of localized field %s on %s" % (
+            self.name,
+            self.model_name,
+        )
+
+
+def _get_value_sql(
+    schema_editor, model, field, columns: Dict[str, str], table: str
+) -> str:
+    """Gets the SQL expression that builds the value of the specified
+    :see:LocalizedField from the specified columns of a row of the specified
+    table (or `NEW` in a trigger)."""
+
+    quote_name = schema_editor.quote_name
+
+    languages = []
+    values = []
+    for language, name in columns.items():
+        languages.append(schema_editor.quote_value(language))
+        values.append(
+            "%s.%s::text"
+            % (table, quote_name(model._meta.get_field(name).column))
+        )
+
+    if field.storage_type == LocalizedFieldStorage.JSONB:
+        return "jsonb_strip_nulls(jsonb_build_object(%s))" % ", ".join(
+            "%s, %s"
+            % (
+                language,
+                field.jsonb_value_sql % dict(value="nullif(%s, '')" % value),
+            )
+            for language, value in zip(languages, values)
+        )
+
+    return "hstore(ARRAY[%s], ARRAY[%s])" % (
+        ", ".join(languages),
+        ", ".join(values),
+    )
+
+
+def _get_dual_write_name(schema_editor, model, name: str) -> str:
+    """Gets the name of the trigger and function that keep the specified
+    field in sync."""
+
+    return truncate_name(
+        "%s_%s_dual_write"
+        % (model._meta.db_table, model._meta.get_field(name).column),
+        schema_editor.connection.ops.max_name_length(),
+    )
+
+
+def _create_dual_write(
+    schema_editor, model, name: str, columns: Dict[str, str]
+):
+    """Creates a trigger that copies the values of the specified columns into
+    the specified :see:LocalizedField whenever a row is inserted with a value
+    in one of the columns or one of the columns is changed."""
+
+    field = model._meta.get_field(name)
+    quote_name = schema_editor.quote_name
+
+    trigger_name = quote_name(_get_dual_write_name(schema_editor, model, name))
+    column = "NEW.%s" % quote_name(field.column)
+
+    insert_sqls = []
+    update_sqls = []
+
+    for language, column_name in columns.items():
+        source = quote_name(model._meta.get_field(column_name).column)
+        value_sql = _get_value_sql(
+            schema_editor, model, field, {language: column_name}, "NEW"
+        )
+
+        if field.storage_type == LocalizedFieldStorage.JSONB:
+            # the key is removed when the column became NULL
+            assignment_sql = "%s := (coalesce(%s, '{}'::jsonb) - %s) || %s" % (
+                column,
+                column,
+                schema_editor.quote_value(language),
+                value_sql,
+            )
+        else:
+            assignment_sql = "%s := coalesce(%s, ''::hstore) || %s" % (
+                column,
+                column,
+                value_sql,
+            )
+
+        # columns that are NULL when a row is inserted or that were not
+        # changed are left alone, so that new code that only writes the
+        # localized field is not overwritten with the old values
+        insert_sqls.append(
+            "IF NEW.%s IS NOT NULL THEN %s; END IF;" % (source, assignment_sql)
+        )
+        update_sqls.append(
+            "IF NEW.%s IS DISTINCT FROM OLD.%s THEN %s; END IF;"
+            % (source, source, assignment_sql)
+        )
+
+    schema_editor.execute(
+        "CREATE OR REPLACE FUNCTION %s() RETURNS trigger AS $$ "
+        "BEGIN IF TG_OP = 'INSERT' THEN %s ELSE %s END IF; RETURN NEW; END "
+        "$$ LANGUAGE plpgsql"
+        % (trigger_name, " ".join(insert_sqls), " ".join(update_sqls))
+    )
+    schema_editor.execute(
+        "CREATE TRIGGER %s BEFORE INSERT OR UPDATE OF %s ON %s "
+        "FOR EACH ROW EXECUTE PROCEDURE %s()"
+        % (
+            trigger_name,
+            ", ".join(
+                quote_name(model._meta.get_field(column_name).column)
+                for column_name in columns.values()
+            ),
+            quote_name(model._meta.db_table),
+            trigger_name,
+        )
+    )
+
+
+def _drop_dual_write(schema_editor, model, name: str):
+    """Drops the trigger created by :see:_create_dual_write."""
+
+    trigger_name = schema_editor.quote_name(
+        _get_dual_write_name(schema_editor, model, name)
+    )
+
+    schema_editor.execute(
+        "DROP TRIGGER IF EXISTS %s ON %s"
+        % (trigger_name, schema_editor.quote_name(model._meta.db_table))
+    )
+    schema_editor.execute("DROP FUNCTION IF EXISTS %s()" % trigger_name)
@@ -0,0 +1,232 @@
+import base64
+import json
+
+from collections.abc import Sequence
+from typing import Optional
+
+from django.conf import settings
+from django.core.paginator import InvalidPage
+from django.db.models import BooleanField, F, Func, Value
+from django.utils import translation
+
+from .expressions import LocalizedCollate, LocalizedOrderBy
+from .lookups import TranslatedRefLookup
+from .util import get_language_collation
+
+
+class InvalidCursor(InvalidPage):
+    """The cursor that was specified could not be decoded."""
+
+
+class KeysetAfter(Func):
+    """Expression that is true for rows that come after the specified sort
+    value and primary key, as a single row comparison that can use an index
+    on the sort value."""
+
+    output_field = BooleanField()
+
+    def __init__(self, expression, value, pk):
+        super().__init__(expression, F("pk"), Value(value), Value(pk))
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sqls = []
+        params = []
+
+        for expression in self.get_source_expressions():
+            sql, expression_params = compiler.compile(expression)
+            sqls.append(sql)
+            params.extend(expression_params)
+
+        return "((%s, %s) > (%s, %s))" % tuple(sqls), params
+
+
+class IsNull(Func):
+    """Expression that is true for rows in which the expression is NULL, or
+    is not NULL when negated."""
+
+    output_field = BooleanField()
+
+    def __init__(self, expression, negated: bool = False):
+        super().__init__(expression)
+        self.template = (
+            "(%(expressions)s IS NOT NULL)"
+            if negated
+            else "(%(expressions)s IS NULL)"
+        )
+
+
+class LocalizedKeysetPage(Sequence):
+    """A single page of a :see:LocalizedKeysetPaginator."""
+
+    def __init__(
+        self, object_list: list, next_cursor: Optional[str], language: str
+    ):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.language = language
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __repr__(self) -> str:
+        return "<LocalizedKeysetPage %s>" % self.next_cursor
+
+
+class LocalizedKeysetPaginator:
+    """Paginates a query set by the value of a :see:LocalizedField in a
+    single language, using keyset pagination instead of offsets.
+
+    Every page is selected with a `(value, pk) > (%s, %s)`
+    predicate on the last row of the previous page, so that
+    deep pages cost the same as the first page, as long as
+    there's a matching index, see :see:LocalizedCollatedIndex.
+
+    Rows without a value in the language come after all
+    the rows with a value, ordered by their primary key.
+    """
+
+    def __init__(
+        self,
+        queryset,
+        field_name: str,
+        per_page: int,
+        language: Optional[str] = None,
+        translated: bool = False,
+    ):
+        """Initializes a new instance of :see:LocalizedKeysetPaginator.
+
+        Arguments:
+            queryset:
+                The query set to paginate, its ordering
+                is replaced.
+
+            field_name:
+                The name of the :see:LocalizedField to
+                order the rows by.
+
+            per_page:
+                The maximum amount of rows on a page.
+
+            language:
+                The language to order by, the active language
+                is used when not specified.
+
+            translated:
+                Whether to order by the value in the first
+                fallback language that has a value, like the
+                `translated_ref` lookup, instead of the value in
+                the language only.
+        """
+
+        self.queryset = queryset
+        self.field_name = field_name
+        self.per_page = per_page
+        self.language = (
+            language or translation.get_language() or settings.LANGUAGE_CODE
+        )
+        self.translated = translated
+
+    def get_page(self, cursor: Optional[str] = None) -> LocalizedKeysetPage:
+        """Gets the page that starts after the specified cursor, or the first
+        page if no cursor is specified.
+
+        Raises:
+            InvalidCursor:
+                When the cursor is not a cursor created
+                by this paginator.
+        """
+
+        language, value, pk = self.language, None, None
+        if cursor:
+            language, value, pk = self.decode_cursor(cursor)
+
+        # the cursor keeps the language that the first page was
+        # ordered by, so that all pages use the same ordering
+        with translation.override(language):
+            expression = self._get_sort_expression(language)
+            limit = self.per_page + 1
+
+            rows = []
+            if not cursor or value is not None:
+                queryset = self.queryset.filter(
+                    IsNull(expression, negated=True)
+                )
+                if cursor:
+                    queryset = queryset.filter(
+                        KeysetAfter(expression, value, pk)
+                    )
+
+                rows = list(
+                    queryset.annotate(localized_keyset_value=expression)
+                    .order_by(expression.asc(), "pk")
+                    .values_list("localized_keyset_value", "pk")[:limit]
+                )
+
+            if len(rows) < limit:
+                queryset = self.queryset.filter(IsNull(expression))
+                if cursor and value is None:
+                    queryset = queryset.filter(pk__gt=pk)
+
+                rows.extend(
+                    (None, row_pk)
+                    for row_pk in queryset.order_by("pk").values_list(
+                        "pk", flat=True
+                    )[: limit - len(rows)]
+                )
+
+        next_cursor = None
+        if len(rows) > self.per_page:
+            rows = rows[: self.per_page]
+            next_cursor = self.encode_cursor(language, *rows[-1])
+
+        objects = self.queryset.in_bulk([row_pk for _, row_pk in rows])
+        return LocalizedKeysetPage(
+            [objects[row_pk] for _, row_pk in rows], next_cursor, language
+        )
+
+    @staticmethod
+    def encode_cursor(language: str, value: Optional[str], pk) -> str:
+        """Encodes the position after a row into an opaque cursor."""
+
+        if not isinstance(pk, (int, str)):
+            pk = str(pk)
+
+        data = json.dumps([language, value, pk], separators=(",", ":"))
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str):
+        """Decodes a cursor that was created by :see:encode_cursor.
+
+        Returns:
+            A tuple of the language, sort value
+            and primary key.
+        """
+
+        try:
+            data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            language, value, pk = json.loads(data.decode())
+        except (TypeError, ValueError):
+            raise InvalidCursor("Invalid cursor: %s" % cursor)
+
+        return language, value, pk
+
+    def _get_sort_expression(self, language: str):
+        """Gets the expression to order the rows by."""
+
+        if not self.translated:
+            return LocalizedOrderBy(self.field_name, language)
+
+        expression = TranslatedRefLookup(F(self.field_name))
+
+        collation = get_language_collation(language)
+        if collation:
+            expression = LocalizedCollate(expression, collation)
+
+        return expression
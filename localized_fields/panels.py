@@ -0,0 +1,30 @@
+from debug_toolbar.panels import Panel
+
+from . import instrumentation
+from .debug import get_activity
+
+
+class LocalizedFieldsPanel(Panel):
+    """Django Debug Toolbar panel that shows the activity of localized fields
+    during the request."""
+
+    title = "Localized fields"
+    template = "localized_fields/debug_toolbar/panel.html"
+
+    @property
+    def nav_subtitle(self):
+        stats = self.get_stats()
+        if not stats:
+            return ""
+
+        return "%d values loaded, %d fallbacks" % (
+            stats["values_loaded"],
+            sum(count for *_, count in stats["fallbacks"]),
+        )
+
+    def process_request(self, request):
+        with instrumentation.collect() as sink:
+            response = super().process_request(request)
+
+        self.record_stats(get_activity(sink))
+        return response
@@ -1,10 +1,35 @@
 (function($) {
+    // loads the value of a pane that is rendered without it, the
+    // inner widget is only added once loaded, so that panes that
+    // were never opened are not posted and keep their value
+    var loadPane = function($pane) {
+        var url = $pane.attr('data-deferred-url');
+        if (!url || $pane.attr('data-deferred-loading')) {
+            return;
+        }
+
+        $pane.attr('data-deferred-loading', 'true');
+        $.getJSON(url, function(data) {
+            var template = $pane.children('template')[0];
+            $pane.append(document.importNode(template.content, true));
+            $pane.find('textarea, input, select').val(data.value === null ? '' : data.value);
+            $pane.removeAttr('data-deferred-url');
+        }).always(function() {
+            $pane.removeAttr('data-deferred-loading');
+        });
+    }
+
+    var showPane = function($pane) {
+        $pane.show();
+        loadPane($pane);
+    }
+
     var syncTabs = function(lang) {
         $('.localized-fields-widget.tab label:contains("'+lang+'")').each(function(){
             $(this).parents('.localized-fields-widget[role="tabs"]').find('.localized-fields-widget.tab').removeClass('active');
             $(this).parents('.localized-fields-widget.tab').addClass('active');
             $(this).parents('.localized-fields-widget[role="tabs"]').children('.localized-fields-widget [role="tabpanel"]').hide();
-            $('#'+$(this).attr('for')).show();
+            showPane($('#'+$(this).attr('for')));
         });
     }
 
@@ -13,7 +38,7 @@
         // set first tab as active
         $('.localized-fields-widget[role="tabs"]').each(function () {
             $(this).find('.localized-fields-widget.tab:first').addClass('active');
-            $('#'+$(this).find('.localized-fields-widget.tab:first label').attr('for')).show();
+            showPane($('#'+$(this).find('.localized-fields-widget.tab:first label').attr('for')));
         });
         // try set active last selected tab
         if (window.sessionStorage) {
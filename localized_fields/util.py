@@ -1,6 +1,10 @@
-from typing import List
+import time
 
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from django.apps import apps
 from django.conf import settings
+from django.db import connections, models, transaction
 
 
 def get_language_codes() -> List[str]:
@@ -18,6 +22,57 @@ def get_language_codes() -> List[str]:
     return [lang_code for lang_code, _ in settings.LANGUAGES]
 
 
+def get_language_table(
+    languages: Optional[Iterable[str]] = None,
+) -> List[Tuple[str, str]]:
+    """Gets a list of (lang_code, lang_name) tuples.
+
+    Arguments:
+        languages:
+            Optional list of language codes to restrict
+            the table to. The order of this list is kept.
+            When not specified, all the languages in your
+            project's settings.LANGUAGES are returned.
+
+    Returns:
+        A list of (lang_code, lang_name) tuples.
+    """
+
+    if languages is None:
+        return list(settings.LANGUAGES)
+
+    names = dict(settings.LANGUAGES)
+    return [
+        (lang_code, names.get(lang_code, lang_code)) for lang_code in languages
+    ]
+
+
+def get_primary_language(languages: Optional[Iterable[str]] = None) -> str:
+    """Gets the language that is considered the primary language.
+
+    This is settings.LANGUAGE_CODE, unless a list of
+    languages is specified that does not contain it. In
+    that case, the first language in the list is used.
+    """
+
+    if languages is None or settings.LANGUAGE_CODE in languages:
+        return settings.LANGUAGE_CODE
+
+    return next(iter(languages))
+
+
+def get_language_collation(language: str) -> Optional[str]:
+    """Gets the collation to sort values in the specified language with.
+
+    This looks at your project's
+    settings.LOCALIZED_FIELDS_COLLATIONS, None
+    means the database's default collation.
+    """
+
+    collations = getattr(settings, "LOCALIZED_FIELDS_COLLATIONS", None) or {}
+    return collations.get(language)
+
+
 def resolve_object_property(obj, path: str):
     """Resolves the value of a property on an object.
 
@@ -39,3 +94,144 @@ def resolve_object_property(obj, path: str):
         value = getattr(value, path_part)
 
     return value
+
+
+def get_localized_fields(
+    labels: Optional[Iterable[str]] = None,
+) -> List[Tuple[models.Model, List[models.Field]]]:
+    """Gets all concrete models that have localized fields.
+
+    Arguments:
+        labels:
+            Optional list of app labels (`myapp`) or model
+            labels (`myapp.MyModel`) to restrict the search to.
+            When not specified, all installed apps are searched.
+
+    Returns:
+        A list of (model, fields) tuples where `fields` are
+        the :see:LocalizedField's declared on the model.
+    """
+
+    # imported here because the fields depend on this module
+    from .fields import LocalizedField
+
+    if labels:
+        candidates = []
+        for label in labels:
+            if "." in label:
+                candidates.append(apps.get_model(label))
+            else:
+                candidates.extend(apps.get_app_config(label).get_models())
+    else:
+        candidates = apps.get_models()
+
+    result = []
+    for model in candidates:
+        if model._meta.proxy or not model._meta.managed:
+            continue
+
+        fields = [
+            field
+            for field in model._meta.local_concrete_fields
+            if isinstance(field, LocalizedField)
+        ]
+
+        if fields:
+            result.append((model, fields))
+
+    return result
+
+
+def update_in_batches(
+    model,
+    assignments: List[str],
+    conditions: List[str],
+    params: list,
+    batch_size: int,
+    using: str = "default",
+    start_after=None,
+    sleep: float = 0,
+    progress: Optional[Callable[[int, object], None]] = None,
+) -> int:
+    """Updates all rows of the specified model that match any of the
+    specified conditions, in primary key ordered batches.
+
+    Every batch is a separate statement in its own
+    transaction, so that no long locks are held and an
+    interrupted run can be resumed after the last primary
+    key of the last batch.
+
+    Arguments:
+        model:
+            The model to update the rows of.
+
+        assignments:
+            The SQL of the `column = value` assignments.
+
+        conditions:
+            The SQL of the conditions, of which at least
+            one has to be true for a row to be updated.
+
+        params:
+            The parameters of the assignments,
+            followed by those of the conditions.
+
+        batch_size:
+            The amount of rows to update in a single statement.
+
+        using:
+            The name of the database connection to use.
+
+        start_after:
+            Optional primary key to start after.
+
+        sleep:
+            Amount of seconds to wait between batches.
+
+        progress:
+            Optional function that is called after every
+            batch, with the amount of rows that were changed
+            so far and the last primary key of the batch.
+
+    Returns:
+        The amount of rows that were changed.
+    """
+
+    connection = connections[using]
+    quote_name = connection.ops.quote_name
+
+    sql = "UPDATE %s SET %s WHERE (%s) AND %s = ANY(%%s)" % (
+        quote_name(model._meta.db_table),
+        ", ".join(assignments),
+        " OR ".join(conditions),
+        quote_name(model._meta.pk.column),
+    )
+
+    queryset = model._base_manager.using(using).order_by("pk")
+
+    updated = 0
+    last_pk = start_after
+
+    while True:
+        batch = queryset
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+
+        pks = list(batch.values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            break
+
+        with transaction.atomic(using=using):
+            with connection.cursor() as cursor:
+                cursor.execute(sql, list(params) + [pks])
+                updated += cursor.rowcount
+
+        last_pk = pks[-1]
+
+        if progress:
+            progress(updated, last_pk)
+
+        if sleep:
+            time.sleep(sleep)
+
+    return updated
@@ -1,17 +1,47 @@
 from collections.abc import Iterable
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Type
 
 import deprecation
 
 from django.conf import settings
 from django.utils import translation
 
+from . import instrumentation
+from .util import get_language_codes, get_primary_language
+
+_language_bound_classes: Dict[Tuple[type, Tuple[str, ...]], type] = {}
+
+
+def _restore_language_bound_value(base_class, languages, keys):
+    """Re-creates a pickled value of a class that was created through
+    :see:LocalizedValue.with_languages."""
+
+    return base_class.with_languages(languages)(keys)
+
+
+def _reduce_language_bound_value(value):
+    """Pickles a value of a class that was created through
+    :see:LocalizedValue.with_languages.
+
+    Those classes cannot be looked up by name, so they
+    are re-created when unpickling.
+    """
+
+    return (
+        _restore_language_bound_value,
+        (value._base_class, value.languages, dict(value)),
+    )
+
 
 class LocalizedValue(dict):
     """Represents the value of a :see:LocalizedField."""
 
     default_value = None
 
+    # The languages this value holds. None means all
+    # the languages in settings.LANGUAGES.
+    languages: Optional[Tuple[str, ...]] = None
+
     def __init__(self, keys: dict = None):
         """Initializes a new instance of :see:LocalizedValue.
 
@@ -25,6 +55,92 @@ class LocalizedValue(dict):
         super().__init__({})
         self._interpret_value(keys)
 
+        if instrumentation.enabled:
+            instrumentation.increment(
+                instrumentation.VALUE_CREATED, type=type(self).__name__
+            )
+
+    @classmethod
+    def from_db(cls, value: dict) -> "LocalizedValue":
+        """Creates a new instance from a dictionary that was loaded from the
+        database.
+
+        This skips interpreting the value the way the
+        constructor does, the dictionary is known to
+        map language codes to values.
+
+        Arguments:
+            value:
+                The dictionary to create the instance from.
+        """
+
+        language_codes = (
+            cls.languages if cls.languages is not None else get_language_codes()
+        )
+
+        instance = dict.__new__(cls)
+        dict.update(
+            instance,
+            (
+                (lang_code, value.get(lang_code, cls.default_value))
+                for lang_code in language_codes
+            ),
+        )
+        instance.__dict__.update(instance)
+
+        # values from the database are counted once, as loaded values
+        return instance
+
+    @classmethod
+    def with_languages(
+        cls, languages: Optional[Sequence[str]]
+    ) -> Type["LocalizedValue"]:
+        """Gets a version of this class that only holds the specified
+        languages.
+
+        The created classes are cached, so calling this
+        repeatedly with the same languages is cheap.
+
+        Arguments:
+            languages:
+                The language codes to hold. When None,
+                this class itself is returned.
+        """
+
+        if languages is None:
+            return cls
+
+        languages = tuple(languages)
+        if cls.languages == languages:
+            return cls
+
+        base_class = cls.__dict__.get("_base_class", cls)
+        key = (base_class, languages)
+
+        bound_class = _language_bound_classes.get(key)
+        if not bound_class:
+            bound_class = type(
+                base_class.__name__,
+                (base_class,),
+                dict(
+                    languages=languages,
+                    _base_class=base_class,
+                    __module__=base_class.__module__,
+                    __reduce__=_reduce_language_bound_value,
+                ),
+            )
+            _language_bound_classes[key] = bound_class
+
+        return bound_class
+
+    def language_codes(self) -> List[str]:
+        """Gets the codes of all languages this value holds."""
+
+        if self.languages is not None:
+            return list(self.languages)
+
+        return get_language_codes()
+
     def get(self, language: str = None, default: str = None) -> str:
         """Gets the underlying value in the specified or primary language.
 
@@ -38,7 +154,7 @@ class LocalizedValue(dict):
             was specified.
         """
 
-        language = language or settings.LANGUAGE_CODE
+        language = language or get_primary_language(self.languages)
         value = super().get(language, default)
         return value if value is not None else default
 
@@ -87,17 +203,19 @@ class LocalizedValue(dict):
                 The value to interpret.
         """
 
-        for lang_code, _ in settings.LANGUAGES:
+        language_codes = self.language_codes()
+
+        for lang_code in language_codes:
             self.set(lang_code, self.default_value)
 
         if callable(value):
             value = value()
 
         if isinstance(value, str):
-            self.set(settings.LANGUAGE_CODE, value)
+            self.set(get_primary_language(self.languages), value)
 
         elif isinstance(value, dict):
-            for lang_code, _ in settings.LANGUAGES:
+            for lang_code in language_codes:
                 lang_value = value.get(lang_code, self.default_value)
                 self.set(lang_code, lang_value)
 
@@ -119,27 +237,70 @@ class LocalizedValue(dict):
             in one of the fallback languages.
         """
 
+        primary_language = get_primary_language(self.languages)
         target_language = (
-            language or translation.get_language() or settings.LANGUAGE_CODE
+            language or translation.get_language() or primary_language
         )
 
         fallback_config = getattr(settings, "LOCALIZED_FIELDS_FALLBACKS", {})
 
-        target_languages = fallback_config.get(
-            target_language, [settings.LANGUAGE_CODE]
+        target_languages = [target_language] + list(
+            fallback_config.get(target_language, [primary_language])
         )
 
-        for lang_code in [target_language] + target_languages:
+        # values that only hold a subset of the languages can only
+        # fall back to those, the same way the `translated_ref` lookup does
+        if self.languages is not None:
+            target_languages = [
+                lang_code
+                for lang_code in target_languages
+                if lang_code in self.languages
+            ] or [primary_language]
+
+        for lang_code in target_languages:
             value = self.get(lang_code)
-            if value:
-                return value or None
+            if self._has_value(value):
+                if instrumentation.enabled:
+                    self._report_translation(target_language, lang_code)
+
+                return value
+
+        if instrumentation.enabled:
+            self._report_translation(target_language, None)
 
         return None
 
+    @staticmethod
+    def _has_value(value) -> bool:
+        """Gets whether the specified value of a language is a value, or
+        whether :see:translate should fall back to another language."""
+
+        return bool(value)
+
+    @staticmethod
+    def _report_translation(language: str, used_language: Optional[str]):
+        """Reports which language was used to translate into the specified
+        language, None when no language had a value."""
+
+        if used_language == language:
+            instrumentation.increment(
+                instrumentation.TRANSLATE_HIT, language=language
+            )
+        elif used_language:
+            instrumentation.increment(
+                instrumentation.TRANSLATE_FALLBACK,
+                language=language,
+                fallback=used_language,
+            )
+        else:
+            instrumentation.increment(
+                instrumentation.TRANSLATE_MISS, language=language
+            )
+
     def is_empty(self) -> bool:
         """Gets whether all the languages contain the default value."""
 
-        for lang_code, _ in settings.LANGUAGES:
+        for lang_code in self.language_codes():
             if self.get(lang_code) != self.default_value:
                 return False
 
@@ -159,12 +320,16 @@ class LocalizedValue(dict):
             And False when they are not.
         """
 
-        if not isinstance(other, type(self)):
+        # values of a field with a subset of the languages
+        # can still be compared to values of the base class
+        if not isinstance(
+            other, getattr(type(self), "_base_class", type(self))
+        ):
             if isinstance(other, str):
                 return self.__str__() == other
             return False
 
-        for lang_code, _ in settings.LANGUAGES:
+        for lang_code in self.language_codes():
             if self.get(lang_code) != other.get(lang_code):
                 return False
 
@@ -237,18 +402,38 @@ class LocalizedFileValue(LocalizedValue):
         return self.get(translation.get_language())
 
 
-class LocalizedBooleanValue(LocalizedValue):
+class LocalizedTypedValue(LocalizedValue):
+    """Base class for values that are parsed into another type than
+    strings, of which zero and false are values as well."""
+
+    @staticmethod
+    def _has_value(value) -> bool:
+        return value is not None and value != ""
+
+
+class LocalizedBooleanValue(LocalizedTypedValue):
+    def set(self, language: str, value):
+        """Sets the value in the specified language, parsed into a boolean
+        if it is a string that represents a boolean."""
+
+        if isinstance(value, str) and value.lower() in ("true", "false"):
+            value = value.lower() == "true"
+
+        return super().set(language, value)
+
     def translate(self):
         """Gets the value in the current language, or in the configured fallbck
         language."""
 
         value = super().translate()
-        if value is None or (isinstance(value, str) and value.strip() == ""):
-            return None
-
-        if isinstance(value, bool):
+        if value is None or isinstance(value, bool):
             return value
 
+        # values are parsed when they are set, this is a value
+        # that could not be parsed or was put in directly
+        if isinstance(value, str) and value.strip() == "":
+            return None
+
         if value.lower() == "true":
             return True
         return False
@@ -266,7 +451,37 @@ class LocalizedBooleanValue(LocalizedValue):
         return str(value) if value is not None else ""
 
 
-class LocalizedNumericValue(LocalizedValue):
+class LocalizedNumericValue(LocalizedTypedValue):
+    # the type the values are parsed into
+    value_type = None
+
+    def set(self, language: str, value):
+        """Sets the value in the specified language, parsed into
+        :see:value_type if it is a string that represents a number."""
+
+        if isinstance(value, str):
+            try:
+                value = self.value_type(value)
+            except ValueError:
+                pass
+
+        return super().set(language, value)
+
+    def translate(self):
+        """Gets the value in the current language, or in the configured
+        fallback language."""
+
+        value = super().translate()
+        if value is None or type(value) is self.value_type:
+            return value
+
+        # values are parsed when they are set, this is a value
+        # that could not be parsed or was put in directly
+        if isinstance(value, str) and value.strip() == "":
+            return None
+
+        return self.value_type(value)
+
     def __int__(self):
         """Gets the value in the current language as an integer."""
         value = self.translate()
@@ -294,28 +509,11 @@ class LocalizedIntegerValue(LocalizedNumericValue):
     """All values are integers."""
 
     default_value = None
-
-    def translate(self):
-        """Gets the value in the current language, or in the configured fallbck
-        language."""
-
-        value = super().translate()
-        if value is None or (isinstance(value, str) and value.strip() == ""):
-            return None
-
-        return int(value)
+    value_type = int
 
 
 class LocalizedFloatValue(LocalizedNumericValue):
     """All values are floats."""
 
     default_value = None
-
-    def translate(self):
-        """Gets the value in the current language, or in the configured
-        fallback language."""
-        value = super().translate()
-        if value is None or (isinstance(value, str) and value.strip() == ""):
-            return None
-
-        return float(value)
+    value_type = float
@@ -1,13 +1,111 @@
 import copy
 
-from typing import List
+from typing import List, Optional
+from urllib.parse import urlencode
 
 from django import forms
 from django.conf import settings
 from django.contrib.admin import widgets
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
 
+from .util import get_language_table
 from .value import LocalizedValue
 
+# The configured inner widgets of every widget class and subset of
+# languages, that new widgets clone instead of constructing their own.
+# Cleared when settings.LANGUAGES changes, see `clear_prototypes`.
+_prototype_widgets = {}
+
+
+def clear_prototypes() -> None:
+    """Clears the cached inner widgets, so that they are re-created for the
+    current settings."""
+
+    _prototype_widgets.clear()
+
+
+def clone_widget(widget: forms.Widget, memo: Optional[dict] = None):
+    """Creates a copy of the specified widget, the same way deep copying it
+    does, but without the overhead of the copy module.
+
+    Widgets that copy themselves differently
+    are deep copied as usual.
+    """
+
+    if type(widget).__deepcopy__ is not forms.Widget.__deepcopy__:
+        return copy.deepcopy(widget, memo)
+
+    result = object.__new__(type(widget))
+    result.__dict__.update(widget.__dict__)
+    result.attrs = widget.attrs.copy()
+
+    if memo is not None:
+        memo[id(widget)] = result
+
+    return result
+
+
+def _render_attrs(attrs: dict) -> str:
+    """Renders attributes the same way django/forms/widgets/attrs.html
+    does."""
+
+    return "".join(
+        " %s" % conditional_escape(name)
+        if value is True
+        else ' %s="%s"' % (conditional_escape(name), conditional_escape(value))
+        for name, value in attrs.items()
+        if value is not False
+    )
+
+
+def _render_input(widget: forms.Widget, name: str, value, attrs: dict):
+    """Renders an input the same way django/forms/widgets/input.html
+    does."""
+
+    value = widget.format_value(value)
+
+    return mark_safe(
+        '<input type="%s" name="%s"%s%s>'
+        % (
+            conditional_escape(widget.input_type),
+            conditional_escape(name),
+            ' value="%s"' % conditional_escape(value)
+            if value is not None
+            else "",
+            _render_attrs(attrs),
+        )
+    )
+
+
+def _render_textarea(widget: forms.Widget, name: str, value, attrs: dict):
+    """Renders a text area the same way django/forms/widgets/textarea.html
+    does."""
+
+    value = widget.format_value(value)
+
+    return mark_safe(
+        '<textarea name="%s"%s>\n%s</textarea>'
+        % (
+            conditional_escape(name),
+            _render_attrs(attrs),
+            conditional_escape(value) if value else "",
+        )
+    )
+
+
+# The templates of inner widgets that are rendered without the template
+# engine when LOCALIZED_FIELDS_LIGHTWEIGHT_WIDGETS is enabled, with the
+# trailing newlines that the templates render, so the output is identical.
+_lightweight_renderers = {
+    "django/forms/widgets/email.html": (_render_input, "\n\n"),
+    "django/forms/widgets/input.html": (_render_input, "\n"),
+    "django/forms/widgets/number.html": (_render_input, "\n\n"),
+    "django/forms/widgets/text.html": (_render_input, "\n\n"),
+    "django/forms/widgets/url.html": (_render_input, "\n\n"),
+    "django/forms/widgets/textarea.html": (_render_textarea, "\n"),
+}
+
 
 class LocalizedFieldWidget(forms.MultiWidget):
     """Widget that has an input box for every language."""
@@ -15,19 +113,52 @@ class LocalizedFieldWidget(forms.MultiWidget):
     template_name = "localized_fields/multiwidget.html"
     widget = forms.Textarea
 
-    def __init__(self, *args, **kwargs):
-        """Initializes a new instance of :see:LocalizedFieldWidget."""
+    # the attributes that the attributes of the inner widgets
+    # were last built for, and the built attributes
+    _subwidget_attrs = None
 
-        initial_widgets = [copy.copy(self.widget) for _ in settings.LANGUAGES]
+    def __init__(self, *args, languages: Optional[List[str]] = None, **kwargs):
+        """Initializes a new instance of :see:LocalizedFieldWidget.
 
-        super().__init__(initial_widgets, *args, **kwargs)
+        Arguments:
+            languages:
+                Optional subset of the languages in
+                settings.LANGUAGES to render an input for.
+        """
 
-        for ((lang_code, lang_name), widget) in zip(
-            settings.LANGUAGES, self.widgets
-        ):
+        self.language_table = get_language_table(languages)
+
+        key = (type(self), tuple(languages) if languages is not None else None)
+        prototypes = _prototype_widgets.get(key)
+        if prototypes is None:
+            prototypes = _prototype_widgets[key] = self._create_widgets()
+
+        super().__init__(
+            [clone_widget(widget) for widget in prototypes], *args, **kwargs
+        )
+
+    def __deepcopy__(self, memo):
+        result = super(forms.MultiWidget, self).__deepcopy__(memo)
+        result.widgets = [clone_widget(widget, memo) for widget in self.widgets]
+        result._subwidget_attrs = None
+        return result
+
+    def _create_widgets(self) -> List[forms.Widget]:
+        """Creates the inner widget of every language."""
+
+        widgets = []
+        for lang_code, lang_name in self.language_table:
+            widget = (
+                self.widget()
+                if isinstance(self.widget, type)
+                else copy.deepcopy(self.widget)
+            )
             widget.attrs["lang"] = lang_code
             widget.lang_code = lang_code
             widget.lang_name = lang_name
+            widgets.append(widget)
+
+        return widgets
 
     def decompress(self, value: LocalizedValue) -> List[str]:
         """Decompresses the specified value so it can be spread over the
@@ -43,7 +174,7 @@ class LocalizedFieldWidget(forms.MultiWidget):
         """
 
         result = []
-        for lang_code, _ in settings.LANGUAGES:
+        for lang_code, _ in self.language_table:
             if value:
                 result.append(value.get(lang_code))
             else:
@@ -63,9 +194,13 @@ class LocalizedFieldWidget(forms.MultiWidget):
 
         final_attrs = context["widget"]["attrs"]
         input_type = final_attrs.pop("type", None)
-        id_ = final_attrs.get("id")
+        lightweight = getattr(
+            settings, "LOCALIZED_FIELDS_LIGHTWEIGHT_WIDGETS", False
+        )
         subwidgets = []
-        for i, widget in enumerate(self.widgets):
+        for i, (widget, (widget_attrs, outer_required)) in enumerate(
+            zip(self.widgets, self._get_subwidget_attrs(final_attrs))
+        ):
             if input_type is not None:
                 widget.input_type = input_type
             widget_name = "%s_%s" % (name, i)
@@ -73,14 +208,33 @@ class LocalizedFieldWidget(forms.MultiWidget):
                 widget_value = value[i]
             except IndexError:
                 widget_value = None
-            if id_:
-                widget_attrs = final_attrs.copy()
-                widget_attrs["id"] = "%s_%s" % (id_, i)
-            else:
-                widget_attrs = final_attrs
-            widget_attrs = self.build_widget_attrs(
-                widget, widget_value, widget_attrs
-            )
+
+            # whether the inner widget is required depends on its value
+            if outer_required and (
+                not widget.use_required_attribute(widget_value)
+                or not widget.is_required
+            ):
+                widget_attrs = widget_attrs.copy()
+                if "required" in widget.attrs:
+                    widget_attrs["required"] = widget.attrs["required"]
+                else:
+                    del widget_attrs["required"]
+
+            # the inner widget is rendered right away, instead of
+            # through its template, when it renders a plain input
+            renderer = lightweight and self._get_lightweight_renderer(widget)
+            if renderer:
+                render, suffix = renderer
+                html = render(widget, widget_name, widget_value, widget_attrs)
+                subwidgets.append(
+                    dict(
+                        lang_code=widget.lang_code,
+                        lang_name=widget.lang_name,
+                        html=mark_safe(html + suffix),
+                    )
+                )
+                continue
+
             widget_context = widget.get_context(
                 widget_name, widget_value, widget_attrs
             )["widget"]
@@ -91,6 +245,57 @@ class LocalizedFieldWidget(forms.MultiWidget):
         context["widget"]["subwidgets"] = subwidgets
         return context
 
+    def _get_subwidget_attrs(self, attrs: dict) -> list:
+        """Gets the attributes of every inner widget, merged with the
+        specified attributes of this widget.
+
+        They're built once and re-used for as long as this
+        widget is rendered with the same attributes,
+        a copy of this widget builds them again.
+
+        Returns:
+            The attributes of every inner widget, and whether
+            the 'required' attribute of this widget was merged
+            into them, which is left out depending on the value
+            of the inner widget.
+        """
+
+        if self._subwidget_attrs is not None:
+            cached_attrs, subwidget_attrs = self._subwidget_attrs
+            if cached_attrs == attrs:
+                return subwidget_attrs
+
+        id_ = attrs.get("id")
+        subwidget_attrs = []
+        for i, widget in enumerate(self.widgets):
+            widget_attrs = attrs
+            if id_:
+                widget_attrs = dict(attrs, id="%s_%s" % (id_, i))
+
+            subwidget_attrs.append(
+                (
+                    widget.build_attrs(widget.attrs, widget_attrs),
+                    "required" in attrs,
+                )
+            )
+
+        self._subwidget_attrs = (attrs.copy(), subwidget_attrs)
+        return subwidget_attrs
+
+    @staticmethod
+    def _get_lightweight_renderer(widget: forms.Widget):
+        """Gets the function that renders the specified inner widget without
+        the template engine, and the newlines that follow it, if it can be
+        rendered that way."""
+
+        if type(widget).get_context not in (
+            forms.Widget.get_context,
+            forms.widgets.Input.get_context,
+        ):
+            return None
+
+        return _lightweight_renderers.get(widget.template_name)
+
     @staticmethod
     def build_widget_attrs(widget, value, attrs):
         attrs = dict(attrs)  # Copy attrs to avoid modifying the argument.
@@ -119,6 +324,82 @@ class AdminLocalizedFieldWidget(LocalizedFieldWidget):
     template_name = "localized_fields/admin/widget.html"
     widget = widgets.AdminTextareaWidget
 
+    # whether the panes of languages can be loaded on demand, which
+    # requires inner widgets that always post a value, see `defer`
+    can_defer = True
+
+    deferred_languages = frozenset()
+    deferred_url = None
+    deferred_value = None
+
+    def defer(
+        self, languages: List[str], url: str, value: Optional[LocalizedValue]
+    ) -> None:
+        """Renders the panes of the specified languages without their value,
+        to be loaded from the specified URL when they're opened.
+
+        Arguments:
+            languages:
+                The languages to load on demand.
+
+            url:
+                The URL that returns the value in a language
+                as JSON, the language is added as the `language`
+                query parameter.
+
+            value:
+                The stored value, that is kept for the languages
+                that were not loaded and thus not posted.
+        """
+
+        self.deferred_languages = frozenset(languages)
+        self.deferred_url = url
+        self.deferred_value = value
+
+    def get_context(self, name, value, attrs):
+        # bound forms are rendered completely, the posted values
+        # of panes that were loaded would be lost otherwise
+        deferred_languages = (
+            self.deferred_languages if not isinstance(value, list) else ()
+        )
+
+        if deferred_languages:
+            value = [
+                None if lang_code in deferred_languages else widget_value
+                for (lang_code, _), widget_value in zip(
+                    self.language_table, self.decompress(value)
+                )
+            ]
+
+        context = super().get_context(name, value, attrs)
+
+        for subwidget in context["widget"]["subwidgets"]:
+            if subwidget["lang_code"] in deferred_languages:
+                subwidget["deferred_url"] = "%s?%s" % (
+                    self.deferred_url,
+                    urlencode(dict(language=subwidget["lang_code"])),
+                )
+
+        return context
+
+    def value_from_datadict(self, data, files, name):
+        values = super().value_from_datadict(data, files, name)
+        if not self.deferred_languages:
+            return values
+
+        for i, widget in enumerate(self.widgets):
+            if widget.lang_code not in self.deferred_languages:
+                continue
+
+            if widget.value_omitted_from_data(data, files, "%s_%s" % (name, i)):
+                values[i] = (
+                    self.deferred_value.get(widget.lang_code)
+                    if self.deferred_value
+                    else None
+                )
+
+        return values
+
 
 class AdminLocalizedBooleanFieldWidget(LocalizedFieldWidget):
     widget = forms.Select
@@ -138,6 +419,7 @@ class AdminLocalizedCharFieldWidget(AdminLocalizedFieldWidget):
 
 class AdminLocalizedFileFieldWidget(AdminLocalizedFieldWidget):
     widget = widgets.AdminFileWidget
+    can_defer = False
 
 
 class AdminLocalizedIntegerFieldWidget(AdminLocalizedFieldWidget):
@@ -81,14 +81,17 @@ setup(
     extras_require={
         ':python_version <= "3.6"': ["dataclasses"],
         "docs": ["Sphinx==2.2.0", "sphinx-rtd-theme==0.4.3"],
+        "numpy": ["numpy"],
         "test": [
             "tox==3.28.0",
             "pytest==7.0.1",
             "pytest-django==4.5.2",
             "pytest-cov==2.12.1",
+            "pytest-benchmark==4.0.0",
             "dj-database-url==0.5.0",
             "django-autoslug==1.9.9",
             "django-bleach==0.9.0",
+            "numpy",
             "psycopg2==2.9.8",
         ],
         "analysis": [
@@ -191,5 +194,28 @@ setup(
                 ]
             ],
         ),
+        "benchmark_baseline": create_command(
+            "Runs the benchmarks and saves the results as the baseline",
+            [
+                [
+                    "pytest",
+                    "-m",
+                    "benchmark",
+                    "--benchmark-save=baseline",
+                ]
+            ],
+        ),
+        "benchmark": create_command(
+            "Runs the benchmarks and fails on regressions against the last saved baseline",
+            [
+                [
+                    "pytest",
+                    "-m",
+                    "benchmark",
+                    "--benchmark-compare",
+                    "--benchmark-compare-fail=median:20%",
+                ]
+            ],
+        ),
     },
 )
@@ -0,0 +1,35 @@
+import pytest
+
+from django.conf import settings as django_settings
+
+LANGUAGE_COUNTS = [3, 10, 30]
+
+
+@pytest.fixture(params=LANGUAGE_COUNTS, ids=lambda count: "%dlangs" % count)
+def languages(request, settings):
+    """Configures the specified amount of languages, with the default language
+    first.
+
+    Returns:
+        The codes of all the configured languages.
+    """
+
+    language_codes = [django_settings.LANGUAGE_CODE] + [
+        "l%d" % index for index in range(request.param - 1)
+    ]
+
+    settings.LANGUAGES = [
+        (lang_code, lang_code.upper()) for lang_code in language_codes
+    ]
+
+    return language_codes
+
+
+def get_localized_dict(languages, value="value", index=0):
+    """Creates a dictionary with a value for each of the specified
+    languages."""
+
+    return {
+        lang_code: "%s %s %d" % (lang_code, value, index)
+        for lang_code in languages
+    }
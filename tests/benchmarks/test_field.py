@@ -0,0 +1,51 @@
+import pytest
+
+from localized_fields.fields import (
+    LocalizedBooleanField,
+    LocalizedCharField,
+    LocalizedField,
+    LocalizedFloatField,
+    LocalizedIntegerField,
+)
+
+pytestmark = pytest.mark.benchmark
+
+FIELDS = {
+    "field": (LocalizedField, lambda index: "value %d" % index),
+    "char": (LocalizedCharField, lambda index: "value %d" % index),
+    "integer": (LocalizedIntegerField, lambda index: index),
+    "float": (LocalizedFloatField, lambda index: index + 0.5),
+    "boolean": (LocalizedBooleanField, lambda index: index % 2 == 0),
+}
+
+
+@pytest.fixture(params=list(FIELDS.keys()))
+def field_and_value(request, languages):
+    """Creates a field of each type and a value for it in every language."""
+
+    field_class, make_value = FIELDS[request.param]
+
+    field = field_class(null=True, required=False)
+    field.set_attributes_from_name("value")
+
+    value = {
+        lang_code: make_value(index)
+        for index, lang_code in enumerate(languages)
+    }
+
+    return field, value
+
+
+def test_from_db_value(benchmark, field_and_value):
+    field, value = field_and_value
+
+    # values come out of the database as strings
+    db_value = {lang_code: str(val) for lang_code, val in value.items()}
+    benchmark(field.from_db_value, db_value)
+
+
+def test_get_prep_value(benchmark, field_and_value):
+    field, value = field_and_value
+
+    localized_value = field.attr_class(value)
+    benchmark(field.get_prep_value, localized_value)
@@ -0,0 +1,70 @@
+import pytest
+
+from django import forms
+
+from localized_fields.fields import LocalizedField
+from localized_fields.widgets import LocalizedFieldWidget
+
+from ..fake_model import define_fake_model
+from .conftest import get_localized_dict
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_widget_get_context(benchmark, languages):
+    widget = LocalizedFieldWidget()
+    value = get_localized_dict(languages)
+
+    benchmark(widget.get_context, "title", value, {"id": "id_title"})
+
+
+def test_form_render(benchmark, languages):
+    model = define_fake_model(
+        {
+            "title": LocalizedField(),
+            "description": LocalizedField(blank=True),
+        }
+    )
+
+    form_class = forms.modelform_factory(model, fields="__all__")
+
+    instance = model(
+        title=get_localized_dict(languages, "title"),
+        description=get_localized_dict(languages, "description"),
+    )
+
+    def _render():
+        return form_class(instance=instance).as_p()
+
+    benchmark(_render)
+
+
+def test_formset_render(benchmark, languages):
+    model = define_fake_model(
+        {
+            "title": LocalizedField(),
+            "description": LocalizedField(blank=True),
+        }
+    )
+
+    formset_class = forms.formset_factory(
+        forms.modelform_factory(model, fields="__all__"), extra=0
+    )
+
+    initial = [
+        dict(
+            title=get_localized_dict(languages, "title", index),
+            description=get_localized_dict(languages, "description", index),
+        )
+        for index in range(200)
+    ]
+
+    def _render():
+        return str(formset_class(initial=initial))
+
+    benchmark(_render)
+
+
+def test_formset_render_lightweight(benchmark, languages, settings):
+    settings.LOCALIZED_FIELDS_LIGHTWEIGHT_WIDGETS = True
+    test_formset_render(benchmark, languages)
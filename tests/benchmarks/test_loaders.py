@@ -0,0 +1,62 @@
+import pytest
+
+from django.db import connection
+
+from localized_fields.fields import LocalizedField
+from localized_fields.loaders import is_psycopg3, register_loaders
+from localized_fields.value import LocalizedValue
+
+from ..fake_model import get_fake_model
+from .conftest import get_localized_dict
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        not is_psycopg3, reason="the loader is only used with psycopg 3"
+    ),
+]
+
+ROWS = 1000
+
+
+@pytest.fixture
+def select_sql(languages):
+    model = get_fake_model({"title": LocalizedField()})
+    model.objects.bulk_create(
+        [
+            model(title=get_localized_dict(languages, "title", index))
+            for index in range(ROWS)
+        ]
+    )
+
+    return "SELECT title FROM %s" % model._meta.db_table
+
+
+def _load(sql: str, convert):
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        return [convert(value) for value, in cursor.fetchall()]
+
+
+def test_load_psycopg(benchmark, select_sql):
+    """Loads values using psycopg's hstore loader and the constructor of
+    :see:LocalizedValue, which is what happens without our loader."""
+
+    from psycopg.types.hstore import HstoreLoader
+
+    adapters = connection.connection.adapters
+    adapters.register_loader(adapters.types["hstore"].oid, HstoreLoader)
+
+    values = benchmark(_load, select_sql, LocalizedValue)
+    assert len(values) == ROWS
+
+
+def test_load_localized(benchmark, select_sql):
+    """Loads values using :see:LocalizedHStoreLoader and
+    :see:LocalizedValue.from_db."""
+
+    register_loaders(connection)
+
+    values = benchmark(_load, select_sql, LocalizedValue.from_db)
+    assert len(values) == ROWS
@@ -0,0 +1,59 @@
+import pytest
+
+from django.db import connection
+from django.utils import translation
+
+from localized_fields.expressions import LocalizedRef
+from localized_fields.fields import LocalizedField, LocalizedIntegerField
+
+from ..fake_model import define_fake_model
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture
+def model(languages):
+    return define_fake_model(
+        {
+            "title": LocalizedField(),
+            "score": LocalizedIntegerField(null=True, required=False),
+        }
+    )
+
+
+def _compile(queryset):
+    return queryset.query.get_compiler(connection=connection).as_sql()
+
+
+def test_compile_key_lookup(benchmark, model):
+    benchmark(
+        lambda: _compile(
+            model.objects.filter(title__en="title").order_by("score__en")
+        )
+    )
+
+
+def test_compile_active_language_lookup(benchmark, model):
+    with translation.override("en"):
+        benchmark(
+            lambda: _compile(model.objects.filter(title__icontains="title"))
+        )
+
+
+def test_compile_translated_ref(benchmark, model, languages, settings):
+    settings.LOCALIZED_FIELDS_FALLBACKS = {languages[-1]: languages[:-1]}
+
+    with translation.override(languages[-1]):
+        benchmark(
+            lambda: _compile(
+                model.objects.filter(title__translated_ref="title")
+            )
+        )
+
+
+def test_compile_localized_ref(benchmark, model):
+    benchmark(
+        lambda: _compile(
+            model.objects.annotate(localized_title=LocalizedRef("title"))
+        )
+    )
@@ -0,0 +1,59 @@
+import pytest
+
+from localized_fields.fields import LocalizedField, LocalizedUniqueSlugField
+
+from ..fake_model import get_fake_model
+from .conftest import get_localized_dict
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+COLLISIONS = 10
+
+
+@pytest.fixture
+def slug_model(languages):
+    return get_fake_model(
+        {
+            "title": LocalizedField(),
+            "slug": LocalizedUniqueSlugField(populate_from="title"),
+        }
+    )
+
+
+def test_bulk_create(benchmark, languages, slug_model):
+    def _setup():
+        slug_model.objects.all().delete()
+
+        objs = [
+            slug_model(title=get_localized_dict(languages, "title", index))
+            for index in range(100)
+        ]
+
+        return (objs,), {}
+
+    benchmark.pedantic(slug_model.objects.bulk_create, setup=_setup, rounds=20)
+
+
+def test_save_with_collisions(benchmark, languages, slug_model, settings):
+    """Saves a row of which the slug collides with the slugs of
+    :see:COLLISIONS other rows, which causes as many retries."""
+
+    settings.LOCALIZED_FIELDS_MAX_RETRIES = COLLISIONS
+
+    title = get_localized_dict(languages, "title")
+
+    for _ in range(COLLISIONS):
+        slug_model.objects.create(title=title)
+
+    def _setup():
+        slug_model.objects.filter(
+            pk__gt=slug_model.objects.order_by("pk")[COLLISIONS - 1].pk
+        ).delete()
+
+        return (slug_model(title=title),), {}
+
+    def _save(obj):
+        obj.save()
+        assert obj.retries == COLLISIONS
+
+    benchmark.pedantic(_save, setup=_setup, rounds=20)
@@ -0,0 +1,37 @@
+import pytest
+
+from django.utils import translation
+
+from localized_fields.value import LocalizedStringValue, LocalizedValue
+
+from .conftest import get_localized_dict
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_construct_from_dict(benchmark, languages):
+    value = get_localized_dict(languages)
+    benchmark(LocalizedValue, value)
+
+
+def test_construct_from_str(benchmark, languages):
+    benchmark(LocalizedStringValue, "value")
+
+
+def test_from_db(benchmark, languages):
+    value = get_localized_dict(languages)
+    benchmark(LocalizedValue.from_db, value)
+
+
+def test_translate(benchmark, languages, settings):
+    # the active language has no value, so the fallbacks are used
+    settings.LOCALIZED_FIELDS_FALLBACKS = {
+        languages[-1]: languages[1:-1] + [settings.LANGUAGE_CODE]
+    }
+
+    value = LocalizedValue({settings.LANGUAGE_CODE: "value"})
+
+    with translation.override(languages[-1]):
+        result = benchmark(value.translate)
+
+    assert result == "value"
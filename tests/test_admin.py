@@ -1,13 +1,22 @@
 from django.apps import apps
 from django.contrib import admin
 from django.contrib.admin.checks import check_admin_app
+from django.contrib.auth.models import User
 from django.db import models
-from django.test import TestCase
+from django.http import Http404
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import clear_url_caches, path
 
 from localized_fields.admin import LocalizedFieldsAdminMixin
 from localized_fields.fields import LocalizedField
+from localized_fields.value import LocalizedValue
 from tests.fake_model import get_fake_model
 
+# the admin of the deferred panes tests, registered when the model
+# has been created, see :see:LocalizedFieldsAdminDeferredTestCase
+site = admin.AdminSite(name="localized_fields_test")
+urlpatterns = []
+
 
 class LocalizedFieldsAdminMixinTestCase(TestCase):
     """Tests the :see:LocalizedFieldsAdminMixin class."""
@@ -79,3 +88,140 @@ class LocalizedFieldsAdminMixinTestCase(TestCase):
             inlines = [TestModelTabularInline]
 
         assert len(check_admin_app(apps.get_app_configs())) == 0
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class LocalizedFieldsAdminDeferredTestCase(TestCase):
+    """Tests the panes of :see:LocalizedFieldsAdminMixin that are loaded on
+    demand."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Creates the test model in the database and registers it."""
+
+        super().setUpClass()
+
+        cls.TestModel = get_fake_model(
+            {"title": LocalizedField(), "description": LocalizedField()}
+        )
+
+        class TestModelAdmin(LocalizedFieldsAdminMixin, admin.ModelAdmin):
+            localized_fields_deferred = True
+
+        site.register(cls.TestModel, TestModelAdmin)
+        cls.model_admin = site._registry[cls.TestModel]
+
+        urlpatterns[:] = [path("admin/", site.urls)]
+        clear_url_caches()
+
+    @classmethod
+    def tearDownClass(cls):
+        site.unregister(cls.TestModel)
+        urlpatterns[:] = []
+        clear_url_caches()
+
+        super().tearDownClass()
+
+    def setUp(self):
+        self.user = User.objects.create_superuser(
+            "admin", "admin@example.com", "admin"
+        )
+        self.obj = self.TestModel.objects.create(
+            title=LocalizedValue(dict(en="title", ro="titlu", nl="titel")),
+            description=LocalizedValue(dict(en="description", nl="<b>")),
+        )
+
+    def _request(self, method="get", data=None):
+        request = getattr(RequestFactory(), method)("/", data)
+        request.user = self.user
+        return request
+
+    def test_render(self):
+        """Tests whether only the panes of the preferred languages are
+        rendered with their value."""
+
+        form_class = self.model_admin.get_form(self._request(), self.obj)
+        html = str(form_class(instance=self.obj)["title"])
+
+        assert ">\ntitle</textarea>" in html
+        assert "titlu" not in html
+        assert "titel" not in html
+
+        assert (
+            'data-deferred-url="/admin/tests/%s/%s/localized-fields/title/'
+            "?language=nl" % (self.TestModel._meta.model_name, self.obj.pk)
+        ) in html
+        assert '<template><textarea name="title_2"' in html
+
+    def test_render_new(self):
+        """Tests whether all panes are rendered for new objects."""
+
+        form_class = self.model_admin.get_form(self._request())
+        html = str(form_class()["title"])
+
+        assert "data-deferred-url" not in html
+
+    def test_render_bound(self):
+        """Tests whether all panes of a bound form are rendered, so that the
+        posted values are not lost."""
+
+        form_class = self.model_admin.get_form(self._request(), self.obj)
+        form = form_class(dict(title_0="new", title_1="nou"), instance=self.obj)
+        html = str(form["title"])
+
+        assert "data-deferred-url" not in html
+        assert ">\nnou</textarea>" in html
+        assert ">\ntitel</textarea>" in html
+
+    def test_post(self):
+        """Tests whether languages that were not loaded, and thus not posted,
+        keep their value and languages that were loaded are saved."""
+
+        form_class = self.model_admin.get_form(self._request(), self.obj)
+        form = form_class(
+            dict(title_0="new", title_2="", description_0="description"),
+            instance=self.obj,
+        )
+
+        assert form.is_valid()
+        assert form.has_changed()
+        assert form.changed_data == ["title"]
+
+        obj = form.save()
+        obj.refresh_from_db()
+
+        assert obj.title.en == "new"
+        assert obj.title.ro == "titlu"
+        assert not obj.title.nl
+        assert obj.description.nl == "<b>"
+
+    def test_view(self):
+        """Tests whether the value of a pane is loaded as JSON."""
+
+        response = self.model_admin.localized_fields_view(
+            self._request(data=dict(language="nl")),
+            str(self.obj.pk),
+            "description",
+        )
+
+        assert response["Content-Type"] == "application/json"
+        assert response.content == b'{"language": "nl", "value": "<b>"}'
+
+    def test_view_not_found(self):
+        """Tests whether only languages of fields on the form of existing
+        objects can be loaded."""
+
+        for object_id, field_name, language in [
+            (str(self.obj.pk + 1), "title", "nl"),
+            (str(self.obj.pk), "id", "nl"),
+            (str(self.obj.pk), "title", "fr"),
+            (str(self.obj.pk), "title", None),
+        ]:
+            with self.assertRaises(Http404):
+                self.model_admin.localized_fields_view(
+                    self._request(data=dict(language=language or "")),
+                    object_id,
+                    field_name,
+                )
@@ -0,0 +1,143 @@
+import pytest
+
+from django.core.exceptions import FieldError
+from django.db import models
+from django.test import TestCase
+
+from localized_fields.aggregates import (
+    LocalizedAvg,
+    LocalizedMax,
+    LocalizedMin,
+    LocalizedSum,
+)
+from localized_fields.fields import (
+    LocalizedBooleanField,
+    LocalizedField,
+    LocalizedFloatField,
+    LocalizedIntegerField,
+)
+from localized_fields.value import LocalizedFloatValue, LocalizedIntegerValue
+
+from .fake_model import get_fake_model
+
+
+class LocalizedAggregatesTestCase(TestCase):
+    """Tests whether the localized aggregates aggregate every language
+    separately in a single query."""
+
+    FloatModel = None
+    IntegerModel = None
+    JsonbModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.FloatModel = get_fake_model(
+            {
+                "category": models.CharField(max_length=255),
+                "price": LocalizedFloatField(
+                    null=True, required=False, materialize=["nl"]
+                ),
+                "title": LocalizedField(null=True, required=False),
+                "available": LocalizedBooleanField(null=True, required=False),
+            }
+        )
+
+        cls.IntegerModel = get_fake_model(
+            {"stock": LocalizedIntegerField(null=True, required=False)}
+        )
+
+        cls.JsonbModel = get_fake_model(
+            {
+                "price": LocalizedFloatField(
+                    storage_type="jsonb", null=True, required=False
+                )
+            }
+        )
+
+    def setUp(self):
+        for category, en, nl in [
+            ("a", 1.5, 10.0),
+            ("a", 2.5, None),
+            ("b", 4.0, 20.0),
+        ]:
+            self.FloatModel.objects.create(
+                category=category, price=dict(en=en, nl=nl)
+            )
+            self.JsonbModel.objects.create(price=dict(en=en, nl=nl))
+
+        for en, ro in [(1, 2), (2, 2), (4, None)]:
+            self.IntegerModel.objects.create(stock=dict(en=en, ro=ro))
+
+    def test_aggregate(self):
+        """Tests whether every language is aggregated separately."""
+
+        for model in [self.FloatModel, self.JsonbModel]:
+            result = model.objects.aggregate(
+                total=LocalizedSum("price"),
+                average=LocalizedAvg("price"),
+                minimum=LocalizedMin("price"),
+                maximum=LocalizedMax("price"),
+            )
+
+            assert isinstance(result["total"], LocalizedFloatValue)
+            assert result["total"].en == 8.0
+            assert result["total"].nl == 30.0
+            assert result["total"].ro is None
+            assert result["average"].en == 8.0 / 3
+            assert result["average"].nl == 15.0
+            assert result["minimum"].en == 1.5
+            assert result["maximum"].nl == 20.0
+
+    def test_aggregate_integer(self):
+        """Tests whether integer fields are summed as integers and averaged as
+        floats."""
+
+        result = self.IntegerModel.objects.aggregate(
+            total=LocalizedSum("stock"), average=LocalizedAvg("stock")
+        )
+
+        assert isinstance(result["total"], LocalizedIntegerValue)
+        assert result["total"].en == 7
+        assert result["total"].ro == 4
+
+        assert isinstance(result["average"], LocalizedFloatValue)
+        assert result["average"].en == 7 / 3
+        assert result["average"].ro == 2.0
+
+    def test_annotate(self):
+        """Tests whether the aggregates can be grouped."""
+
+        totals = dict(
+            self.FloatModel.objects.values("category")
+            .annotate(total=LocalizedSum("price", languages=["en"]))
+            .values_list("category", "total")
+        )
+
+        assert totals["a"].en == 4.0
+        assert totals["a"].nl is None
+        assert totals["b"].en == 4.0
+
+    def test_empty(self):
+        """Tests whether aggregating no rows results in no values."""
+
+        result = self.FloatModel.objects.filter(category="c").aggregate(
+            total=LocalizedSum("price")
+        )
+
+        assert result["total"].en is None
+
+    def test_text_field(self):
+        """Tests whether aggregating a text field is not allowed."""
+
+        with pytest.raises(FieldError):
+            self.FloatModel.objects.aggregate(total=LocalizedSum("title"))
+
+    def test_boolean_field(self):
+        """Tests whether aggregating a boolean field is not allowed."""
+
+        with pytest.raises(FieldError):
+            self.FloatModel.objects.aggregate(
+                available=LocalizedMax("available")
+            )
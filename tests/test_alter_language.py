@@ -0,0 +1,139 @@
+import io
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from localized_fields.fields import LocalizedField
+
+from .fake_model import get_fake_model
+
+
+class LocalizedAlterLanguageCommandTestCase(TestCase):
+    """Tests whether the `alter_localized_language` management command
+    properly adds and drops languages from stored values."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.TestModel = get_fake_model(
+            {
+                "title": LocalizedField(),
+                "text": LocalizedField(sparse=True, required=False),
+                "description": LocalizedField(
+                    storage_type="jsonb", required=False
+                ),
+            }
+        )
+
+    def setUp(self):
+        self.objs = [
+            self.TestModel.objects.create(
+                title=dict(en="title_%d" % index),
+                text=dict(en="text_%d" % index),
+                description=dict(en="description_%d" % index),
+            )
+            for index in range(5)
+        ]
+
+    def _get_stored(self, obj, column: str) -> dict:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT %s FROM %s WHERE id = %%s"
+                % (column, self.TestModel._meta.db_table),
+                [obj.pk],
+            )
+            value = cursor.fetchone()[0]
+
+        if isinstance(value, str):
+            # django does not decode jsonb for us
+            return set(value.strip("{}").replace('"', "").split(", "))
+
+        return value
+
+    def _call(self, *args, **kwargs) -> str:
+        out = io.StringIO()
+        call_command(
+            "alter_localized_language",
+            *args,
+            self.TestModel._meta.label,
+            batch_size=2,
+            stdout=out,
+            stderr=io.StringIO(),
+            **kwargs
+        )
+        return out.getvalue()
+
+    def test_add(self):
+        """Tests whether adding a language adds the key to all rows, without
+        overwriting existing values and leaving sparse fields alone."""
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE %s SET title = title || hstore('fr', 'titre') WHERE id = %%s"
+                % self.TestModel._meta.db_table,
+                [self.objs[0].pk],
+            )
+
+        with override_settings(
+            LANGUAGES=(("en", "English"), ("ro", "Romanian"), ("fr", "French"))
+        ):
+            output = self._call("add", "fr", copy_from="en")
+
+        assert "up to pk %s" % self.objs[1].pk in output
+        assert "added fr in 4 row(s)" in output
+
+        assert self._get_stored(self.objs[0], "title")["fr"] == "titre"
+        for obj in self.objs[1:]:
+            assert self._get_stored(obj, "title")["fr"] == obj.title.en
+            assert "fr" not in self._get_stored(obj, "text")
+
+    def test_drop(self):
+        """Tests whether dropping a language removes the key from all hstore
+        and JSONB columns."""
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE %s SET title = title || hstore('fr', 'titre'), description = description || '{\"fr\": \"x\"}'::jsonb"
+                % self.TestModel._meta.db_table
+            )
+
+        output = self._call("drop", "fr")
+        assert "dropped fr in 5 row(s)" in output
+
+        for obj in self.objs:
+            assert "fr" not in self._get_stored(obj, "title")
+            assert "fr:" not in str(self._get_stored(obj, "description"))
+
+    def test_drop_configured_language(self):
+        """Tests whether languages that are still configured are not
+        dropped."""
+
+        output = self._call("drop", "ro")
+        assert output == ""
+
+        for obj in self.objs:
+            assert "ro" in self._get_stored(obj, "title")
+
+    def test_resume(self):
+        """Tests whether a run can be resumed after a primary key."""
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE %s SET title = title || hstore('fr', 'titre')"
+                % self.TestModel._meta.db_table
+            )
+
+        output = self._call("drop", "fr", start_after=self.objs[2].pk)
+        assert "dropped fr in 2 row(s)" in output
+
+        assert "fr" in self._get_stored(self.objs[2], "title")
+        assert "fr" not in self._get_stored(self.objs[3], "title")
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "alter_localized_language", "drop", "fr", start_after=1
+            )
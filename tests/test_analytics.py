@@ -0,0 +1,110 @@
+import io
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from localized_fields.analytics import get_translation_coverage
+from localized_fields.fields import LocalizedField
+
+from .fake_model import get_fake_model
+
+
+class LocalizedAnalyticsTestCase(TestCase):
+    """Tests whether missing translations are counted properly."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.TestModel = get_fake_model(
+            {
+                "title": LocalizedField(),
+                "description": LocalizedField(
+                    storage_type="jsonb", required=False, blank=True
+                ),
+            }
+        )
+
+    def setUp(self):
+        self.TestModel.objects.create(
+            title=dict(en="title", ro="titlu", nl="titel"),
+            description=dict(en="description"),
+        )
+        self.TestModel.objects.create(
+            title=dict(en="title", ro=""), description=dict(nl="omschrijving")
+        )
+        self.TestModel.objects.create(title=dict(en="title"), description={})
+
+        # a language that is NULL and one that is not stored at all
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE %s SET title = title || hstore('nl', NULL) WHERE title->'ro' = ''"
+                % self.TestModel._meta.db_table
+            )
+
+    def _get_counts(self, *args, **kwargs) -> dict:
+        return {
+            (coverage.field.name, coverage.language): (
+                coverage.rows,
+                coverage.missing,
+                coverage.fallbacks,
+                coverage.misses,
+            )
+            for coverage in get_translation_coverage(*args, **kwargs)
+        }
+
+    def test_coverage(self):
+        """Tests whether missing, NULL and empty translations are counted as
+        missing for both storage types."""
+
+        counts = self._get_counts(self.TestModel)
+
+        assert counts[("title", "en")] == (3, 0, 0, 0)
+        assert counts[("title", "ro")] == (3, 2, 2, 0)
+        assert counts[("title", "nl")] == (3, 2, 2, 0)
+
+        assert counts[("description", "en")] == (3, 2, 0, 2)
+        assert counts[("description", "nl")] == (3, 2, 1, 1)
+
+    @override_settings(LOCALIZED_FIELDS_FALLBACKS={"nl": ["ro"]})
+    def test_fallbacks(self):
+        """Tests whether the configured fallback languages are used to
+        determine whether a translation falls back."""
+
+        counts = self._get_counts(
+            self.TestModel, fields=["title"], languages=["nl"]
+        )
+
+        assert counts == {("title", "nl"): (3, 2, 0, 2)}
+
+    def test_queryset(self):
+        """Tests whether only the rows in the query set are counted."""
+
+        counts = self._get_counts(
+            self.TestModel.objects.filter(title__ro="titlu"), fields=["title"]
+        )
+
+        assert counts[("title", "nl")] == (1, 0, 0, 0)
+
+    def test_command(self):
+        """Tests whether the management command reports every field and
+        language."""
+
+        out = io.StringIO()
+        call_command(
+            "report_missing_translations",
+            self.TestModel._meta.label,
+            language=["ro"],
+            stdout=out,
+        )
+
+        lines = out.getvalue().splitlines()
+        assert lines == [
+            "%s.title [ro]: 2 of 3 row(s) missing, 2 fall back, 0 without any value"
+            % self.TestModel._meta.label,
+            "%s.description [ro]: 3 of 3 row(s) missing, 1 fall back, 2 without any value"
+            % self.TestModel._meta.label,
+        ]
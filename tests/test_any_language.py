@@ -0,0 +1,88 @@
+from django.db import connection
+from django.test import TestCase
+
+from localized_fields.fields import LocalizedField
+from localized_fields.indexes import (
+    AnyLanguageSearchIndex,
+    AnyLanguageTrigramIndex,
+)
+
+from .fake_model import get_fake_model
+
+
+class LocalizedAnyLanguageTestCase(TestCase):
+    """Tests whether the `any_language` lookups match a value in any language
+    and use the matching indexes."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+        cls.TestModel = get_fake_model(
+            {
+                "title": LocalizedField(),
+                "text": LocalizedField(storage_type="jsonb", required=False),
+            },
+            meta_options=dict(
+                indexes=[
+                    AnyLanguageTrigramIndex(
+                        fields=["title"], name="title_trgm"
+                    ),
+                    AnyLanguageSearchIndex(fields=["title"], name="title_ts"),
+                    AnyLanguageTrigramIndex(fields=["text"], name="text_trgm"),
+                ]
+            ),
+        )
+
+    def setUp(self):
+        self.obj1 = self.TestModel.objects.create(
+            title=dict(en="Cold beer", ro="Bere rece"),
+            text=dict(nl="Koud bier"),
+        )
+        self.obj2 = self.TestModel.objects.create(
+            title=dict(en="Bread", nl="Brood"), text=dict(ro="Paine")
+        )
+
+    def _filter(self, **kwargs):
+        return set(
+            self.TestModel.objects.filter(**kwargs).values_list("pk", flat=True)
+        )
+
+    def test_icontains(self):
+        assert self._filter(title__any_language__icontains="RECE") == {
+            self.obj1.pk
+        }
+        assert self._filter(title__any_language__icontains="br") == {
+            self.obj2.pk
+        }
+        assert self._filter(text__any_language__icontains="bier") == {
+            self.obj1.pk
+        }
+        assert self._filter(text__any_language__icontains="wine") == set()
+
+    def test_search(self):
+        assert self._filter(title__any_language__search="beer") == {
+            self.obj1.pk
+        }
+        assert self._filter(title__any_language__search="brood") == {
+            self.obj2.pk
+        }
+
+    def test_indexes(self):
+        """Tests whether the lookups use the indexes."""
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        for index_name, lookup in [
+            ("title_trgm", dict(title__any_language__icontains="bere")),
+            ("title_ts", dict(title__any_language__search="bere")),
+            ("text_trgm", dict(text__any_language__icontains="bier")),
+        ]:
+            plan = self.TestModel.objects.filter(**lookup).explain()
+            assert index_name in plan
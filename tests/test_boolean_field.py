@@ -1,10 +1,12 @@
 from django.conf import settings
 from django.db import connection
+from django.db.migrations.state import ModelState, ProjectState
 from django.db.utils import IntegrityError
 from django.test import TestCase
 from django.utils import translation
 
 from localized_fields.fields import LocalizedBooleanField
+from localized_fields.indexes import LocalizedBooleanIndex
 from localized_fields.value import LocalizedBooleanValue
 
 from .fake_model import get_fake_model
@@ -151,6 +153,23 @@ class LocalizedBooleanFieldTestCase(TestCase):
         with self.assertRaises(ValueError):
             obj.refresh_from_db()
 
+    @staticmethod
+    def test_to_python():
+        """Tests whether deserializing, as loaddata and forms do, parses the
+        values in every language."""
+
+        field = LocalizedBooleanField()
+        field.set_attributes_from_name("score")
+
+        value = field.to_python({"en": "true", "ro": False, "nl": None})
+        assert isinstance(value, LocalizedBooleanValue)
+        assert value.en is True
+        assert value.ro is False
+        assert value.nl is None
+
+        value = field.to_python('{"en": "FALSE"}')
+        assert value.en is False
+
     def test_default_value(self):
         """Tests whether a default is properly set when specified."""
 
@@ -209,3 +228,98 @@ class LocalizedBooleanFieldTestCase(TestCase):
         obj = model.objects.create()
 
         assert obj.test["en"] == output["en"]
+
+
+class LocalizedBooleanFieldLookupsTestCase(TestCase):
+    """Tests whether selecting a single language of a
+    :see:LocalizedBooleanField compares the values as booleans and uses the
+    partial indexes."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.TestModel = get_fake_model(
+            {
+                "active": LocalizedBooleanField(
+                    null=True,
+                    required=False,
+                    partial_indexes=["en", "nl"],
+                ),
+                "featured": LocalizedBooleanField(
+                    storage_type="jsonb", null=True, required=False
+                ),
+            }
+        )
+
+    def setUp(self):
+        for en, nl in [(True, False), ("False", "True"), (None, True)]:
+            self.TestModel.objects.create(
+                active=dict(en=en, nl=nl), featured=dict(en=en, nl=nl)
+            )
+
+    def test_filter(self):
+        """Tests whether filtering on a language compares booleans."""
+
+        for field_name in ["active", "featured"]:
+            assert (
+                self.TestModel.objects.filter(
+                    **{"%s__en" % field_name: True}
+                ).count()
+                == 1
+            )
+            assert (
+                self.TestModel.objects.filter(
+                    **{"%s__nl" % field_name: False}
+                ).count()
+                == 1
+            )
+            assert (
+                self.TestModel.objects.filter(
+                    **{"%s__nl" % field_name: True}
+                ).count()
+                == 2
+            )
+
+        values = self.TestModel.objects.order_by("pk").values_list(
+            "active__en", flat=True
+        )
+        assert list(values) == [True, False, None]
+
+    def test_partial_indexes(self):
+        """Tests whether the partial indexes are created for every language
+        and are used when filtering on true values."""
+
+        indexes = [
+            index
+            for index in self.TestModel._meta.indexes
+            if isinstance(index, LocalizedBooleanIndex)
+        ]
+        assert [index.language for index in indexes] == ["en", "nl"]
+        assert indexes[0].name != indexes[1].name
+
+        # constructing the model from its state does not add them again
+        project_state = ProjectState()
+        project_state.add_model(ModelState.from_model(self.TestModel))
+        model = project_state.apps.get_model(
+            "tests", self.TestModel._meta.model_name
+        )
+        assert len(model._meta.indexes) == 2
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        for index in indexes:
+            plan = self.TestModel.objects.filter(
+                **{"active__%s" % index.language: True}
+            ).explain()
+
+            assert index.name in plan
+
+    def test_deconstruct(self):
+        field = LocalizedBooleanField(partial_indexes=["nl"])
+        _, _, _, kwargs = field.deconstruct()
+
+        assert kwargs["partial_indexes"] == ["nl"]
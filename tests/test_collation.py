@@ -0,0 +1,90 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import translation
+
+from localized_fields.expressions import LocalizedOrderBy
+from localized_fields.fields import LocalizedField
+from localized_fields.indexes import LocalizedCollatedIndex
+
+from .fake_model import get_fake_model
+
+
+@override_settings(LOCALIZED_FIELDS_COLLATIONS={"ro": "POSIX", "nl": "C"})
+class LocalizedCollationTestCase(TestCase):
+    """Tests whether ordering by :see:LocalizedOrderBy uses the collation of
+    the active language and the matching indexes."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.TestModel = get_fake_model(
+            {"title": LocalizedField(materialize=["nl"])},
+            meta_options=dict(
+                indexes=[
+                    LocalizedCollatedIndex(
+                        fields=["title"], language="ro", name="title_ro"
+                    ),
+                    LocalizedCollatedIndex(
+                        fields=["title"], language="nl", name="title_nl"
+                    ),
+                ]
+            ),
+        )
+
+    def setUp(self):
+        for title in ["b", "A", "a"]:
+            self.TestModel.objects.create(
+                title=dict(en=title, ro=title, nl=title)
+            )
+
+    def _order(self):
+        return self.TestModel.objects.order_by(LocalizedOrderBy("title"))
+
+    def test_ordering(self):
+        """Tests whether the collation is applied for the active language
+        only."""
+
+        with translation.override("ro"):
+            sql = str(self._order().query)
+            assert 'COLLATE "POSIX"' in sql
+
+            titles = [obj.title.ro for obj in self._order()]
+            assert titles == ["A", "a", "b"]
+
+        with translation.override("nl"):
+            assert 'COLLATE "C"' in str(self._order().query)
+            assert [obj.title.nl for obj in self._order()] == ["A", "a", "b"]
+
+        with translation.override("en"):
+            assert "COLLATE" not in str(self._order().query)
+
+        with translation.override("ro"):
+            titles = self.TestModel.objects.order_by(
+                LocalizedOrderBy("title").desc()
+            ).values_list("title__ro", flat=True)
+            assert list(titles) == ["b", "a", "A"]
+
+    def test_indexes(self):
+        """Tests whether ordering uses the collated indexes, also for
+        materialized languages."""
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_sort = off")
+
+        for language in ["ro", "nl"]:
+            with translation.override(language):
+                plan = self._order()[:10].explain()
+                assert "title_%s" % language in plan
+
+    def test_deconstruct(self):
+        index = LocalizedCollatedIndex(
+            fields=["title"], language="ro", collation="ro-x-icu", name="a"
+        )
+        _, _, kwargs = index.deconstruct()
+
+        assert kwargs["language"] == "ro"
+        assert kwargs["collation"] == "ro-x-icu"
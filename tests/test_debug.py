@@ -0,0 +1,168 @@
+import unittest
+
+from types import SimpleNamespace
+
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.utils import translation
+
+from localized_fields import instrumentation
+from localized_fields.debug import (
+    LocalizedFieldsActivityMiddleware,
+    format_activity,
+    get_activity,
+)
+from localized_fields.fields import (
+    LocalizedAutoSlugField,
+    LocalizedField,
+    LocalizedIntegerField,
+)
+
+from .fake_model import get_fake_model
+
+try:
+    import debug_toolbar
+except ImportError:
+    debug_toolbar = None
+
+
+class LocalizedDebugTestCase(TestCase):
+    """Tests whether the activity of localized fields during a request is
+    summarized properly."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.TestModel = get_fake_model(
+            {
+                "title": LocalizedField(),
+                "slug": LocalizedAutoSlugField(populate_from="title"),
+                "score": LocalizedIntegerField(null=True, required=False),
+            }
+        )
+
+    def setUp(self):
+        self.TestModel.objects.create(title=dict(en="title"))
+        self.TestModel.objects.create(title=dict(en="title"))
+
+    def _view(self, request):
+        """View that loads a deferred field in a loop."""
+
+        with translation.override("nl"):
+            for obj in self.TestModel.objects.only("pk"):
+                str(obj.title)
+
+        return HttpResponse()
+
+    def test_collect(self):
+        """Tests whether measurements are only collected within the block and
+        without a configured sink."""
+
+        assert not instrumentation.enabled
+
+        with instrumentation.collect() as sink:
+            assert instrumentation.enabled
+            instrumentation.increment(instrumentation.SLUG_QUERY, field="a")
+
+            with instrumentation.collect() as inner_sink:
+                instrumentation.increment(instrumentation.SLUG_QUERY)
+
+        assert not instrumentation.enabled
+        instrumentation.increment(instrumentation.SLUG_QUERY)
+
+        assert sink.get(instrumentation.SLUG_QUERY) == 2
+        assert inner_sink.get(instrumentation.SLUG_QUERY) == 1
+
+    def test_middleware(self):
+        """Tests whether the middleware summarizes the activity during the
+        request and logs it."""
+
+        request = RequestFactory().get("/")
+        middleware = LocalizedFieldsActivityMiddleware(self._view)
+
+        with self.assertLogs("localized_fields.debug") as logs:
+            middleware(request)
+
+        activity = request.localized_fields_activity
+        title_field = str(self.TestModel._meta.get_field("title"))
+
+        assert activity["values_loaded"] == 2
+        assert activity["fallbacks"] == [("nl", "en", 2)]
+        assert activity["misses"] == []
+        assert activity["deferred_loads"] == [(title_field, 2)]
+
+        assert format_activity(activity) in logs.output[0]
+        assert "possible N+1 on %s (2x)" % title_field in logs.output[0]
+
+    def test_slug_queries(self):
+        """Tests whether the queries to find a unique slug are counted."""
+
+        with instrumentation.collect() as sink:
+            self.TestModel.objects.create(title=dict(en="title"))
+
+        # title and title-1 are taken, in all three
+        # languages, because they fall back to english
+        assert get_activity(sink)["slug_queries"] == [
+            (str(self.TestModel._meta.get_field("slug")), 9)
+        ]
+
+    def test_empty(self):
+        """Tests whether a request that does nothing with localized fields is
+        summarized as such."""
+
+        with instrumentation.collect() as sink:
+            pass
+
+        activity = get_activity(sink)
+        assert activity["values_created"] == 0
+        assert activity["fallbacks"] == []
+        assert "N+1" not in format_activity(activity)
+
+    @unittest.skipUnless(debug_toolbar, "requires django-debug-toolbar")
+    def test_panel(self):
+        """Tests whether the debug toolbar panel records and renders the
+        activity during the request."""
+
+        from localized_fields.panels import LocalizedFieldsPanel
+
+        request = RequestFactory().get("/")
+        toolbar = SimpleNamespace(request=request, stats={})
+
+        panel = LocalizedFieldsPanel(toolbar, self._view)
+        panel.process_request(request)
+
+        assert panel.get_stats()["fallbacks"] == [("nl", "en", 2)]
+        assert "2 fallbacks" in panel.nav_subtitle
+        assert "fell back to" in panel.content.lower()
+
+    @unittest.skipUnless(debug_toolbar, "requires django-debug-toolbar")
+    def test_panel_values(self):
+        """Tests whether every value that was loaded from the database is
+        counted exactly once, also for typed fields."""
+
+        from localized_fields.panels import LocalizedFieldsPanel
+
+        self.TestModel.objects.all().delete()
+        for index in range(3):
+            self.TestModel.objects.create(
+                title=dict(en="title"), score=dict(en=index)
+            )
+
+        def _view(request):
+            for obj in self.TestModel.objects.only("pk", "score"):
+                obj.score.translate()
+
+            return HttpResponse()
+
+        request = RequestFactory().get("/")
+        toolbar = SimpleNamespace(request=request, stats={})
+
+        panel = LocalizedFieldsPanel(toolbar, _view)
+        panel.process_request(request)
+
+        assert panel.get_stats()["values_loaded"] == 3
+        assert panel.get_stats()["values_created"] == 0
+        assert panel.nav_subtitle.startswith("3 values loaded")
@@ -0,0 +1,102 @@
+import math
+
+import numpy
+import pytest
+
+from django.core.exceptions import FieldError
+from django.test import TestCase
+
+from localized_fields.export import to_numpy
+from localized_fields.fields import (
+    LocalizedField,
+    LocalizedFloatField,
+    LocalizedIntegerField,
+)
+
+from .fake_model import get_fake_model
+
+
+class LocalizedExportTestCase(TestCase):
+    """Tests whether numeric localized fields are exported into NumPy
+    arrays properly."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.TestModel = get_fake_model(
+            {
+                "price": LocalizedFloatField(
+                    null=True, required=False, materialize=["nl"]
+                ),
+                "stock": LocalizedIntegerField(null=True, required=False),
+                "title": LocalizedField(null=True, required=False),
+            }
+        )
+
+    def setUp(self):
+        for en, nl in [(1.5, 10.0), (2.5, None), (None, 20.0)]:
+            self.TestModel.objects.create(
+                price=dict(en=en, nl=nl),
+                stock=dict(en=en and int(en), nl=nl and int(nl)),
+            )
+
+    def test_float(self):
+        """Tests whether floats are exported with NaN for missing values."""
+
+        values, missing = to_numpy(
+            self.TestModel.objects.order_by("pk"),
+            "price",
+            languages=["en", "nl"],
+        )
+
+        assert values.dtype == numpy.float64
+        assert values.shape == (3, 2)
+        assert values[0].tolist() == [1.5, 10.0]
+        assert values[1][0] == 2.5 and math.isnan(values[1][1])
+        assert missing.tolist() == [
+            [False, False],
+            [False, True],
+            [True, False],
+        ]
+
+    def test_integer(self):
+        """Tests whether integers are exported with 0 for missing values."""
+
+        values, missing = to_numpy(
+            self.TestModel.objects.order_by("pk"),
+            "stock",
+            languages=["en", "nl"],
+            chunk_size=2,
+        )
+
+        assert values.dtype == numpy.int64
+        assert values.tolist() == [[1, 10], [2, 0], [0, 20]]
+        assert missing[1].tolist() == [False, True]
+
+    def test_all_languages(self):
+        """Tests whether all languages of the field are exported by
+        default."""
+
+        values, missing = to_numpy(self.TestModel, "price")
+
+        assert values.shape == (
+            3,
+            len(self.TestModel._meta.get_field("price").language_codes),
+        )
+
+    def test_empty(self):
+        values, missing = to_numpy(
+            self.TestModel.objects.none(), "price", languages=["en"]
+        )
+
+        assert values.shape == (0, 1)
+        assert missing.shape == (0, 1)
+
+    def test_text_field(self):
+        """Tests whether exporting a text field is not allowed."""
+
+        with pytest.raises(FieldError):
+            to_numpy(self.TestModel, "title")
@@ -61,7 +61,7 @@ class LocalizedFieldTestCase(TestCase):
         values when LOCALIZED_FIELDS_EXPERIMENTAL is set to True."""
 
         with self.settings(LOCALIZED_FIELDS_EXPERIMENTAL=True):
-            localized_value = LocalizedField.from_db_value(None)
+            localized_value = LocalizedField().from_db_value(None)
 
         assert localized_value is None
 
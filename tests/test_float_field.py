@@ -5,6 +5,8 @@ from django.test import TestCase
 from django.utils import translation
 
 from localized_fields.fields import LocalizedFloatField
+from localized_fields.indexes import LocalizedLanguageIndex
+from localized_fields.value import LocalizedFloatValue
 
 from .fake_model import get_fake_model
 
@@ -146,6 +148,24 @@ class LocalizedFloatFieldTestCase(TestCase):
         obj.refresh_from_db()
         assert obj.score.get(settings.LANGUAGE_CODE) is None
 
+    @staticmethod
+    def test_to_python():
+        """Tests whether deserializing, as loaddata and forms do, parses the
+        values in every language."""
+
+        field = LocalizedFloatField()
+        field.set_attributes_from_name("score")
+
+        value = field.to_python({"en": "1.5", "ro": 0.0, "nl": ""})
+        assert isinstance(value, LocalizedFloatValue)
+        assert value.en == 1.5
+        assert value.ro == 0.0
+        assert value.nl is None
+
+        value = field.to_python('{"en": "2.5", "ro": "haha"}')
+        assert value.en == 2.5
+        assert value.ro is None
+
     def test_default_value(self):
         """Tests whether a default is properly set when specified."""
 
@@ -170,3 +190,84 @@ class LocalizedFloatFieldTestCase(TestCase):
                 assert obj.score.get(lang_code) == 75.0
             else:
                 assert obj.score.get(lang_code) is None
+
+
+class LocalizedFloatFieldLookupsTestCase(TestCase):
+    """Tests whether selecting a single language of a
+    :see:LocalizedFloatField orders and compares the values as numbers."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.TestModel = get_fake_model(
+            {
+                "price": LocalizedFloatField(
+                    null=True, required=False, materialize=["nl"]
+                )
+            },
+            meta_options=dict(
+                indexes=[
+                    LocalizedLanguageIndex(
+                        fields=["price"], language="en", name="price_en"
+                    ),
+                    LocalizedLanguageIndex(
+                        fields=["price"], language="nl", name="price_nl"
+                    ),
+                ]
+            ),
+        )
+
+    def setUp(self):
+        for price in [9.5, 10.0, 100.25, -1.0]:
+            self.TestModel.objects.create(price=dict(en=price, nl=price))
+
+    def test_order_by(self):
+        """Tests whether ordering by a language orders numerically."""
+
+        for language in ["en", "nl"]:
+            prices = self.TestModel.objects.order_by(
+                "price__%s" % language
+            ).values_list("price__%s" % language, flat=True)
+
+            assert list(prices) == [-1.0, 9.5, 10.0, 100.25]
+
+    def test_comparisons(self):
+        """Tests whether the comparison lookups compare numerically."""
+
+        def _prices(**filters):
+            return sorted(
+                self.TestModel.objects.filter(**filters).values_list(
+                    "price__en", flat=True
+                )
+            )
+
+        assert _prices(price__en__gt=10) == [100.25]
+        assert _prices(price__en__gte=10) == [10.0, 100.25]
+        assert _prices(price__en__lt=9.5) == [-1.0]
+        assert _prices(price__en__lte=9.5) == [-1.0, 9.5]
+        assert _prices(price__en__range=(0, 50)) == [9.5, 10.0]
+        assert _prices(price__nl__range=(0, 50)) == [9.5, 10.0]
+
+    def test_indexes(self):
+        """Tests whether range lookups use the matching indexes."""
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        for language in ["en", "nl"]:
+            plan = self.TestModel.objects.filter(
+                **{"price__%s__range" % language: (0, 50)}
+            ).explain()
+
+            assert "price_%s" % language in plan
+
+    def test_deconstruct(self):
+        index = LocalizedLanguageIndex(
+            fields=["price"], language="en", name="a"
+        )
+        _, _, kwargs = index.deconstruct()
+
+        assert kwargs["language"] == "en"
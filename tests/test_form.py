@@ -1,7 +1,9 @@
+import copy
+
 from django.conf import settings
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
-from localized_fields.forms import LocalizedFieldForm
+from localized_fields.forms import LocalizedBooleanFieldForm, LocalizedFieldForm
 
 
 class LocalizedFieldFormTestCase(TestCase):
@@ -49,3 +51,58 @@ class LocalizedFieldFormTestCase(TestCase):
 
         for lang_code, lang_name in settings.LANGUAGES:
             assert output_value.get(lang_code) == lang_name
+
+    @staticmethod
+    def test_prototypes():
+        """Tests whether forms created from the same cached inner fields and
+        widgets do not share them."""
+
+        first = LocalizedFieldForm(required=[settings.LANGUAGE_CODE])
+        second = LocalizedFieldForm(required=[settings.LANGUAGE_CODE])
+
+        for first_field, second_field in zip(first.fields, second.fields):
+            assert first_field is not second_field
+            assert first_field.widget is not second_field.widget
+            assert first_field.error_messages is not second_field.error_messages
+
+        first.widget.widgets[0].attrs["class"] = "changed"
+        assert "class" not in second.widget.widgets[0].attrs
+        assert second.widget.widgets[0].attrs["lang"] == settings.LANGUAGE_CODE
+
+        # the required languages are part of the key
+        form = LocalizedFieldForm(required=True)
+        assert all(field.required for field in form.fields)
+
+        with override_settings(LANGUAGES=[("en", "English"), ("xx", "X")]):
+            form = LocalizedFieldForm()
+            assert [field.label for field in form.fields] == ["en", "xx"]
+            assert [widget.lang_code for widget in form.widget.widgets] == [
+                "en",
+                "xx",
+            ]
+
+        form = LocalizedFieldForm()
+        assert len(form.fields) == len(settings.LANGUAGES)
+
+    @staticmethod
+    def test_deepcopy():
+        """Tests whether copies of a form do not share their inner fields and
+        widgets."""
+
+        form = LocalizedBooleanFieldForm(required=False)
+        form_copy = copy.deepcopy(form)
+
+        assert len(form_copy.fields) == len(form.fields)
+        assert len(form_copy.widget.widgets) == len(form.widget.widgets)
+
+        for field, field_copy in zip(form.fields, form_copy.fields):
+            assert field is not field_copy
+            assert field.label == field_copy.label
+
+        for widget, widget_copy in zip(
+            form.widget.widgets, form_copy.widget.widgets
+        ):
+            assert widget is not widget_copy
+            assert widget.attrs is not widget_copy.attrs
+            assert widget.lang_code == widget_copy.lang_code
+            assert widget_copy.choices == [("False", False), ("True", True)]
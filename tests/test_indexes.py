@@ -0,0 +1,119 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import connection
+from django.db.migrations.state import ModelState, ProjectState
+from django.db.models import Q
+from django.test import TransactionTestCase
+
+from localized_fields.fields import (
+    LocalizedBooleanField,
+    LocalizedField,
+    LocalizedFloatField,
+)
+from localized_fields.indexes import (
+    AnyLanguageSearchIndex,
+    LocalizedBooleanIndex,
+    LocalizedCollatedIndex,
+    LocalizedLanguageIndex,
+)
+
+from .fake_model import get_fake_model
+
+
+class LocalizedIndexesTestCase(TransactionTestCase):
+    """Tests whether the localized indexes keep the options of regular
+    indexes, such as being created concurrently."""
+
+    TestModel = None
+
+    def setUp(self):
+        self.TestModel = get_fake_model(
+            {
+                "title": LocalizedField(null=True, required=False),
+                "price": LocalizedFloatField(null=True, required=False),
+                "active": LocalizedBooleanField(null=True, required=False),
+            }
+        )
+
+        self.state = ProjectState()
+        self.state.add_model(ModelState.from_model(self.TestModel))
+
+    def tearDown(self):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(self.TestModel)
+
+    def _add_concurrently(self, index) -> str:
+        """Adds the specified index concurrently.
+
+        Returns:
+            The definition of the created index.
+        """
+
+        operation = AddIndexConcurrently(self.TestModel._meta.model_name, index)
+
+        with connection.schema_editor(
+            atomic=False, collect_sql=True
+        ) as schema_editor:
+            operation.database_forwards(
+                "tests", schema_editor, self.state, self.state
+            )
+
+        assert schema_editor.collected_sql[0].startswith(
+            "CREATE INDEX CONCURRENTLY"
+        )
+
+        with connection.schema_editor(atomic=False) as schema_editor:
+            operation.database_forwards(
+                "tests", schema_editor, self.state, self.state
+            )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexdef FROM pg_indexes WHERE indexname = %s",
+                [index.name],
+            )
+            (definition,) = cursor.fetchone()
+
+        return definition
+
+    def test_language_index(self):
+        definition = self._add_concurrently(
+            LocalizedLanguageIndex(
+                fields=["price"],
+                language="en",
+                name="price_en",
+                condition=Q(id__gt=0),
+            )
+        )
+
+        assert "'en'::text))::double precision" in definition
+        assert "WHERE (id > 0)" in definition
+
+    def test_collated_index(self):
+        definition = self._add_concurrently(
+            LocalizedCollatedIndex(
+                fields=["title"], language="en", name="title_en"
+            )
+        )
+
+        assert "(title -> 'en'::text)" in definition
+
+    def test_boolean_index(self):
+        definition = self._add_concurrently(
+            LocalizedBooleanIndex(
+                fields=["active"],
+                language="nl",
+                name="active_nl",
+                condition=Q(id__gt=0),
+            )
+        )
+
+        assert "(id)" in definition
+        assert "'nl'::text))::boolean" in definition
+        assert "AND (id > 0)" in definition
+
+    def test_any_language_index(self):
+        definition = self._add_concurrently(
+            AnyLanguageSearchIndex(fields=["title"], name="title_ts")
+        )
+
+        assert "USING gin (to_tsvector(" in definition
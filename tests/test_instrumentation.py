@@ -0,0 +1,121 @@
+from django.test import TestCase, override_settings
+from django.utils import translation
+
+from localized_fields import instrumentation
+from localized_fields.fields import LocalizedField, LocalizedUniqueSlugField
+from localized_fields.value import LocalizedValue
+
+from .fake_model import get_fake_model
+
+
+@override_settings(
+    LOCALIZED_FIELDS_INSTRUMENTATION_SINK="localized_fields.instrumentation.CounterSink"
+)
+class LocalizedInstrumentationTestCase(TestCase):
+    """Tests whether the instrumented code paths report to the configured
+    sink."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.TestModel = get_fake_model(
+            {
+                "title": LocalizedField(),
+                "slug": LocalizedUniqueSlugField(populate_from="title"),
+            }
+        )
+
+    def setUp(self):
+        self.sink = instrumentation.get_sink()
+        self.sink.reset()
+
+    def test_disabled(self):
+        """Tests whether nothing is reported when no sink is configured."""
+
+        with override_settings(LOCALIZED_FIELDS_INSTRUMENTATION_SINK=None):
+            assert not instrumentation.enabled
+            assert instrumentation.get_sink() is None
+
+            LocalizedValue(dict(en="title"))
+
+        assert instrumentation.enabled
+        assert not self.sink.counters
+
+    def test_values(self):
+        """Tests whether creating and loading values is counted."""
+
+        LocalizedValue(dict(en="title"))
+        assert self.sink.get(instrumentation.VALUE_CREATED) == 1
+
+        obj = self.TestModel.objects.create(title=dict(en="title"))
+        self.sink.reset()
+
+        self.TestModel.objects.get(pk=obj.pk)
+        assert (
+            self.sink.get(
+                instrumentation.VALUE_LOADED,
+                field=str(self.TestModel._meta.get_field("title")),
+            )
+            == 1
+        )
+        assert self.sink.get(instrumentation.VALUE_CREATED) == 0
+
+    def test_translate(self):
+        """Tests whether translations are counted as hits, fallbacks and
+        misses per language."""
+
+        value = LocalizedValue(dict(en="title", ro="titlu"))
+
+        with translation.override("ro"):
+            value.translate()
+
+        with translation.override("nl"):
+            value.translate()
+
+        LocalizedValue().translate("nl")
+
+        assert self.sink.get(instrumentation.TRANSLATE_HIT, language="ro") == 1
+        assert (
+            self.sink.get(
+                instrumentation.TRANSLATE_FALLBACK, language="nl", fallback="en"
+            )
+            == 1
+        )
+        assert self.sink.get(instrumentation.TRANSLATE_MISS, language="nl") == 1
+
+    def test_descriptor_refresh(self):
+        """Tests whether loading deferred values is counted."""
+
+        obj = self.TestModel.objects.create(title=dict(en="title"))
+        obj = self.TestModel.objects.only("pk").get(pk=obj.pk)
+
+        assert obj.title.en == "title"
+        assert self.sink.get(instrumentation.DESCRIPTOR_REFRESH) == 1
+
+    def test_slug_retries(self):
+        """Tests whether retries because of colliding slugs are counted."""
+
+        for _ in range(3):
+            self.TestModel.objects.create(title=dict(en="title"))
+
+        assert (
+            self.sink.get(
+                instrumentation.SLUG_RETRY, model=self.TestModel._meta.label
+            )
+            == 3
+        )
+
+    def test_timer(self):
+        """Tests whether timed blocks are reported."""
+
+        with instrumentation.timer(instrumentation.BLEACH, field="title"):
+            pass
+
+        assert self.sink.get(instrumentation.BLEACH, field="title") == 1
+        assert (
+            self.sink.timings[(instrumentation.BLEACH, (("field", "title"),))]
+            >= 0
+        )
@@ -149,6 +149,24 @@ class LocalizedIntegerFieldTestCase(TestCase):
         obj.refresh_from_db()
         assert obj.score.get(settings.LANGUAGE_CODE) is None
 
+    @staticmethod
+    def test_to_python():
+        """Tests whether deserializing, as loaddata and forms do, parses the
+        values in every language."""
+
+        field = LocalizedIntegerField()
+        field.set_attributes_from_name("score")
+
+        value = field.to_python({"en": "5", "ro": 0, "nl": ""})
+        assert isinstance(value, LocalizedIntegerValue)
+        assert value.en == 5
+        assert value.ro == 0
+        assert value.nl is None
+
+        value = field.to_python('{"en": "7", "ro": "haha"}')
+        assert value.en == 7
+        assert value.ro is None
+
     def test_default_value(self):
         """Tests whether a default is properly set when specified."""
 
@@ -208,6 +226,29 @@ class LocalizedIntegerFieldTestCase(TestCase):
 
         assert obj.test["en"] == output["en"]
 
+    def test_default_value_resolved_once(self):
+        """Tests whether the default value is only resolved again when it is
+        callable."""
+
+        calls = []
+
+        def func():
+            calls.append(True)
+            return {"en": 5}
+
+        field = LocalizedIntegerField(default={"en": 5})
+        field.get_prep_value(LocalizedIntegerValue())
+        default_values = field._get_default_values()
+
+        field.get_prep_value(LocalizedIntegerValue())
+        assert field._get_default_values() is default_values
+
+        field = LocalizedIntegerField(default=func)
+        for _ in range(3):
+            assert field.get_prep_value(LocalizedIntegerValue())["en"] == "5"
+
+        assert len(calls) == 3
+
     def test_order_by(self):
         """Tests whether ordering by a :see:LocalizedIntegerField key works
         expected."""
@@ -0,0 +1,231 @@
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.migrations.state import ModelState, ProjectState
+from django.db.utils import IntegrityError
+from django.test import TestCase, override_settings
+from django.utils import translation
+
+from localized_fields.expressions import LocalizedRef
+from localized_fields.fields import (
+    LocalizedBooleanField,
+    LocalizedField,
+    LocalizedFloatField,
+    LocalizedIntegerField,
+)
+from localized_fields.operations import AlterLocalizedFieldStorage
+from localized_fields.value import (
+    LocalizedBooleanValue,
+    LocalizedFloatValue,
+    LocalizedIntegerValue,
+)
+
+from .fake_model import get_fake_model
+
+
+@override_settings(LOCALIZED_FIELDS_EXPERIMENTAL=True)
+class LocalizedJSONBStorageTestCase(TestCase):
+    """Tests whether :see:LocalizedField's can be stored as JSONB."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        # reload app as setting has changed
+        config = apps.get_app_config("localized_fields")
+        config.ready()
+
+        cls.TestModel = get_fake_model(
+            {
+                "title": LocalizedField(storage_type="jsonb"),
+                "score": LocalizedIntegerField(
+                    storage_type="jsonb", null=True, required=False
+                ),
+                "price": LocalizedFloatField(
+                    storage_type="jsonb", null=True, required=False
+                ),
+                "active": LocalizedBooleanField(
+                    storage_type="jsonb", null=True, required=False
+                ),
+            }
+        )
+
+    def _get_json_types(self, obj, column: str) -> dict:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT key, jsonb_typeof(value) FROM %s, jsonb_each(%s) WHERE id = %%s"
+                % (self.TestModel._meta.db_table, column),
+                [obj.pk],
+            )
+            return dict(cursor.fetchall())
+
+    def test_invalid_storage_type(self):
+        """Tests whether specifying an unknown storage type is refused."""
+
+        with self.assertRaises(ImproperlyConfigured):
+            LocalizedField(storage_type="xml")
+
+    def test_deconstruct(self):
+        """Tests whether the storage type survives deconstruction."""
+
+        _, _, _, kwargs = LocalizedField(storage_type="jsonb").deconstruct()
+        assert kwargs["storage_type"] == "jsonb"
+
+        _, _, _, kwargs = LocalizedField().deconstruct()
+        assert "storage_type" not in kwargs
+
+    def test_native_values(self):
+        """Tests whether typed values are stored as native JSON values and
+        languages without a value are not stored at all."""
+
+        obj = self.TestModel.objects.create(
+            title=dict(en="title_en", ro="title_ro"),
+            score=dict(en=1, ro="2"),
+            price=dict(en=1.5),
+            active=dict(en=True, nl="false"),
+        )
+
+        assert self._get_json_types(obj, "title") == dict(
+            en="string", ro="string"
+        )
+        assert self._get_json_types(obj, "score") == dict(
+            en="number", ro="number"
+        )
+        assert self._get_json_types(obj, "price") == dict(en="number")
+        assert self._get_json_types(obj, "active") == dict(
+            en="boolean", nl="boolean"
+        )
+
+        obj = self.TestModel.objects.get(pk=obj.pk)
+        assert obj.title.ro == "title_ro"
+        assert obj.title.nl is None
+
+        assert isinstance(obj.score, LocalizedIntegerValue)
+        assert obj.score.en == 1
+        assert obj.score.ro == 2
+        assert obj.score.nl is None
+
+        assert isinstance(obj.price, LocalizedFloatValue)
+        assert obj.price.en == 1.5
+
+        assert isinstance(obj.active, LocalizedBooleanValue)
+        assert obj.active.en is True
+        assert obj.active.nl is False
+        assert obj.active.ro is None
+
+    def test_required(self):
+        """Tests whether the constraints on required languages still work."""
+
+        with self.assertRaises(IntegrityError):
+            self.TestModel.objects.create(title=dict(ro="title_ro"))
+
+    def test_lookups(self):
+        """Tests whether filtering, ordering and selecting a single language
+        work."""
+
+        for score in [10, 9, 100]:
+            self.TestModel.objects.create(
+                title=dict(en="title_%d" % score, nl="titel_%d" % score),
+                score=dict(en=score),
+            )
+
+        assert self.TestModel.objects.filter(title__en="title_9").exists()
+
+        with translation.override("nl"):
+            assert self.TestModel.objects.filter(title="titel_9").exists()
+            assert self.TestModel.objects.filter(
+                title__translated_ref="titel_9"
+            ).exists()
+
+        assert list(
+            self.TestModel.objects.order_by("score__en").values_list(
+                "score__en", flat=True
+            )
+        ) == [9, 10, 100]
+
+        with translation.override("nl"):
+            titles = self.TestModel.objects.annotate(
+                localized_title=LocalizedRef("title")
+            ).values_list("localized_title", flat=True)
+
+            assert sorted(titles) == ["titel_10", "titel_100", "titel_9"]
+
+
+class AlterLocalizedFieldStorageTestCase(TestCase):
+    """Tests whether the :see:AlterLocalizedFieldStorage migration operation
+    properly converts between hstore and JSONB."""
+
+    def test_convert(self):
+        model = get_fake_model(
+            {
+                "title": LocalizedField(),
+                "score": LocalizedIntegerField(null=True, required=False),
+            }
+        )
+
+        obj = model.objects.create(
+            title=dict(en="title_en", ro=""), score=dict(en=1, ro=2)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE %s SET score = score || hstore('nl', 'haha')"
+                % model._meta.db_table
+            )
+
+        from_state = ProjectState()
+        from_state.add_model(ModelState.from_model(model))
+
+        operations = [
+            AlterLocalizedFieldStorage(
+                model._meta.model_name,
+                "title",
+                LocalizedField(storage_type="jsonb"),
+            ),
+            AlterLocalizedFieldStorage(
+                model._meta.model_name,
+                "score",
+                LocalizedIntegerField(
+                    storage_type="jsonb", null=True, required=False
+                ),
+            ),
+        ]
+
+        states = [from_state]
+        for operation in operations:
+            to_state = states[-1].clone()
+            operation.state_forwards("tests", to_state)
+
+            with connection.schema_editor() as schema_editor:
+                operation.database_forwards(
+                    "tests", schema_editor, states[-1], to_state
+                )
+
+            states.append(to_state)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT title, score FROM %s WHERE id = %%s"
+                % model._meta.db_table,
+                [obj.pk],
+            )
+            title, score = cursor.fetchone()
+
+        # django does not decode jsonb for us
+        assert title == '{"en": "title_en", "ro": ""}'
+        assert score == '{"en": 1, "ro": 2}'
+
+        # convert back to hstore
+        for index, operation in reversed(list(enumerate(operations))):
+            with connection.schema_editor() as schema_editor:
+                operation.database_backwards(
+                    "tests", schema_editor, states[index + 1], states[index]
+                )
+
+        obj.refresh_from_db()
+        assert obj.title.en == "title_en"
+        assert obj.score.en == 1
+        assert obj.score.ro == 2
+        assert obj.score.nl is None
@@ -0,0 +1,156 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.db import connection
+from django.db.migrations.state import ModelState, ProjectState
+from django.test import TestCase
+
+from localized_fields.fields import LocalizedField, LocalizedIntegerField
+
+from .fake_model import get_fake_model
+
+
+class LocalizedLanguageLookupsTestCase(TestCase):
+    """Tests whether the lookups that filter on the languages that have a
+    value work properly."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.TestModel = get_fake_model(
+            {
+                "title": LocalizedField(required=False, blank=True),
+                "text": LocalizedField(
+                    sparse=True, required=False, gin_index=True
+                ),
+                "score": LocalizedIntegerField(
+                    storage_type="jsonb",
+                    null=True,
+                    required=False,
+                    gin_index=True,
+                ),
+            }
+        )
+
+    def setUp(self):
+        self.obj1 = self.TestModel.objects.create(
+            title=dict(en="title", ro="titlu"),
+            text=dict(en="text", ro="text"),
+            score=dict(en=1, ro=2),
+        )
+        self.obj2 = self.TestModel.objects.create(
+            title=dict(en="title", ro="", nl="titel"),
+            text=dict(en="text", nl="tekst"),
+            score=dict(nl=3),
+        )
+
+    def _filter(self, **kwargs):
+        return set(
+            self.TestModel.objects.filter(**kwargs).values_list("pk", flat=True)
+        )
+
+    def test_has_language(self):
+        """Tests whether only rows with a value in the language are found,
+        for sparse and non-sparse fields."""
+
+        assert self._filter(title__has_language="ro") == {self.obj1.pk}
+        assert self._filter(text__has_language="ro") == {self.obj1.pk}
+        assert self._filter(score__has_language="ro") == {self.obj1.pk}
+
+        assert self.TestModel.objects.exclude(text__has_language="nl").get()
+        assert self._filter(text__has_language="fr") == set()
+
+    def test_has_all_languages(self):
+        assert self._filter(title__has_all_languages=["en", "ro"]) == {
+            self.obj1.pk
+        }
+        assert self._filter(text__has_all_languages=["en", "nl"]) == {
+            self.obj2.pk
+        }
+        assert self._filter(score__has_all_languages=["en", "nl"]) == set()
+
+    def _exclude(self, **kwargs):
+        return set(
+            self.TestModel.objects.exclude(**kwargs).values_list(
+                "pk", flat=True
+            )
+        )
+
+    def test_exclude(self):
+        """Tests whether excluding the rows that have a value also finds the
+        rows without the language on fields that are not sparse."""
+
+        assert self._exclude(title__has_language="nl") == {self.obj1.pk}
+        assert self._exclude(title__has_language="ro") == {self.obj2.pk}
+        assert self._exclude(title__has_language="fr") == {
+            self.obj1.pk,
+            self.obj2.pk,
+        }
+        assert self._exclude(score__has_language="en") == {self.obj2.pk}
+
+        assert self._exclude(title__has_all_languages=["en", "nl"]) == {
+            self.obj1.pk
+        }
+        assert self._exclude(score__has_all_languages=["en", "ro"]) == {
+            self.obj2.pk
+        }
+        assert self._exclude(title__has_any_language=["ro", "nl"]) == set()
+
+    def test_has_any_language(self):
+        assert self._filter(title__has_any_language=["ro", "nl"]) == {
+            self.obj1.pk,
+            self.obj2.pk,
+        }
+        assert self._filter(text__has_any_language=["ro", "fr"]) == {
+            self.obj1.pk
+        }
+        assert self._filter(score__has_any_language=["nl"]) == {self.obj2.pk}
+
+    def test_contains_translations(self):
+        assert self._filter(
+            text__contains_translations=dict(en="text", ro="text")
+        ) == {self.obj1.pk}
+        assert self._filter(score__contains_translations=dict(en=1, ro=2)) == {
+            self.obj1.pk
+        }
+        assert self._filter(score__contains_translations=dict(en=2)) == set()
+
+    def test_gin_index(self):
+        """Tests whether the GIN index is added once and used by the
+        lookups."""
+
+        indexes = [
+            index
+            for index in self.TestModel._meta.indexes
+            if isinstance(index, GinIndex)
+        ]
+        assert [index.fields for index in indexes] == [["text"], ["score"]]
+
+        # constructing the model from its state does not add it again
+        state = ModelState.from_model(self.TestModel)
+        assert len(state.options["indexes"]) == 2
+        project_state = ProjectState()
+        project_state.add_model(state)
+        model = project_state.apps.get_model(
+            "tests", self.TestModel._meta.model_name
+        )
+        assert len(model._meta.indexes) == 2
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        for lookup in [
+            dict(text__has_language="nl"),
+            dict(score__has_any_language=["nl", "ro"]),
+            dict(text__contains_translations=dict(en="text")),
+        ]:
+            plan = self.TestModel.objects.filter(**lookup).explain()
+            assert "Bitmap Index Scan" in plan
+
+    def test_deconstruct(self):
+        _, _, _, kwargs = LocalizedField(gin_index=True).deconstruct()
+        assert kwargs["gin_index"] is True
+
+        _, _, _, kwargs = LocalizedField().deconstruct()
+        assert "gin_index" not in kwargs
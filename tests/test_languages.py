@@ -0,0 +1,150 @@
+import pickle
+
+from django.apps import apps
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import translation
+
+from localized_fields.fields import LocalizedField, LocalizedIntegerField
+from localized_fields.forms import LocalizedFieldForm
+from localized_fields.value import LocalizedIntegerValue, LocalizedValue
+
+from .fake_model import get_fake_model
+
+
+@override_settings(LOCALIZED_FIELDS_EXPERIMENTAL=True)
+class LocalizedFieldLanguagesTestCase(TestCase):
+    """Tests whether :see:LocalizedField's that are restricted to a subset of
+    the languages only store and edit those languages."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        # reload app as setting has changed
+        config = apps.get_app_config("localized_fields")
+        config.ready()
+
+        cls.TestModel = get_fake_model(
+            {
+                "title": LocalizedField(languages=["ro", "nl"]),
+                "score": LocalizedIntegerField(
+                    languages=["en", "nl"], null=True, required=False
+                ),
+            }
+        )
+
+    def test_init(self):
+        """Tests whether the primary language and the value class follow the
+        subset of languages."""
+
+        field = LocalizedField(languages=["ro", "nl"])
+        assert field.required == ["ro"]
+        assert field.language_codes == ["ro", "nl"]
+        assert field.language_table == [("ro", "Romanian"), ("nl", "Dutch")]
+        assert field.attr_class.languages == ("ro", "nl")
+
+        field = LocalizedField(languages=["ro", "nl"], required=True)
+        assert field.required == ["ro", "nl"]
+
+        _, _, _, kwargs = field.deconstruct()
+        assert kwargs["languages"] == ["ro", "nl"]
+
+    def test_storage(self):
+        """Tests whether only the languages in the subset are stored and
+        loaded."""
+
+        obj = self.TestModel.objects.create(
+            title=dict(en="title_en", ro="title_ro", nl="title_nl"),
+            score=dict(en=1, nl=2),
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT akeys(title), akeys(score) FROM %s"
+                % self.TestModel._meta.db_table
+            )
+            title_keys, score_keys = cursor.fetchone()
+
+        assert sorted(title_keys) == ["nl", "ro"]
+        assert sorted(score_keys) == ["en", "nl"]
+
+        obj = self.TestModel.objects.get(pk=obj.pk)
+        assert set(obj.title.keys()) == {"ro", "nl"}
+        assert obj.title.nl == "title_nl"
+
+        assert isinstance(obj.score, LocalizedIntegerValue)
+        assert set(obj.score.keys()) == {"en", "nl"}
+        assert obj.score.nl == 2
+
+    def test_value(self):
+        """Tests whether values of a field with a subset of the languages
+        compare and pickle like regular values."""
+
+        value = self.TestModel._meta.get_field("title").attr_class("title_ro")
+        assert value.ro == "title_ro"
+        assert value == LocalizedValue(dict(ro="title_ro"))
+
+        restored = pickle.loads(pickle.dumps(value))
+        assert type(restored) is type(value)
+        assert restored == value
+
+    def test_translate(self):
+        """Tests whether values of a field with a subset of the languages
+        default and fall back to the primary language of the field, the same
+        way the `translated_ref` lookup does."""
+
+        obj = self.TestModel.objects.create(title=dict(ro="title_ro"))
+        obj = self.TestModel.objects.get(pk=obj.pk)
+
+        assert obj.title.get() == "title_ro"
+
+        with translation.override("en"):
+            assert obj.title.translate() == "title_ro"
+            assert str(obj.title) == "title_ro"
+            assert self.TestModel.objects.filter(
+                title__translated_ref=str(obj.title)
+            ).exists()
+
+        with translation.override("nl"):
+            assert obj.title.translate() == "title_ro"
+
+        with override_settings(LOCALIZED_FIELDS_FALLBACKS={"nl": ["en", "ro"]}):
+            with translation.override("nl"):
+                assert str(obj.title) == "title_ro"
+
+    def test_lookups(self):
+        """Tests whether lookups fall back to the primary language of the
+        field if the active language is not part of the subset."""
+
+        self.TestModel.objects.create(title=dict(ro="title_ro", nl="title_nl"))
+
+        with translation.override("nl"):
+            assert self.TestModel.objects.filter(title="title_nl").exists()
+
+        with translation.override("en"):
+            assert self.TestModel.objects.filter(title="title_ro").exists()
+            assert self.TestModel.objects.filter(
+                title__active_ref="title_ro"
+            ).exists()
+            assert self.TestModel.objects.filter(
+                title__translated_ref="title_ro"
+            ).exists()
+
+    def test_form(self):
+        """Tests whether the form field and widget only contain the languages
+        in the subset."""
+
+        form_field = self.TestModel._meta.get_field("title").formfield()
+        assert isinstance(form_field, LocalizedFieldForm)
+        assert [field.label for field in form_field.fields] == ["ro", "nl"]
+        assert [widget.lang_code for widget in form_field.widget.widgets] == [
+            "ro",
+            "nl",
+        ]
+
+        value = form_field.clean(["title_ro", "title_nl"])
+        assert set(value.keys()) == {"ro", "nl"}
+        assert value.nl == "title_nl"
@@ -0,0 +1,65 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from localized_fields.fields import LocalizedField
+from localized_fields.loaders import (
+    LocalizedHStoreLoader,
+    is_psycopg3,
+    parse_hstore,
+    register_loaders,
+)
+from localized_fields.value import LocalizedValue
+
+from .fake_model import get_fake_model
+
+
+class LocalizedHStoreLoaderTestCase(TestCase):
+    """Tests whether hstore values are properly loaded by
+    :see:LocalizedHStoreLoader."""
+
+    def test_parse_hstore(self):
+        """Tests whether the text representation of hstore values is parsed
+        properly, with and without escaped characters."""
+
+        assert parse_hstore("") == {}
+        assert parse_hstore('"en"=>"title", "ro"=>NULL, "nl"=>""') == dict(
+            en="title", ro=None, nl=""
+        )
+        assert parse_hstore('"en"=>"NULL", "ro"=>"a=>b, c"') == dict(
+            en="NULL", ro="a=>b, c"
+        )
+        assert parse_hstore(
+            r'"e\"n"=>"say \"hi\"", "ro"=>"back\\slash", "nl"=>NULL'
+        ) == {'e"n': 'say "hi"', "ro": "back\\slash", "nl": None}
+
+    @skipUnless(is_psycopg3, "the loader is only used with psycopg 3")
+    def test_loader(self):
+        """Tests whether values that were loaded through the loader end up as
+        proper :see:LocalizedValue instances."""
+
+        model = get_fake_model(
+            {"title": LocalizedField(null=True, required=False)}
+        )
+
+        # creating the model re-registers the default loaders
+        register_loaders(connection)
+
+        obj = model.objects.create(
+            title=dict(en='say "hi"', ro="back\\slash", nl=None)
+        )
+        obj = model.objects.get(pk=obj.pk)
+
+        assert isinstance(obj.title, LocalizedValue)
+        assert obj.title.en == 'say "hi"'
+        assert obj.title.ro == "back\\slash"
+        assert obj.title.nl is None
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 'a=>b'::hstore")
+            loader = cursor.cursor.adapters.get_loader(
+                cursor.description[0].type_code, 0
+            )
+            assert loader is LocalizedHStoreLoader
+            assert cursor.fetchone()[0] == dict(a="b")
@@ -4,7 +4,7 @@ from django.test import TestCase, override_settings
 from django.utils import translation
 
 from localized_fields.expressions import LocalizedRef
-from localized_fields.fields import LocalizedField
+from localized_fields.fields import LocalizedField, LocalizedIntegerField
 from localized_fields.value import LocalizedValue
 
 from .fake_model import get_fake_model
@@ -63,6 +63,101 @@ class LocalizedLookupsTestCase(TestCase):
         )
 
 
+@override_settings(LOCALIZED_FIELDS_EXPERIMENTAL=True)
+class LocalizedInLookupTestCase(TestCase):
+    """Tests whether the `in` lookup properly works with lists."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        config = apps.get_app_config("localized_fields")
+        config.ready()
+
+        cls.TestModel = get_fake_model(
+            {
+                "text": LocalizedField(materialize=["ro"]),
+                "score": LocalizedIntegerField(
+                    null=True, required=False, materialize=["ro"]
+                ),
+            }
+        )
+
+    def setUp(self):
+        self.objs = [
+            self.TestModel.objects.create(
+                text=dict(en="text_%d" % index, ro="text_ro_%d" % index),
+                score=dict(en=index, ro=index * 10),
+            )
+            for index in range(3)
+        ]
+
+    def _filter(self, **kwargs):
+        return sorted(
+            self.TestModel.objects.filter(**kwargs).values_list("pk", flat=True)
+        )
+
+    def test_in(self):
+        """Tests whether filtering in the active language, a specific language
+        and a materialized language works with lists."""
+
+        pks = [self.objs[0].pk, self.objs[2].pk]
+
+        with translation.override("en"):
+            assert self._filter(text__in=["text_0", "text_2", None]) == pks
+            assert self._filter(score__in=[0, 2]) == pks
+
+        with translation.override("ro"):
+            assert self._filter(text__in=["text_ro_0", "text_ro_2"]) == pks
+            assert self._filter(score__in=[0, 20]) == pks
+
+        assert self._filter(text__en__in=("text_0", "text_2")) == pks
+        assert self._filter(score__en__in=[0, 2]) == pks
+        assert self._filter(score__ro__in=[0, 20]) == pks
+        assert self._filter(text__en__in=[]) == []
+
+        # sub queries are left alone
+        assert (
+            self._filter(
+                text__en__in=self.TestModel.objects.filter(
+                    pk__in=pks
+                ).values_list("text__en")
+            )
+            == pks
+        )
+
+    def test_in_ref(self):
+        """Tests whether filtering a :see:LocalizedRef annotation, also of a
+        materialized language, works with lists."""
+
+        pks = [self.objs[0].pk, self.objs[2].pk]
+
+        def _filter(lang, values):
+            return sorted(
+                self.TestModel.objects.annotate(t=LocalizedRef("text", lang))
+                .filter(t__in=values)
+                .values_list("pk", flat=True)
+            )
+
+        assert _filter("en", ["text_0", "text_2"]) == pks
+        assert _filter("ro", ["text_ro_0", "text_ro_2"]) == pks
+
+    def test_in_single_parameter(self):
+        """Tests whether a large list of values is sent as a single
+        parameter."""
+
+        values = ["text_%d" % index for index in range(10000)]
+        queryset = self.TestModel.objects.filter(text__en__in=values)
+
+        sql, params = queryset.query.sql_with_params()
+        assert "= ANY(%s::text[])" in sql
+        assert list(params) == ["en", values]
+
+        assert queryset.count() == 3
+
+
 class LocalizedRefLookupsTestCase(TestCase):
     """Tests whether ref lookups properly work with."""
 
@@ -0,0 +1,160 @@
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.migrations.state import ModelState, ProjectState
+from django.test import TestCase, override_settings
+from django.utils import translation
+
+from localized_fields.expressions import LocalizedRef
+from localized_fields.fields import (
+    LocalizedField,
+    LocalizedIntegerField,
+    LocalizedMaterializedField,
+)
+
+from .fake_model import get_fake_model
+
+
+@override_settings(LOCALIZED_FIELDS_EXPERIMENTAL=True)
+class LocalizedMaterializeTestCase(TestCase):
+    """Tests whether materialized languages of :see:LocalizedField's are
+    stored in generated columns and queried through them."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        # reload app as setting has changed
+        config = apps.get_app_config("localized_fields")
+        config.ready()
+
+        cls.TestModel = get_fake_model(
+            {
+                "title": LocalizedField(materialize=["en", "nl"]),
+                "score": LocalizedIntegerField(
+                    materialize=["en"], null=True, required=False
+                ),
+            }
+        )
+
+    def _get_columns(self, obj):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT title_en, title_nl, score_en FROM %s WHERE id = %%s"
+                % self.TestModel._meta.db_table,
+                [obj.pk],
+            )
+            return cursor.fetchone()
+
+    def test_fields(self):
+        """Tests whether a field is added for every materialized language and
+        survives deconstruction and migration states."""
+
+        field = self.TestModel._meta.get_field("title_nl")
+        assert isinstance(field, LocalizedMaterializedField)
+        assert field.source_field is self.TestModel._meta.get_field("title")
+        assert not field.editable
+
+        _, _, _, kwargs = LocalizedField(materialize=["en"]).deconstruct()
+        assert kwargs["materialize"] == ["en"]
+
+        _, _, _, kwargs = field.deconstruct()
+        assert kwargs == dict(source="title", language="nl")
+
+        state = ModelState.from_model(self.TestModel)
+        assert set(state.fields) == {
+            "id",
+            "title",
+            "title_en",
+            "title_nl",
+            "score",
+            "score_en",
+        }
+
+        project_state = ProjectState()
+        project_state.add_model(state)
+
+        model = project_state.apps.get_model(
+            "tests", self.TestModel._meta.model_name
+        )
+        assert [field.name for field in model._meta.fields] == [
+            "id",
+            "title",
+            "score",
+            "title_en",
+            "title_nl",
+            "score_en",
+        ]
+
+    def test_invalid_language(self):
+        """Tests whether materializing an unknown language is refused."""
+
+        with self.assertRaises(ImproperlyConfigured):
+            LocalizedField(materialize=["fr"])
+
+    def test_generated(self):
+        """Tests whether the columns are generated when creating and updating
+        rows."""
+
+        obj = self.TestModel.objects.create(
+            title=dict(en="title_en", nl="title_nl"), score=dict(en="12")
+        )
+        assert self._get_columns(obj) == ("title_en", "title_nl", 12)
+        assert obj.score_en == 12
+
+        obj.title.nl = "titel"
+        obj.score.en = None
+        obj.save()
+        assert self._get_columns(obj) == ("title_en", "titel", None)
+
+        objs = self.TestModel.objects.bulk_create(
+            [self.TestModel(title=dict(en="bulk_%d" % i)) for i in range(2)]
+        )
+        assert self._get_columns(objs[1]) == ("bulk_1", None, None)
+
+        obj = self.TestModel.objects.get(pk=obj.pk)
+        assert obj.title_nl == "titel"
+        assert obj.score_en is None
+
+    def test_lookups(self):
+        """Tests whether lookups and ordering on materialized languages use
+        the generated column."""
+
+        for score in [10, 9, 100]:
+            self.TestModel.objects.create(
+                title=dict(en="title_%d" % score, ro="titlu_%d" % score),
+                score=dict(en=score),
+            )
+
+        queryset = self.TestModel.objects.filter(title__en="title_9")
+        assert '"title_en" =' in str(queryset.query)
+        assert queryset.count() == 1
+
+        queryset = self.TestModel.objects.order_by("score__en")
+        assert '"score_en" ASC' in str(queryset.query)
+        assert list(queryset.values_list("score__en", flat=True)) == [
+            9,
+            10,
+            100,
+        ]
+
+        with translation.override("en"):
+            queryset = self.TestModel.objects.filter(title="title_10")
+            assert '"title_en" =' in str(queryset.query)
+            assert queryset.count() == 1
+
+            queryset = self.TestModel.objects.annotate(
+                localized_title=LocalizedRef("title")
+            )
+            assert '"title_en"' in str(queryset.query)
+            assert sorted(
+                queryset.values_list("localized_title", flat=True)
+            ) == ["title_10", "title_100", "title_9"]
+
+        # languages that are not materialized still use the hstore
+        with translation.override("ro"):
+            queryset = self.TestModel.objects.filter(title="titlu_10")
+            assert "->" in str(queryset.query)
+            assert queryset.count() == 1
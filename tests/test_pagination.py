@@ -0,0 +1,153 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import translation
+
+from localized_fields.fields import LocalizedField
+from localized_fields.indexes import LocalizedCollatedIndex
+from localized_fields.pagination import (
+    InvalidCursor,
+    KeysetAfter,
+    LocalizedKeysetPaginator,
+)
+
+from .fake_model import get_fake_model
+
+
+@override_settings(LOCALIZED_FIELDS_COLLATIONS={"ro": "C"})
+class LocalizedKeysetPaginatorTestCase(TestCase):
+    """Tests whether :see:LocalizedKeysetPaginator pages through all rows in
+    the right order."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.TestModel = get_fake_model(
+            {"title": LocalizedField(required=False, blank=True)},
+            meta_options=dict(
+                indexes=[
+                    LocalizedCollatedIndex(
+                        fields=["title"], language="ro", name="page_title_ro"
+                    )
+                ]
+            ),
+        )
+
+    def setUp(self):
+        titles = ["d", "b", None, "a", "b", None, "c"]
+        self.objs = [
+            self.TestModel.objects.create(title=dict(en="en", ro=title))
+            for title in titles
+        ]
+
+    def _get_all(self, paginator):
+        pages = []
+        cursor = None
+
+        while True:
+            page = paginator.get_page(cursor)
+            pages.append([obj.title.ro for obj in page])
+
+            if not page.has_next():
+                return pages
+
+            cursor = page.next_cursor
+
+    def test_pages(self):
+        """Tests whether the rows are ordered by the value and then the
+        primary key, with the rows without a value last."""
+
+        paginator = LocalizedKeysetPaginator(
+            self.TestModel.objects.all(), "title", per_page=2, language="ro"
+        )
+
+        assert self._get_all(paginator) == [
+            ["a", "b"],
+            ["b", "c"],
+            ["d", None],
+            [None],
+        ]
+
+    def test_same_values(self):
+        """Tests whether rows with the same value are not skipped or
+        repeated."""
+
+        paginator = LocalizedKeysetPaginator(
+            self.TestModel.objects.filter(title__ro="b"), "title", per_page=1
+        )
+
+        with translation.override("ro"):
+            first = paginator.get_page()
+
+        second = paginator.get_page(first.next_cursor)
+
+        assert [first[0].pk, second[0].pk] == [self.objs[1].pk, self.objs[4].pk]
+        assert not second.has_next()
+
+    def test_translated(self):
+        """Tests whether ordering by the translated value falls back."""
+
+        paginator = LocalizedKeysetPaginator(
+            self.TestModel.objects.all(),
+            "title",
+            per_page=10,
+            language="ro",
+            translated=True,
+        )
+
+        page = paginator.get_page()
+        assert [obj.title.translate("ro") for obj in page] == [
+            "a",
+            "b",
+            "b",
+            "c",
+            "d",
+            "en",
+            "en",
+        ]
+
+    def test_cursor_language(self):
+        """Tests whether the cursor keeps the language of the first page."""
+
+        paginator = LocalizedKeysetPaginator(
+            self.TestModel.objects.all(), "title", per_page=3, language="ro"
+        )
+        cursor = paginator.get_page().next_cursor
+
+        with translation.override("en"):
+            page = LocalizedKeysetPaginator(
+                self.TestModel.objects.all(), "title", per_page=3
+            ).get_page(cursor)
+
+        assert page.language == "ro"
+        assert [obj.title.ro for obj in page] == ["c", "d", None]
+
+        with self.assertRaises(InvalidCursor):
+            paginator.get_page("nope")
+
+    def test_index(self):
+        """Tests whether deep pages are selected using the index."""
+
+        paginator = LocalizedKeysetPaginator(
+            self.TestModel.objects.all(), "title", per_page=2, language="ro"
+        )
+        cursor = paginator.get_page().next_cursor
+
+        with connection.cursor() as cursor_:
+            cursor_.execute("SET LOCAL enable_seqscan = off")
+            cursor_.execute("SET LOCAL enable_sort = off")
+
+        language, value, pk = paginator.decode_cursor(cursor)
+        with translation.override("ro"):
+            expression = paginator._get_sort_expression("ro")
+            plan = (
+                self.TestModel.objects.filter(
+                    KeysetAfter(expression, value, pk)
+                )
+                .order_by(expression.asc(), "pk")[:3]
+                .explain()
+            )
+
+        assert "page_title_ro" in plan
@@ -0,0 +1,191 @@
+from django.db import connection, models
+from django.db.migrations.state import ModelState, ProjectState
+from django.test import TransactionTestCase
+
+from localized_fields.fields import LocalizedField, LocalizedIntegerField
+from localized_fields.operations import (
+    PopulateLocalizedField,
+    RemoveLocalizedFieldDualWrite,
+)
+
+from .fake_model import get_fake_model
+
+
+class PopulateLocalizedFieldTestCase(TransactionTestCase):
+    """Tests whether the :see:PopulateLocalizedField migration operation
+    properly fills a localized field from existing columns."""
+
+    TestModel = None
+
+    def setUp(self):
+        self.TestModel = get_fake_model(
+            {
+                "title_en": models.CharField(max_length=255, null=True),
+                "title_ro": models.CharField(max_length=255, null=True),
+                "score_old": models.IntegerField(null=True),
+                "title": LocalizedField(null=True, required=False),
+                "score": LocalizedIntegerField(
+                    storage_type="jsonb", null=True, required=False
+                ),
+            }
+        )
+
+        self.state = ProjectState()
+        self.state.add_model(ModelState.from_model(self.TestModel))
+
+    def tearDown(self):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(self.TestModel)
+
+    def _run(self, operation, backwards: bool = False):
+        with connection.schema_editor(atomic=False) as schema_editor:
+            if backwards:
+                operation.database_backwards(
+                    "tests", schema_editor, self.state, self.state
+                )
+            else:
+                operation.database_forwards(
+                    "tests", schema_editor, self.state, self.state
+                )
+
+    def _create(self, count: int):
+        return [
+            self.TestModel.objects.create(
+                title_en="title_%d" % index,
+                title_ro="titlu_%d" % index if index % 2 else None,
+                score_old=index,
+                title=None,
+                score=None,
+            )
+            for index in range(count)
+        ]
+
+    def test_populate(self):
+        """Tests whether all rows are filled, in batches, and rows that were
+        already filled are left alone."""
+
+        objs = self._create(5)
+
+        self.TestModel.objects.filter(pk=objs[3].pk).update(
+            title=dict(en="filled")
+        )
+
+        self._run(
+            PopulateLocalizedField(
+                self.TestModel._meta.model_name,
+                "title",
+                dict(en="title_en", ro="title_ro"),
+                batch_size=2,
+            )
+        )
+        self._run(
+            PopulateLocalizedField(
+                self.TestModel._meta.model_name,
+                "score",
+                dict(en="score_old"),
+                batch_size=2,
+            )
+        )
+
+        for index, obj in enumerate(objs):
+            obj.refresh_from_db()
+
+            if index == 3:
+                assert obj.title.en == "filled"
+            else:
+                assert obj.title.en == "title_%d" % index
+                assert obj.title.ro == (
+                    "titlu_%d" % index if index % 2 else None
+                )
+
+            assert obj.score.en == index
+
+    def test_dual_write(self):
+        """Tests whether the localized field is kept in sync with the columns
+        until the dual write is removed."""
+
+        columns = dict(en="title_en", ro="title_ro")
+        model_name = self.TestModel._meta.model_name
+
+        self._run(
+            PopulateLocalizedField(
+                model_name, "title", columns, dual_write=True
+            )
+        )
+
+        obj = self._create(1)[0]
+        obj.refresh_from_db()
+        assert obj.title.en == "title_0"
+
+        self.TestModel.objects.filter(pk=obj.pk).update(title_ro="titlu")
+        obj.refresh_from_db()
+        assert obj.title.ro == "titlu"
+
+        self._run(RemoveLocalizedFieldDualWrite(model_name, "title", columns))
+
+        self.TestModel.objects.filter(pk=obj.pk).update(title_ro="other")
+        obj.refresh_from_db()
+        assert obj.title.ro == "titlu"
+
+        # reverting re-creates the trigger
+        self._run(
+            RemoveLocalizedFieldDualWrite(model_name, "title", columns),
+            backwards=True,
+        )
+
+        self.TestModel.objects.filter(pk=obj.pk).update(title_ro="again")
+        obj.refresh_from_db()
+        assert obj.title.ro == "again"
+
+    def test_dual_write_localized_only(self):
+        """Tests whether writing only the localized field, as new code does,
+        is not overwritten by the columns that are not written."""
+
+        model_name = self.TestModel._meta.model_name
+
+        self._run(
+            PopulateLocalizedField(
+                model_name,
+                "title",
+                dict(en="title_en", ro="title_ro"),
+                dual_write=True,
+            )
+        )
+        self._run(
+            PopulateLocalizedField(
+                model_name, "score", dict(en="score_old"), dual_write=True
+            )
+        )
+
+        obj = self.TestModel.objects.create(
+            title=dict(en="x", ro="y"), score=dict(en=1)
+        )
+        obj.refresh_from_db()
+
+        assert obj.title.en == "x"
+        assert obj.title.ro == "y"
+        assert obj.score.en == 1
+
+        # saving again writes the unchanged columns as well
+        obj.title = dict(en="z", ro="y")
+        obj.score = dict(en=2)
+        obj.save()
+        obj.refresh_from_db()
+
+        assert obj.title.en == "z"
+        assert obj.score.en == 2
+
+        # changing a column still syncs it
+        self.TestModel.objects.filter(pk=obj.pk).update(
+            title_ro="titlu", score_old=3
+        )
+        obj.refresh_from_db()
+
+        assert obj.title.en == "z"
+        assert obj.title.ro == "titlu"
+        assert obj.score.en == 3
+
+        self.TestModel.objects.filter(pk=obj.pk).update(score_old=None)
+        obj.refresh_from_db()
+
+        assert obj.score.en is None
@@ -0,0 +1,109 @@
+import io
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from localized_fields.fields import LocalizedCharField, LocalizedField
+from localized_fields.value import LocalizedValue
+
+from .fake_model import get_fake_model
+
+
+class LocalizedSparseFieldTestCase(TestCase):
+    """Tests whether sparse :see:LocalizedField's only store the languages
+    that have a value."""
+
+    TestModel = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.TestModel = get_fake_model(
+            {
+                "text": LocalizedField(sparse=True),
+                "title": LocalizedCharField(sparse=True, required=["ro"]),
+            }
+        )
+
+    def _get_stored_keys(self, obj, column: str) -> list:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT akeys(%s) FROM %s WHERE id = %%s"
+                % (column, self.TestModel._meta.db_table),
+                [obj.pk],
+            )
+            return sorted(cursor.fetchone()[0])
+
+    def test_empty_languages_not_stored(self):
+        """Tests whether languages without a value are not stored, except when
+        they are required."""
+
+        obj = self.TestModel.objects.create(
+            text=LocalizedValue(dict(en="text_en", nl="")),
+            title=dict(en="title_en", ro="title_ro"),
+        )
+
+        assert self._get_stored_keys(obj, "text") == ["en"]
+        assert self._get_stored_keys(obj, "title") == ["en", "ro"]
+
+        obj = self.TestModel.objects.create(text="text_en", title=dict(ro=""))
+        assert self._get_stored_keys(obj, "title") == ["ro"]
+
+    def test_missing_languages_are_defaults(self):
+        """Tests whether languages that were not stored are read back as the
+        default value."""
+
+        obj = self.TestModel.objects.create(
+            text=dict(en="text_en"), title=dict(ro="title_ro")
+        )
+        obj = self.TestModel.objects.get(pk=obj.pk)
+
+        for lang_code, _ in settings.LANGUAGES:
+            if lang_code != "en":
+                assert obj.text.get(lang_code) is None
+
+            if lang_code != "ro":
+                assert obj.title.get(lang_code) == ""
+
+        assert obj.text.en == "text_en"
+        assert obj.title.ro == "title_ro"
+
+    def test_deconstruct(self):
+        """Tests whether the sparse option survives deconstruction."""
+
+        _, _, _, kwargs = LocalizedField(sparse=True).deconstruct()
+        assert kwargs["sparse"] is True
+
+        _, _, _, kwargs = LocalizedField().deconstruct()
+        assert "sparse" not in kwargs
+
+    def test_compact_command(self):
+        """Tests whether the management command removes empty languages from
+        rows that were stored before the field was sparse."""
+
+        objs = [
+            self.TestModel.objects.create(text="text_%d" % index, title="")
+            for index in range(5)
+        ]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE %s SET text = text || hstore(ARRAY['ro', 'nl'], ARRAY['', NULL]), title = title || hstore('nl', '')"
+                % self.TestModel._meta.db_table
+            )
+
+        assert self._get_stored_keys(objs[0], "text") == ["en", "nl", "ro"]
+
+        call_command(
+            "compact_localized_fields",
+            self.TestModel._meta.label,
+            batch_size=2,
+            stdout=io.StringIO(),
+        )
+
+        for obj in objs:
+            assert self._get_stored_keys(obj, "text") == ["en"]
+            assert self._get_stored_keys(obj, "title") == ["ro"]
@@ -3,7 +3,12 @@ from django.db.models import F
 from django.test import TestCase, override_settings
 from django.utils import translation
 
-from localized_fields.value import LocalizedValue
+from localized_fields.value import (
+    LocalizedBooleanValue,
+    LocalizedFloatValue,
+    LocalizedIntegerValue,
+    LocalizedValue,
+)
 
 from .data import get_init_values
 
@@ -222,3 +227,89 @@ class LocalizedValueTestCase(TestCase):
 
         value = LocalizedValue(dict(en=F("other")))
         assert isinstance(value.en, F)
+
+
+class LocalizedTypedValueTestCase(TestCase):
+    """Tests whether the typed values are parsed once, when they are set."""
+
+    @staticmethod
+    def test_parse_integer():
+        value = LocalizedIntegerValue(dict(en="12", ro=" 13 ", nl="haha"))
+
+        assert value.en == 12
+        assert value.ro == 13
+        assert value.nl == "haha"
+
+        value.set("nl", "14")
+        assert value.nl == 14
+
+        with translation.override("ro"):
+            assert value.translate() == 13
+            assert int(value) == 13
+            assert str(value) == "13"
+
+    @staticmethod
+    def test_parse_float():
+        value = LocalizedFloatValue(dict(en="1.5", ro=2))
+
+        assert value.en == 1.5
+
+        with translation.override("ro"):
+            assert value.translate() == 2.0
+            assert isinstance(value.translate(), float)
+            assert float(value) == 2.0
+
+    @staticmethod
+    def test_parse_boolean():
+        value = LocalizedBooleanValue(dict(en="TRUE", ro="true", nl="haha"))
+
+        assert value.en is True
+        assert value.ro is True
+        assert value.nl == "haha"
+
+        with translation.override("ro"):
+            assert value.translate() is True
+            assert bool(value)
+            assert str(value) == "True"
+
+    @staticmethod
+    def test_translate_falsy():
+        """Tests whether zero and false are values in a language and don't
+        fall back to another language."""
+
+        integer_value = LocalizedIntegerValue(dict(en="5", ro="0"))
+        float_value = LocalizedFloatValue(dict(en="1.5", ro="0.0"))
+        boolean_value = LocalizedBooleanValue(dict(en="true", ro="false"))
+
+        with translation.override("ro"):
+            assert integer_value.translate() == 0
+            assert int(integer_value) == 0
+            assert str(integer_value) == "0"
+
+            assert float_value.translate() == 0.0
+            assert float(float_value) == 0.0
+
+            assert boolean_value.translate() is False
+            assert not bool(boolean_value)
+            assert str(boolean_value) == "False"
+
+        assert LocalizedIntegerValue(dict(en="0")).translate() == 0
+        assert int(LocalizedIntegerValue(dict(en=0))) == 0
+        assert LocalizedBooleanValue(dict(en=False)).translate() is False
+
+        with translation.override("ro"):
+            assert LocalizedIntegerValue(dict(en="5", ro="")).translate() == 5
+
+    @staticmethod
+    def test_parse_unparsed():
+        """Tests whether values that were put in without being parsed are
+        still parsed when translating."""
+
+        value = LocalizedIntegerValue.from_db(dict(en="12", ro=""))
+
+        assert value.translate() == 12
+
+        with translation.override("ro"), override_settings(
+            LOCALIZED_FIELDS_FALLBACKS={"ro": []}
+        ):
+            assert value.translate() is None
@@ -1,10 +1,19 @@
+import copy
 import re
 
 from django.conf import settings
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from localized_fields.value import LocalizedValue
-from localized_fields.widgets import LocalizedFieldWidget
+from localized_fields.widgets import (
+    AdminLocalizedBooleanFieldWidget,
+    AdminLocalizedCharFieldWidget,
+    AdminLocalizedFieldWidget,
+    AdminLocalizedIntegerFieldWidget,
+    LocalizedCharFieldWidget,
+    LocalizedFieldWidget,
+    LocalizedFileWidget,
+)
 
 
 class LocalizedFieldWidgetTestCase(TestCase):
@@ -83,3 +92,82 @@ class LocalizedFieldWidgetTestCase(TestCase):
         widget = LocalizedFieldWidget()
         output = widget.render(name="title", value=None)
         assert bool(re.search(r"<label (.|\n|\t)*>\w+<\/label>", output))
+
+    @staticmethod
+    def test_render_lightweight():
+        """Tests whether rendering the inner widgets without the template
+        engine renders the same as rendering them through their templates."""
+
+        value = LocalizedValue(dict(en='<b>"quoted" & co</b>', ro="", nl="42"))
+
+        for widget_class in [
+            LocalizedFieldWidget,
+            LocalizedCharFieldWidget,
+            LocalizedFileWidget,
+            AdminLocalizedFieldWidget,
+            AdminLocalizedCharFieldWidget,
+            AdminLocalizedIntegerFieldWidget,
+            AdminLocalizedBooleanFieldWidget,
+        ]:
+            widget = widget_class(attrs={"data-x": "<y>", "disabled": True})
+            widget.widgets[0].is_required = True
+
+            for render_value in [value, None]:
+                for attrs in [{"id": "id_title", "required": True}, None]:
+                    expected = widget.render("title", render_value, attrs)
+
+                    with override_settings(
+                        LOCALIZED_FIELDS_LIGHTWEIGHT_WIDGETS=True
+                    ):
+                        output = widget.render("title", render_value, attrs)
+
+                    assert output == expected
+
+    @staticmethod
+    def test_get_context_cached_attrs():
+        """Tests whether the attributes of the inner widgets are built once,
+        while 'required' still depends on the value of every render."""
+
+        widget = LocalizedFieldWidget(attrs={"class": "x"})
+        for inner_widget in widget.widgets:
+            inner_widget.is_required = True
+
+        attrs = {"id": "id_title", "required": True}
+        widget.get_context("title", None, attrs)
+        cached_attrs = widget._subwidget_attrs
+
+        context = widget.get_context("title", None, attrs)
+        assert widget._subwidget_attrs is cached_attrs
+        for i, subwidget in enumerate(context["widget"]["subwidgets"]):
+            assert subwidget["attrs"]["id"] == "id_title_%s" % i
+            assert subwidget["attrs"]["class"] == "x"
+            assert subwidget["attrs"]["required"]
+
+        widget.widgets[0].is_required = False
+        context = widget.get_context("title", None, attrs)
+        assert "required" not in context["widget"]["subwidgets"][0]["attrs"]
+        assert context["widget"]["subwidgets"][1]["attrs"]["required"]
+
+        context = widget.get_context("title", None, {"id": "id_other"})
+        assert widget._subwidget_attrs is not cached_attrs
+        for subwidget in context["widget"]["subwidgets"]:
+            assert subwidget["attrs"]["id"].startswith("id_other_")
+            assert "required" not in subwidget["attrs"]
+
+        assert copy.deepcopy(widget)._subwidget_attrs is None
+
+    @staticmethod
+    def test_get_context_lightweight():
+        """Tests whether only the inner widgets that render plain inputs are
+        rendered without the template engine."""
+
+        with override_settings(LOCALIZED_FIELDS_LIGHTWEIGHT_WIDGETS=True):
+            context = LocalizedFieldWidget().get_context("title", None, {})
+            for subwidget in context["widget"]["subwidgets"]:
+                assert subwidget["html"].startswith("<textarea")
+
+            context = AdminLocalizedBooleanFieldWidget().get_context(
+                "title", None, {}
+            )
+            for subwidget in context["widget"]["subwidgets"]:
+                assert "html" not in subwidget